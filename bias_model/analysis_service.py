@@ -4,9 +4,15 @@
 import pandas as pd
 import numpy as np
 from numpy.linalg import norm
+from scipy.sparse import csr_matrix
 from ckonlpy.tag import Twitter
 from gensim.models import Word2Vec
+from token_cache import NounCache, dictionary_version
+from fast_tokenizer import VocabTokenizer
+from keyword_matcher import build_matcher
 import os
+import json
+import hashlib
 
 # ==========================================
 # [수정] 파일 경로 동적 설정 (폴더 구조 변경 반영)
@@ -18,19 +24,144 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 # models 폴더 안의 모델 파일 경로
 MODEL_PATH = os.path.join(BASE_DIR, 'models', 'algoriverse.model')
 
+# 배포용 벡터 폴더 (scripts/export_vectors.py로 생성, mmap으로 여러 프로세스가 공유)
+VECTORS_DIR = os.path.join(BASE_DIR, 'models', 'algoriverse_vectors')
+
 # data 폴더 안의 CSV 파일 경로
 CONF_PATH = os.path.join(BASE_DIR, 'data', 'bias_data_final.csv')
 
+# 사전/기준점 미리 계산 결과 (scripts/build_analyzer_artifact.py로 생성, CSV나 모델이 바뀌면 자동 재생성)
+ARTIFACT_PATH = os.path.join(BASE_DIR, 'models', 'analyzer_artifact.npz')
+ARTIFACT_VERSION = 1
+
+# 명사 추출 결과 디스크 캐시 (bot.py와 scripts가 같이 사용, None이면 메모리 캐시만 사용)
+TOKEN_CACHE_PATH = os.path.join(BASE_DIR, 'cache', 'nouns.sqlite')
+
+def file_sha256(path):
+    """파일 내용의 sha256 (CSV 같은 작은 파일용)"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def model_content_hash(model_path=MODEL_PATH):
+    """모델 파일 "내용"의 지문 (sha256 앞 16자리, 점수 도장 score_model_hash로 DB에 저장됨)"""
+    return file_sha256(model_path)[:16]
+
+def _model_stat(model_path):
+    st = os.stat(model_path)
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+def _read_meta(vectors_dir):
+    meta_path = os.path.join(vectors_dir, 'meta.json')
+    if not os.path.exists(meta_path):
+        return None
+    with open(meta_path, encoding='utf-8') as f:
+        return json.load(f)
+
+def _write_meta(vectors_dir, meta):
+    meta_path = os.path.join(vectors_dir, 'meta.json')
+    try:
+        with open(meta_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(meta_path + '.tmp', meta_path)
+    except OSError as e:
+        print(f"⚠️ {meta_path} 갱신 실패 (다음 실행 때 모델 내용을 다시 확인합니다): {e}")
+
+_content_hashes = {}   # (모델 경로, 크기:수정시각) -> 내용 지문 (한 프로세스에서 여러 번 읽지 않도록)
+
+def model_fingerprint(model_path=MODEL_PATH, vectors_dir=VECTORS_DIR):
+    """
+    모델 지문 = 모델 파일 "내용"의 해시 (다른 서버로 복사하거나 touch해도 바뀌지 않음)
+    - 벡터를 내보낼 때(export_vectors) 한 번 계산해서 meta.json에 기록, 시작할 때는 그 값을 읽음
+    - 원본 모델의 크기/수정시각이 기록과 다르면 그때만 내용을 다시 해시해서 확인
+      (내용이 같으면 meta.json의 크기/수정시각만 고치고 지문은 그대로 → DB 재분석 없음)
+    - 원본 모델 없이 배포용 벡터만 있으면 meta.json의 지문을 사용
+    """
+    meta = _read_meta(vectors_dir)
+    if not os.path.exists(model_path):
+        return meta.get('model_sha256') if meta else None
+
+    stat = _model_stat(model_path)
+    if meta and meta.get('model_sha256') and meta.get('source_stat') == stat:
+        return meta['model_sha256']
+
+    key = (model_path, stat)
+    if key not in _content_hashes:
+        print("🔎 모델 파일 내용 확인 중 (sha256)...")
+        _content_hashes[key] = model_content_hash(model_path)
+    content = _content_hashes[key]
+
+    if meta is not None:
+        # 예전 meta.json(크기+수정시각 지문만 있음)이 지금 모델과 같은 파일에서 나왔으면 내용 지문으로 바꿔둠
+        legacy = hashlib.sha256(stat.encode()).hexdigest()[:16]
+        if meta.get('model_sha256') == content or (not meta.get('model_sha256') and meta.get('source_fingerprint') == legacy):
+            meta.update(model_sha256=content, source_stat=stat)
+            meta.pop('source_fingerprint', None)
+            _write_meta(vectors_dir, meta)
+    return content
+
+def _normalize_rows(vectors):
+    """(단위벡터 행렬, 행별 길이)를 float32로 반환"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = norm(vectors, axis=1).astype(np.float32)
+    safe_norms = np.where(norms > 0, norms, 1.0).astype(np.float32)
+    return np.ascontiguousarray(vectors / safe_norms[:, None]), norms
+
+def export_vectors(model_path=MODEL_PATH, out_dir=VECTORS_DIR):
+    """
+    Word2Vec 모델에서 분석에 필요한 단어 벡터만 .npy로 내보내는 함수
+    (학습용 syn1neg 가중치 등은 버림 -> BiasAnalyzer가 mmap으로 바로 올림)
+    """
+    model = Word2Vec.load(model_path)
+    unit_vectors, vector_norms = _normalize_rows(model.wv.vectors)
+
+    os.makedirs(out_dir, exist_ok=True)
+    np.save(os.path.join(out_dir, 'unit_vectors.npy'), unit_vectors)
+    np.save(os.path.join(out_dir, 'vector_norms.npy'), vector_norms)
+    with open(os.path.join(out_dir, 'vocab.json'), 'w', encoding='utf-8') as f:
+        json.dump(model.wv.index_to_key, f, ensure_ascii=False)
+    # 모델 내용 지문은 여기서 한 번만 계산 (시작할 때는 meta.json에서 읽음)
+    _write_meta(out_dir, {'model_sha256': model_content_hash(model_path),
+                          'source_stat': _model_stat(model_path),
+                          'vector_size': int(unit_vectors.shape[1]),
+                          'vocab_size': int(unit_vectors.shape[0])})
+    return out_dir
+
+def _vectors_up_to_date(vectors_dir=VECTORS_DIR, model_path=MODEL_PATH):
+    """내보낸 벡터가 있고, 지금 원본 모델과 같은 내용에서 나왔는지 확인"""
+    if _read_meta(vectors_dir) is None:
+        return False
+    if not os.path.exists(model_path):
+        return True  # 배포 서버에는 원본 모델 없이 벡터만 둘 수 있음
+    fingerprint = model_fingerprint(model_path, vectors_dir)   # (예전 meta.json이면 여기서 갱신됨)
+    return _read_meta(vectors_dir).get('model_sha256') == fingerprint
+
 class BiasAnalyzer:
-    def __init__(self):
+    def __init__(self, use_mmap=True, use_artifact=True, token_cache_path=TOKEN_CACHE_PATH, tokenizer='okt'):
+        """
+        - tokenizer: 'okt'  = ckonlpy Twitter 형태소 분석기 (기본, JVM 사용)
+                     'vocab' = 모델 어휘 최장일치 토크나이저 (JVM 없이 동작, 훨씬 빠름)
+        """
+        if tokenizer not in ('okt', 'vocab'):
+            raise ValueError(f"지원하지 않는 tokenizer입니다: {tokenizer}")
         print("🤖 AI 모델 로딩 중... (잠시만 기다려주세요)")
         
-        # 1. 모델 파일 존재 확인
-        if not os.path.exists(MODEL_PATH):
-            raise FileNotFoundError(f"❌ 모델 파일을 찾을 수 없습니다.\n예상 경로: {MODEL_PATH}")
-            
-        # 2. Word2Vec 모델 로드
-        self.model = Word2Vec.load(MODEL_PATH)
+        # 1~2. 단어 벡터 로드
+        # 내보낸 벡터(.npy)가 있으면 mmap으로 읽기 전용 로드 -> 여러 프로세스가 페이지 캐시 1벌을 공유
+        # (학습용 syn1neg 가중치 등은 분석에 필요 없으므로 어느 쪽이든 들고 있지 않음)
+        if use_mmap and _vectors_up_to_date():
+            self._load_vectors(VECTORS_DIR)
+        else:
+            if not os.path.exists(MODEL_PATH):
+                raise FileNotFoundError(f"❌ 모델 파일을 찾을 수 없습니다.\n예상 경로: {MODEL_PATH}")
+            if use_mmap:
+                print("⚠️ 배포용 벡터가 없거나 오래됐습니다. (scripts/export_vectors.py 실행 권장)")
+            model = Word2Vec.load(MODEL_PATH)
+            self._build_lookup(model.wv.index_to_key, model.wv.vectors)
+            del model
+        self.model_hash = model_fingerprint()
         
         # 3. 설정 파일(CSV) 로드
         if not os.path.exists(CONF_PATH):
@@ -40,49 +171,232 @@ class BiasAnalyzer:
             self.df_conf = pd.read_csv(CONF_PATH)
         except:
             self.df_conf = pd.read_csv(CONF_PATH, encoding='cp949')
+        self.conf_hash = file_sha256(CONF_PATH)
+        # 키워드/반대어를 기사 한 번 훑기로 찾는 매처 (update_db_scores 등에서 사용)
+        self.keyword_matcher = build_matcher(df_conf=self.df_conf)
             
-        # 4. 형태소 분석기(Twitter) & 사용자 사전 구축
-        self.twitter = Twitter()
+        # 4. 형태소 분석기(Twitter 또는 어휘 토크나이저) & 사용자 사전 구축
+        self.tokenizer_name = tokenizer
+        if tokenizer == 'okt':
+            self.twitter = Twitter()
+            self._raw_nouns = self.twitter.nouns
+        else:
+            self.twitter = None  # JVM을 띄우지 않음
+            self._raw_nouns = VocabTokenizer(self.token_to_row, self._user_words()).nouns
         self.antonym_vec_map = {}
         
-        self._initialize_dictionary()
+        # 미리 만들어둔 결과물이 있으면 그대로 로드, 없거나 입력이 바뀌었으면 새로 계산 후 저장
+        # (어휘 토크나이저도 Okt로 만든 결과물이 있으면 그대로 씀 -> 기준점이 Okt와 같아짐)
+        loaded = False
+        if use_artifact:
+            for backend in dict.fromkeys(['okt', tokenizer]):
+                if self._load_artifact(self._artifact_path(backend), backend):
+                    loaded = True
+                    break
+        if not loaded:
+            self._initialize_dictionary()
+            if use_artifact:
+                self.save_artifact()
+
+        # 5. 명사 추출 캐시 (사용자 사전이 바뀌면 버전이 달라져서 자동으로 새로 분석)
+        # 어휘 토크나이저는 캐시 조회보다 직접 자르는 게 빠르므로 캐시를 쓰지 않음
+        self.noun_cache = None
+        if tokenizer == 'okt':
+            self.noun_cache = NounCache(self._raw_nouns, dictionary_version(self.user_words),
+                                        db_path=token_cache_path)
         print("✅ AI 분석 준비 완료!")
 
+    def nouns(self, text):
+        """기사 텍스트 명사 추출 (Okt는 캐시 사용)"""
+        if self.noun_cache is None:
+            return self._raw_nouns(text)
+        return self.noun_cache.nouns(text)
+
+    def _build_lookup(self, keys, vectors):
+        """
+        단어 -> 행 번호 dict와 단위벡터(길이 1) 행렬을 미리 만들어 두는 내부 함수
+        (KeyedVectors의 `in` / `[]` 호출과 매번 하던 norm() 계산을 없애기 위함)
+        """
+        unit_vectors, vector_norms = _normalize_rows(vectors)
+        self._set_vectors(keys, unit_vectors, vector_norms)
+
+    def _load_vectors(self, vectors_dir):
+        """export_vectors로 내보낸 벡터를 mmap(읽기 전용)으로 로드"""
+        with open(os.path.join(vectors_dir, 'vocab.json'), encoding='utf-8') as f:
+            keys = json.load(f)
+        unit_vectors = np.load(os.path.join(vectors_dir, 'unit_vectors.npy'), mmap_mode='r')
+        vector_norms = np.load(os.path.join(vectors_dir, 'vector_norms.npy'), mmap_mode='r')
+        self._set_vectors(keys, unit_vectors, vector_norms)
+
+    def _set_vectors(self, keys, unit_vectors, vector_norms):
+        self.index_to_key = list(keys)
+        self.token_to_row = {key: i for i, key in enumerate(self.index_to_key)}
+        self.unit_vectors = unit_vectors
+        self.vector_norms = vector_norms
+
+        # 정규화된 기준점 캐시 (키워드 / 반대어 / 검색어 구문)
+        self.keyword_unit_map = {}
+        self.antonym_unit_map = {}
+        self.phrase_unit_cache = {}
+
+    @staticmethod
+    def _unit(vec):
+        """벡터를 길이 1로 정규화 (영벡터는 그대로)"""
+        length = norm(vec)
+        return (vec / length).astype(np.float32) if length > 0 else np.asarray(vec, dtype=np.float32)
+
+    def token_rows(self, tokens, min_len=2):
+        """모델에 있는 단어만 골라 행 번호 리스트로 변환 (기본: 1글자 단어 제외)"""
+        lookup = self.token_to_row
+        return [lookup[t] for t in tokens if len(t) >= min_len and t in lookup]
+
+    def article_vector(self, rows):
+        """행 번호들의 (원래 크기) 평균 벡터. 단위벡터 x 길이로 복원해서 평균냄"""
+        return (self.vector_norms[rows] @ self.unit_vectors[rows]) / len(rows)
+
+    def vector_of(self, word):
+        """단어의 원래 벡터 (model.wv[word]와 같은 값)"""
+        row = self.token_to_row[word]
+        return self.unit_vectors[row] * self.vector_norms[row]
+
+    def phrase_unit_vector(self, phrase):
+        """
+        검색어(구문)의 정규화된 기준점 벡터
+        모델에 통째로 있으면 그 단어, 없으면 형태소 분석 후 평균 (결과는 캐시)
+        """
+        if phrase in self.keyword_unit_map:
+            return self.keyword_unit_map[phrase]
+        if phrase in self.phrase_unit_cache:
+            return self.phrase_unit_cache[phrase]
+
+        if phrase in self.token_to_row:
+            vec = self.unit_vectors[self.token_to_row[phrase]]
+        else:
+            rows = self.token_rows(self._raw_nouns(phrase), min_len=1)
+            vec = self._unit(self.article_vector(rows)) if rows else None
+        self.phrase_unit_cache[phrase] = vec
+        return vec
+
+    @staticmethod
+    def cosine_pair(article_vec, my_unit, oppo_unit):
+        """기사 벡터와 (키워드, 반대어) 단위벡터의 코사인 유사도 쌍"""
+        length = norm(article_vec)
+        return float(np.dot(article_vec, my_unit) / length), float(np.dot(article_vec, oppo_unit) / length)
+
+    def _user_words(self):
+        """사용자 사전에 등록할 단어 목록 (키워드 + 반대어, 중복 제거)"""
+        new_words = self.df_conf['keyword'].tolist()
+        for ants in self.df_conf['antonym'].dropna():
+            new_words.extend([a.strip() for a in str(ants).split(',')])
+        return sorted(set(new_words))
+
+    def _register_user_words(self):
+        """Twitter 사용자 사전에 키워드/반대어 등록 (어휘 토크나이저는 생성할 때 이미 포함)"""
+        if self.twitter is None:
+            return
+        for word in self.user_words:
+            self.twitter.add_dictionary(word, 'Noun')
+
     def _initialize_dictionary(self):
         """키워드 사전을 등록하고 반대어 벡터를 미리 계산하는 내부 함수"""
         
         # (1) 키워드와 반대어를 사전에 강제 등록 (쪼개짐 방지)
-        new_words = self.df_conf['keyword'].tolist()
-        for _, row in self.df_conf.iterrows():
-            if pd.notna(row['antonym']):
-                ants = str(row['antonym']).split(',')
-                new_words.extend([a.strip() for a in ants])
-        
-        # 중복 제거 후 등록
-        for word in set(new_words):
-            self.twitter.add_dictionary(word, 'Noun')
+        self.user_words = self._user_words()
+        self._register_user_words()
 
         # (2) 반대어 벡터(기준점) 미리 계산
-        for _, row in self.df_conf.iterrows():
-            target = row['keyword']
-            if pd.notna(row['antonym']):
-                raw_ants = [a.strip() for a in str(row['antonym']).split(',')]
+        for target, antonyms in zip(self.df_conf['keyword'], self.df_conf['antonym']):
+            if target in self.token_to_row:
+                self.keyword_unit_map[target] = self.unit_vectors[self.token_to_row[target]]
+
+            if pd.notna(antonyms):
+                raw_ants = [a.strip() for a in str(antonyms).split(',')]
                 valid_vecs = []
                 
                 for ant in raw_ants:
                     # 모델에 통째로 있으면 사용
-                    if ant in self.model.wv:
-                        valid_vecs.append(self.model.wv[ant])
+                    if ant in self.token_to_row:
+                        valid_vecs.append(self.vector_of(ant))
                     else:
                         # 없으면 형태소 분석 후 평균값 사용
-                        tokens = self.twitter.nouns(ant)
-                        sub_vecs = [self.model.wv[t] for t in tokens if t in self.model.wv]
-                        if sub_vecs:
-                            valid_vecs.append(np.mean(sub_vecs, axis=0))
+                        rows = self.token_rows(self._raw_nouns(ant), min_len=1)
+                        if rows:
+                            valid_vecs.append(self.article_vector(rows))
                 
                 # 유효한 반대어 벡터들의 평균을 저장
                 if valid_vecs:
                     self.antonym_vec_map[target] = np.mean(valid_vecs, axis=0)
+                    self.antonym_unit_map[target] = self._unit(self.antonym_vec_map[target])
+
+        # (3) 검색어(키워드 구문) 기준점도 미리 계산 (bot의 스마트 분석용)
+        for target in self.df_conf['keyword']:
+            self.phrase_unit_vector(target)
+
+    def artifact_key(self, backend=None):
+        """결과물 버전 키 = 포맷 버전 + 토크나이저 + CSV 해시 + 모델 지문"""
+        backend = backend or self.tokenizer_name
+        return f"v{ARTIFACT_VERSION}:{backend}:{self.conf_hash}:{self.model_hash}"
+
+    @staticmethod
+    def _artifact_path(backend):
+        """토크나이저별 결과물 경로 (Okt는 기본 경로)"""
+        if backend == 'okt':
+            return ARTIFACT_PATH
+        return ARTIFACT_PATH.replace('.npz', f'_{backend}.npz')
+
+    def save_artifact(self, path=None):
+        """사용자 사전 단어 / 반대어 기준점 / 키워드 구문 벡터를 하나의 .npz로 저장"""
+        path = path or self._artifact_path(self.tokenizer_name)
+        antonym_keys = list(self.antonym_vec_map)
+        phrase_keys = [k for k, v in self.phrase_unit_cache.items() if v is not None]
+        dim = self.unit_vectors.shape[1]
+        meta = {
+            'key': self.artifact_key(),
+            'user_words': self.user_words,
+            'antonym_keys': antonym_keys,
+            'phrase_keys': phrase_keys,
+            'phrase_missing': [k for k, v in self.phrase_unit_cache.items() if v is None],
+        }
+        antonym_vecs = np.array([self.antonym_vec_map[k] for k in antonym_keys], dtype=np.float32).reshape(-1, dim)
+        phrase_vecs = np.array([self.phrase_unit_cache[k] for k in phrase_keys], dtype=np.float32).reshape(-1, dim)
+
+        # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓰고 교체
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + f".{os.getpid()}.tmp.npz"
+        np.savez(tmp_path, meta=np.array(json.dumps(meta, ensure_ascii=False)),
+                 antonym_vecs=antonym_vecs, phrase_vecs=phrase_vecs)
+        os.replace(tmp_path, path)
+
+    def _load_artifact(self, path, backend):
+        """저장된 결과물의 키가 현재 CSV/모델과 같으면 로드 (성공 여부 반환)"""
+        if not os.path.exists(path):
+            return False
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(str(data['meta']))
+                if meta.get('key') != self.artifact_key(backend):
+                    print("♻️ 설정 CSV 또는 모델이 바뀌어 사전을 다시 만듭니다.")
+                    return False
+                antonym_vecs = data['antonym_vecs']
+                phrase_vecs = data['phrase_vecs']
+        except Exception as e:
+            print(f"⚠️ 사전 결과물 로드 실패, 다시 만듭니다: {e}")
+            return False
+
+        self.user_words = meta['user_words']
+        self._register_user_words()
+
+        for target in self.df_conf['keyword']:
+            if target in self.token_to_row:
+                self.keyword_unit_map[target] = self.unit_vectors[self.token_to_row[target]]
+        for key, vec in zip(meta['antonym_keys'], antonym_vecs):
+            self.antonym_vec_map[key] = vec
+            self.antonym_unit_map[key] = self._unit(vec)
+        for key, vec in zip(meta['phrase_keys'], phrase_vecs):
+            self.phrase_unit_cache[key] = vec
+        for key in meta['phrase_missing']:
+            self.phrase_unit_cache[key] = None
+        return True
 
     def analyze_article(self, title, description, target_keyword):
         """
@@ -90,31 +404,199 @@ class BiasAnalyzer:
         Return: 양수(+)면 해당 키워드 성향, 음수(-)면 반대 성향
         """
         # 1. 분석 가능한 키워드인지 체크
-        if target_keyword not in self.model.wv or target_keyword not in self.antonym_vec_map:
+        if target_keyword not in self.keyword_unit_map or target_keyword not in self.antonym_unit_map:
             return None # 분석 불가 (데이터 부족)
 
         # 2. 기사 텍스트 전처리
         full_text = f"{title} {description}"
-        tokens = self.twitter.nouns(full_text)
+        tokens = self.nouns(full_text)
         
-        # 의미 있는 단어만 필터링
-        valid_tokens = [t for t in tokens if t in self.model.wv and len(t) > 1]
+        # 의미 있는 단어만 필터링 (행 번호로 변환)
+        rows = self.token_rows(tokens)
         
-        if not valid_tokens: return 0.0
+        if not rows: return 0.0
 
         # 3. 벡터 계산 (Core Logic)
-        my_vec = self.model.wv[target_keyword]          # 기준점 (예: 건국절)
-        oppo_vec = self.antonym_vec_map[target_keyword] # 반대점 (예: 광복절, 독립운동)
-        article_vec = np.mean([self.model.wv[t] for t in valid_tokens], axis=0) # 기사 위치
+        my_unit = self.keyword_unit_map[target_keyword]    # 기준점 (예: 건국절)
+        oppo_unit = self.antonym_unit_map[target_keyword]  # 반대점 (예: 광복절, 독립운동)
+        article_vec = self.article_vector(rows)            # 기사 위치
         
-        # 4. 코사인 유사도 비교
+        # 4. 코사인 유사도 비교 (기준점은 이미 정규화되어 있으므로 내적 / 기사 벡터 길이)
         # (나랑 얼마나 가까운가) - (반대랑 얼마나 가까운가)
-        sim_my = np.dot(article_vec, my_vec) / (norm(article_vec)*norm(my_vec))
-        sim_oppo = np.dot(article_vec, oppo_vec) / (norm(article_vec)*norm(oppo_vec))
+        sim_my, sim_oppo = self.cosine_pair(article_vec, my_unit, oppo_unit)
         
         # 점수 리턴
         return sim_my - sim_oppo
 
+    def _target_keywords(self, title, description, keywords=(), detect=True):
+        """분석할 키워드 목록: 지정한 키워드 + (detect면) 기사에 등장한 설정 키워드 (CSV 순서)"""
+        targets = list(dict.fromkeys(keywords or ()))
+        if detect:
+            found = self.keyword_matcher.matched_payloads(f"{title}\n{description}", 'keyword')
+            for _, payload in sorted(found, key=lambda x: x[1]['priority']):
+                if payload['keyword'] not in targets:
+                    targets.append(payload['keyword'])
+        return targets
+
+    def _anchor_pair(self, keyword, phrase_anchors=False):
+        """(키워드 단위벡터, 반대어 단위벡터). 둘 중 하나라도 없으면 None"""
+        my_unit = self.phrase_unit_vector(keyword) if phrase_anchors else self.keyword_unit_map.get(keyword)
+        oppo_unit = self.antonym_unit_map.get(keyword)
+        if my_unit is None or oppo_unit is None:
+            return None
+        return my_unit, oppo_unit
+
+    def keyword_similarities(self, title, description, keywords=(), detect=True, phrase_anchors=False):
+        """
+        기사 1건을 여러 키워드에 대해 한 번에 분석 (다중 키워드 모드)
+        - keywords: 항상 포함할 키워드 (예: 검색어)
+        - detect: True면 기사에 등장한 설정 키워드도 모두 포함 (CSV 순서)
+        - phrase_anchors: True면 모델에 없는 키워드도 쪼개서 기준점을 만듦 (bot의 스마트 분석 방식)
+        Return: {키워드: (키워드 유사도, 반대어 유사도)} (분석 가능한 키워드만, 유효 단어가 없으면 {})
+        """
+        # 기준점이 있는 키워드만 남기기
+        usable, my_units, oppo_units = [], [], []
+        for kw in self._target_keywords(title, description, keywords, detect):
+            pair = self._anchor_pair(kw, phrase_anchors)
+            if pair is None:
+                continue
+            usable.append(kw)
+            my_units.append(pair[0])
+            oppo_units.append(pair[1])
+        if not usable:
+            return {}
+
+        # 기사 벡터는 한 번만 계산
+        rows = self.token_rows(self.nouns(f"{title} {description}"))
+        if not rows:
+            return {}
+        article_vec = self.article_vector(rows)
+        article_vec = article_vec / norm(article_vec)
+
+        # 모든 (키워드, 반대어) 기준점을 쌓아서 행렬-벡터 곱 한 번으로 계산
+        sims = np.vstack(my_units + oppo_units) @ article_vec
+        n = len(usable)
+        return {kw: (float(sims[i]), float(sims[n + i])) for i, kw in enumerate(usable)}
+
+    def batch_keyword_similarities(self, articles, keywords=None, detect=True, phrase_anchors=False):
+        """
+        keyword_similarities의 배치 버전 (재분석 스크립트처럼 기사를 묶음 단위로 처리할 때)
+        - articles: [(title, description), ...]
+        - keywords: 기사별로 항상 포함할 키워드 리스트 (None이면 없음)
+        Return: 기사 순서대로 {키워드: (키워드 유사도, 반대어 유사도)} 리스트
+        """
+        keywords = keywords or [()] * len(articles)
+        results = [{} for _ in articles]
+
+        # 1. 기사별 대상 키워드 + 전체 기준점 번호 매기기
+        anchor_index = {}
+        my_units, oppo_units = [], []
+        targets = []      # (기사 번호, [키워드...])
+        row_lists = []
+        for i, ((title, description), forced) in enumerate(zip(articles, keywords)):
+            usable = []
+            for kw in self._target_keywords(title, description, forced, detect):
+                if kw not in anchor_index:
+                    pair = self._anchor_pair(kw, phrase_anchors)
+                    anchor_index[kw] = None if pair is None else len(my_units)
+                    if pair is not None:
+                        my_units.append(pair[0])
+                        oppo_units.append(pair[1])
+                if anchor_index[kw] is not None:
+                    usable.append(kw)
+            if not usable:
+                continue
+            rows = self.token_rows(self.nouns(f"{title} {description}"))
+            if not rows:
+                continue
+            targets.append((i, usable))
+            row_lists.append(rows)
+
+        if not targets:
+            return results
+
+        # 2. 기사 행렬 (희소행렬 곱 1번) x 기준점 행렬 -> 행렬곱 1번으로 모든 유사도
+        article_mat = self._article_matrix(row_lists)
+        sim_mat = article_mat @ np.vstack(my_units + oppo_units).T
+
+        n = len(my_units)
+        for row, (i, usable) in enumerate(targets):
+            results[i] = {kw: (float(sim_mat[row, anchor_index[kw]]), float(sim_mat[row, n + anchor_index[kw]]))
+                          for kw in usable}
+        return results
+
+    def _article_matrix(self, row_lists):
+        """
+        기사별 행 번호 리스트 -> 정규화된 기사 벡터 행렬 (희소행렬 곱 1번)
+        각 칸의 가중치 = 단어 벡터 길이 / 토큰수 -> 단위벡터 행렬로 원래 평균을 복원
+        """
+        counts = np.fromiter((len(r) for r in row_lists), dtype=np.int64, count=len(row_lists))
+        indptr = np.concatenate(([0], np.cumsum(counts)))
+        indices = np.fromiter((t for r in row_lists for t in r), dtype=np.int64, count=int(indptr[-1]))
+        data = (self.vector_norms[indices] / np.repeat(counts, counts)).astype(np.float32)
+        mean_op = csr_matrix((data, indices, indptr), shape=(len(row_lists), len(self.index_to_key)))
+        article_mat = np.asarray(mean_op @ self.unit_vectors, dtype=np.float32)
+        article_mat /= norm(article_mat, axis=1, keepdims=True)
+        return article_mat
+
+    def analyze_batch(self, articles, keywords):
+        """
+        여러 기사를 한 번에 분석하는 배치 버전 (analyze_article과 같은 점수)
+        - articles: [(title, description), ...]
+        - keywords: 기사별 키워드 리스트 (문자열 1개를 주면 모든 기사에 공통 적용)
+        Return: 기사 순서대로 점수 리스트 (분석 불가 키워드는 None, 유효 단어가 없으면 0.0)
+        """
+        sims = self.batch_similarities(articles, keywords)
+        return [None if pair is None else pair[0] - pair[1] for pair in sims]
+
+    def batch_similarities(self, articles, keywords):
+        """
+        analyze_batch의 내부 계산 함수. 기사별 (키워드 유사도, 반대어 유사도) 쌍을 돌려줌
+        - 분석 불가 키워드: None / 유효 단어가 없는 기사: (0.0, 0.0)
+        """
+        if isinstance(keywords, str):
+            keywords = [keywords] * len(articles)
+        if len(keywords) != len(articles):
+            raise ValueError("articles와 keywords의 길이가 다릅니다.")
+
+        results = [None] * len(articles)
+
+        # 1. 분석 가능한 키워드만 골라서 번호 매기기 (기준점 행렬의 행 번호)
+        kw_rows = {}
+        for kw in keywords:
+            if kw not in kw_rows and kw in self.keyword_unit_map and kw in self.antonym_unit_map:
+                kw_rows[kw] = len(kw_rows)
+
+        # 2. 기사별 토큰 행 번호 모으기
+        row_lists = []
+        targets = []  # (기사 번호, 키워드 행 번호)
+        for i, ((title, description), kw) in enumerate(zip(articles, keywords)):
+            if kw not in kw_rows:
+                continue
+            rows = self.token_rows(self.nouns(f"{title} {description}"))
+            if not rows:
+                results[i] = (0.0, 0.0)
+                continue
+            row_lists.append(rows)
+            targets.append((i, kw_rows[kw]))
+
+        if not targets:
+            return results
+
+        # 3. 희소행렬(CSR) 곱 한 번으로 기사별 평균 벡터 계산
+        article_mat = self._article_matrix(row_lists)
+
+        # 4. 정규화된 키워드/반대어 기준점을 쌓고, 행렬곱 한 번으로 모든 코사인 유사도 계산
+        kw_list = list(kw_rows)
+        anchors = np.vstack([self.keyword_unit_map[kw] for kw in kw_list] +
+                            [self.antonym_unit_map[kw] for kw in kw_list])
+        sim_mat = article_mat @ anchors.T
+
+        n_kw = len(kw_list)
+        for row, (i, k) in enumerate(targets):
+            results[i] = (float(sim_mat[row, k]), float(sim_mat[row, n_kw + k]))
+        return results
+
 # ==========================================
 # [실행 테스트] 터미널에서 python analysis_service.py 실행 시 작동
 # ==========================================
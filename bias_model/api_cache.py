@@ -0,0 +1,104 @@
+# ==========================================
+# API 응답 캐시 (메모리, TTL + LRU, ETag)
+# ==========================================
+# 같은 조회 조건의 응답(JSON 바이트)을 데이터 버전과 함께 보관합니다.
+# - 키: (경로, 정렬한 쿼리 파라미터) → ?b=1&a=2 와 ?a=2&b=1 은 같은 캐시
+# - 데이터 버전(data_version.VersionWatcher)이 바뀌었거나 ttl초가 지나면 다시 조회
+# - max_entries를 넘으면 가장 오래 안 쓴 응답부터 버림 (LRU)
+# - ETag는 응답 바이트의 해시 (strong) → 클라이언트가 If-None-Match로 보내면 304로 본문 없이 응답
+# - 압축본(gzip/br)도 처음 요청될 때 한 번만 만들어서 같이 보관 (ETag도 인코딩별로 다름)
+import hashlib
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from compression import compress
+
+# encoded: {인코딩: (압축된 바이트, ETag)} - 요청이 올 때 채워짐
+CachedBody = namedtuple('CachedBody', ['body', 'etag', 'encoded'])
+
+def normalize_query(items, ignore=()):
+    """[(키, 값), ...] → 정렬된 튜플 (빈 값 / ignore 키 제외)"""
+    return tuple(sorted((k, v) for k, v in items if v != '' and k not in ignore))
+
+def make_etag(body):
+    return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+def encoded_body(cached, encoding):
+    """Return: (보낼 바이트, ETag) - encoding이 None이면 원본"""
+    if encoding is None:
+        return cached.body, cached.etag
+    found = cached.encoded.get(encoding)
+    if found is None:
+        # 여러 스레드가 동시에 만들어도 결과가 같아서 락 없이 덮어써도 됨
+        found = (compress(cached.body, encoding), cached.etag[:-1] + '-' + encoding + '"')
+        cached.encoded[encoding] = found
+    return found
+
+def etag_matches(if_none_match, etag):
+    """If-None-Match 헤더 (여러 개 / * / W/ 접두어 허용)"""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        if tag == '*' or tag == etag:
+            return True
+    return False
+
+class ApiCache:
+    def __init__(self, max_entries=512, ttl=300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # 키 -> (데이터 버전, 저장 시각, CachedBody)
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0     # 버전이 바뀌었거나 ttl이 지나서 버린 응답
+        self.evicted = 0   # 개수 제한으로 버린 응답
+
+    def get(self, key, version):
+        """Return: CachedBody (없거나 오래됐으면 None)"""
+        if version is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            saved_version, saved_at, cached = entry
+            if saved_version != version or time.monotonic() - saved_at > self.ttl:
+                del self._entries[key]
+                self.stale += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached
+
+    def put(self, key, version, body):
+        """body: 응답 JSON 바이트 → CachedBody (version이 None이면 저장하지 않고 ETag만 계산)"""
+        cached = CachedBody(body, make_etag(body), {})
+        if version is None:
+            return cached
+        with self._lock:
+            self._entries[key] = (version, time.monotonic(), cached)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evicted += 1
+        return cached
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            size = len(self._entries)
+            nbytes = sum(len(c.body) + sum(len(b) for b, _ in list(c.encoded.values())) for _, _, c in self._entries.values())
+        total = self.hits + self.misses
+        return {'entries': size, 'bytes': nbytes, 'hits': self.hits, 'misses': self.misses,
+                'hit_rate': round(self.hits / total, 3) if total else 0.0,
+                'stale': self.stale, 'evicted': self.evicted}
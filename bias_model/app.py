@@ -1,8 +1,16 @@
-from flask import Flask, jsonify, request
+from functools import wraps
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
 import pymysql
 import os
 from dotenv import load_dotenv
+from api_cache import ApiCache, encoded_body, etag_matches, normalize_query
+from compression import negotiate
+from data_version import VersionWatcher, read_data_version
+from db_pool import ConnectionPool
+from news_query import (InvalidCursor, InvalidFields, InvalidIds, LIST_DEFAULT_FIELDS, missing_list_indexes,
+                        get_news_by_id, get_news_by_ids, list_news, page_size, parse_ids, resolve_fields,
+                        table_columns)
 
 # .env 파일에 있는 내용을 불러옵니다
 load_dotenv()
@@ -24,61 +32,126 @@ db_config = {
     'cursorclass': pymysql.cursors.DictCursor # 데이터를 딕셔너리 형태(Key:Value)로 가져옴
 }
 
+# 요청마다 새로 연결하지 않고 연결 풀에서 빌려 씀 (서버 전체에서 최대 DB_POOL_SIZE개)
+pool = ConnectionPool(
+    db_config,
+    max_size=int(os.getenv("DB_POOL_SIZE", 10)),
+    timeout=float(os.getenv("DB_POOL_TIMEOUT", 10)),
+    max_lifetime=int(os.getenv("DB_POOL_MAX_LIFETIME", 1800)),
+)
+
+# 목록 조회용 복합 인덱스가 있는지만 확인 (추가는 scripts/migrate_news_indexes.py로 - 서버 시작 때 ALTER하지 않음)
+try:
+    with pool.connection() as conn:
+        missing = missing_list_indexes(conn.cursor())
+    if missing:
+        print(f"⚠️ 목록 조회용 인덱스가 없습니다: {', '.join(missing)} "
+              f"(python scripts/migrate_news_indexes.py 로 추가하세요, 없으면 목록 조회가 느림)")
+except Exception as e:
+    print("⚠️ 인덱스 확인 실패 (서버는 그대로 실행):", e)
+
+# 응답 캐시: 수집 작업이 저장할 때마다 올리는 데이터 버전이 바뀌면(또는 API_CACHE_TTL초가 지나면) 다시 조회
+api_cache = ApiCache(max_entries=int(os.getenv("API_CACHE_SIZE", 512)), ttl=int(os.getenv("API_CACHE_TTL", 300)))
+
+def read_news_version():
+    with pool.connection() as conn:
+        return read_data_version(conn.cursor())
+
+# 데이터 버전도 매 요청마다 읽지 않고 API_VERSION_CHECK초(기본 1초)에 한 번만 확인
+news_version = VersionWatcher(read_news_version, check_interval=float(os.getenv("API_VERSION_CHECK", 1.0)))
+
+# NEWS_ARTICLES의 실제 컬럼 (?fields= 확인용, 처음 요청 때 1번만 읽음)
+news_columns = []
+
+def request_fields(cursor, default=None):
+    """?fields= → SELECT할 컬럼 리스트"""
+    global news_columns
+    if not news_columns:
+        news_columns = table_columns(cursor)
+    return resolve_fields(request.args.get('fields'), news_columns, default)
+
+def cached_json(view):
+    """
+    성공(200) 응답을 메모리에 캐시하고 ETag를 붙임
+    (브라우저가 If-None-Match로 같은 ETag를 보내면 본문 없이 304)
+    (Accept-Encoding에 맞춰 br / gzip으로 압축, 압축본도 같이 캐시)
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = (request.path, normalize_query(request.args.items(multi=True)))
+        version = news_version.current()
+        cached = api_cache.get(key, version)
+        hit = cached is not None
+        if not hit:
+            resp = app.make_response(view(*args, **kwargs))
+            if resp.status_code != 200:
+                return resp   # 에러 / 404는 캐시하지 않음
+            cached = api_cache.put(key, version, resp.get_data())
+
+        encoding = negotiate(request.headers.get('Accept-Encoding'), len(cached.body))
+        body, etag = encoded_body(cached, encoding)
+        if etag_matches(request.headers.get('If-None-Match'), etag):
+            resp = Response(status=304)
+        else:
+            resp = Response(body, mimetype='application/json')
+            if encoding:
+                resp.headers['Content-Encoding'] = encoding
+        resp.headers['ETag'] = etag
+        resp.headers['Vary'] = 'Accept-Encoding'
+        resp.headers['Cache-Control'] = 'no-cache'   # 매번 ETag로 확인 (바뀐 게 없으면 304)
+        resp.headers['X-Cache'] = 'HIT' if hit else 'MISS'
+        return resp
+    return wrapper
+
 # 2. API 엔드포인트: 전체 뉴스 데이터 조회, 카테고리 선택기능 추가
 # 카테고리 : 사용자가 환경을 누르면 환경뉴스만, 노동을 누르면 노동 뉴스만 나오게 하는 기능
 @app.route('/api/news', methods=['GET'])
+@cached_json
 def get_news():
-    conn = None
     try:
         
-        # DB 연결
-        conn = pymysql.connect(**db_config)
-        cursor = conn.cursor()
+        # DB 연결 (풀에서 빌려옴)
+        with pool.connection() as conn:
+            cursor = conn.cursor()
         
-        # 1. 프론트엔드에서 보낸 'category' 파라미터 받기
-        # 예: http://localhost:5000/api/news?category=환경
-        # 주소창에서 category : 정치 같은 값 받아오기
-        category_filter = request.args.get('category')
-
-        # 2. SQL 쿼리 동적 작성
-        if category_filter:
-            # 카테고리가 있으면 해당 카테고리만 최신순 조회
-            # %s는 보안을 위해 사용하는 안전한 방식입니다.
-            sql = "SELECT * FROM NEWS_ARTICLES WHERE category = %s ORDER BY created_at DESC LIMIT 30"
-            cursor.execute(sql, (category_filter,))
-        else:
-            # 없으면 전체 조회 (기존 방식)
-            sql = "SELECT * FROM NEWS_ARTICLES ORDER BY created_at DESC LIMIT 30"
-            cursor.execute(sql)
-        
-        result = cursor.fetchall()
+            # 1. 프론트엔드에서 보낸 'category' 파라미터 받기
+            # 예: http://localhost:5000/api/news?category=환경
+            # 주소창에서 category : 정치 같은 값 받아오기
+            category_filter = request.args.get('category')
+
+            # 2. 다음 페이지: 이전 응답의 next_cursor를 ?cursor= 로 그대로 보내면 됨
+            # 예: /api/news?category=환경&cursor=eyJ0Ij...&limit=30
+            # (카테고리가 있으면 해당 카테고리만, 없으면 전체를 최신순으로)
+            # 3. 기본은 카드용 간단한 필드만 (제목 + 점수), ?fields=title,link,description 또는 ?fields=all
+            rows, next_cursor = list_news(cursor, category=category_filter,
+                                          cursor=request.args.get('cursor'),
+                                          limit=page_size(request.args.get('limit')),
+                                          fields=request_fields(cursor, LIST_DEFAULT_FIELDS))
         
         return jsonify({
             'status': 'success', 
-            'count': len(result),
-            'data': result
+            'count': len(rows),
+            'data': rows,
+            'next_cursor': next_cursor   # 마지막 페이지면 null
         })
 
+    except (InvalidCursor, InvalidFields) as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
     except Exception as e:
         print("에러 발생:", e) # 터미널에서도 에러를 볼 수 있게 출력
         return jsonify({'status': 'error', 'message': str(e)}), 500
-    
-    finally:
-        if conn:
-            conn.close()
 
 @app.route('/api/news/<int:news_id>', methods=['GET'])
+@cached_json
 def get_news_detail(news_id):
-    conn = None
     try:
-        conn = pymysql.connect(**db_config)
-        cursor = conn.cursor()
+        with pool.connection() as conn:
+            cursor = conn.cursor()
 
-        # 1. URL에 적힌 숫자(news_id)에 해당하는 기사 1개만 찾기
-        sql = "SELECT * FROM NEWS_ARTICLES WHERE id = %s"
-        cursor.execute(sql, (news_id,))
-        
-        result = cursor.fetchone() # 하나만 가져오므로 fetchall() 대신 fetchone() 사용
+            # 1. URL에 적힌 숫자(news_id)에 해당하는 기사 1개만 찾기
+            # (기본은 공개 필드 전부, ?fields=title,description 처럼 골라 받을 수 있음)
+            result = get_news_by_id(cursor, news_id, request_fields(cursor))
 
         if result:
             return jsonify({'status': 'success', 'data': result})
@@ -86,12 +159,48 @@ def get_news_detail(news_id):
             # DB에 해당 ID가 없는 경우 (404 에러 반환)
             return jsonify({'status': 'error', 'message': '기사를 찾을 수 없습니다.'}), 404
 
+    except InvalidFields as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
-    
-    finally:
-        if conn:
-            conn.close()
+
+# 여러 기사 한 번에 조회 (비교 화면 등에서 기사마다 요청하지 않도록)
+# 예: /api/news/batch?ids=12,5,40&fields=title,description
+# 응답 data는 요청한 id 순서 그대로, 없는 기사는 found: false
+@app.route('/api/news/batch', methods=['GET'])
+@cached_json
+def get_news_batch():
+    try:
+        ids = parse_ids(request.args.get('ids'))
+        with pool.connection() as conn:
+            cursor = conn.cursor()
+            items = get_news_by_ids(cursor, ids, request_fields(cursor))
+
+        missing = [item['id'] for item in items if not item['found']]
+        return jsonify({
+            'status': 'success',
+            'count': len(items) - len(missing),
+            'data': items,
+            'missing': missing
+        })
+
+    except (InvalidIds, InvalidFields) as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+    except Exception as e:
+        print("에러 발생:", e)
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+
+# 연결 풀 상태 확인 (사용 중 / 대기 중 요청 수 / 평균·최대 대기 시간)
+@app.route('/api/health/pool', methods=['GET'])
+def get_pool_stats():
+    return jsonify({'status': 'success', 'data': pool.stats()})
+
+# 응답 캐시 상태 확인 (적중률 / 저장된 응답 수·크기 / 현재 데이터 버전)
+@app.route('/api/health/cache', methods=['GET'])
+def get_cache_stats():
+    return jsonify({'status': 'success', 'data': dict(api_cache.stats(), data_version=news_version.current())})
 
 # 서버 실행
 if __name__ == '__main__':
@@ -1,12 +1,16 @@
 import time
-import schedule
 import pymysql
-import requests
-import re
 import pandas as pd
-import numpy as np
-from numpy.linalg import norm
 from analysis_service import BiasAnalyzer # ★ AI 두뇌 탑재
+from score_store import (ensure_columns, ensure_keyword_score_table, ensure_score_stamps, keyword_config_hashes,
+                         keyword_score_rows, UPSERT_KEYWORD_SCORE_SQL)
+from db_writer import ArticleWriter, ensure_link_hash, link_hash, DUP_CLUSTER_COLUMNS
+from near_dup import NearDupIndex
+from naver_client import DAILY_QUOTA, RATE_PER_SEC, NaverNewsClient, QuotaExceeded, get_client, normalize_item
+from job_leases import LeaseQueue, run_leased
+from keyword_scheduler import KeywordScheduler
+from pipeline import Pipeline, Stage
+from watermark import WATERMARK_PATH, WatermarkStore
 from datetime import datetime
 import os
 from dotenv import load_dotenv
@@ -23,16 +27,76 @@ DB_PASS = os.getenv("DB_PASS")
 DB_NAME = os.getenv("DB_NAME")
 DB_PORT = int(os.getenv("DB_PORT"))
 
-NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID")     
-NAVER_CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET")
-
 CONF_FILE = 'data/bias_data_final.csv'
 
+# 판정 기준 (보수/진보 점수 차이)
+JUDGE_THRESHOLD = 0.02
+
+# 다중 키워드 모드: 검색어뿐 아니라 기사에 등장한 다른 키워드들도 같이 분석해서
+# NEWS_KEYWORD_SCORES 테이블에 (기사, 키워드)별 점수로 저장
+MULTI_KEYWORD_MODE = True
+
+# 파이프라인 단계별 스레드 수 / 배치 크기
+# (네이버 API 초당 호출 수는 naver_client의 토큰 버킷이 제한)
+FETCH_WORKERS = 8
+NORMALIZE_WORKERS = 1
+SCORE_WORKERS = 1        # 형태소 분석기(JVM)를 쓰므로 기본 1
+SCORE_BATCH = 64         # 한 번에 행렬곱으로 점수를 낼 기사 수
+PIPELINE_QUEUE_SIZE = 500  # 단계 사이 대기열 크기 (메모리 상한)
+
+# 키워드별 기준선: 이미 본 기사가 나오면 페이지 넘기기를 멈춤
+# (처음 보는 키워드는 1페이지만, 기준선이 있으면 최대 BOT_MAX_PAGES페이지까지)
+BOT_MAX_PAGES = 5
+
+# 유사 중복 기사 (같은 통신사 기사를 여러 언론사가 실은 경우 등)
+# 'reuse': 대표 기사의 점수를 그대로 씀 (형태소 분석 생략) / 'skip': 저장하지 않음 / None: 끔
+NEAR_DUP_MODE = 'reuse'
+NEAR_DUP_WARM = 5000   # 처음 실행 때 DB에서 불러올 최근 기사 수
+
+# 키워드별 수집 주기: 새 기사가 많이 나오는 키워드는 자주, 조용한 키워드는 드물게
+# (한 번에 새 기사가 BOT_TARGET_NEW개 정도 쌓이도록, 전체 호출은 하루 한도의 80% 안에서)
+BOT_MIN_INTERVAL = 30 * 60
+BOT_MAX_INTERVAL = 24 * 3600
+BOT_DEFAULT_INTERVAL = 6 * 3600   # 아직 속도를 모르는 키워드 (예전 고정 주기)
+BOT_TARGET_NEW = 20
+SCHEDULE_STATE = 'cache/bot_schedule.json'
+
+# 여러 봇 동시 실행: BOT_SHARDED=1이면 DB의 KEYWORD_LEASES 테이블에서 키워드를 빌려서 수집
+# (다른 봇이 들고 있는 키워드는 건너뛰고, 죽은 봇의 키워드는 BOT_LEASE_SECONDS 뒤에 다시 가져감)
+# - BOT_SHARD_ID: 봇마다 다른 이름 (스케줄/기준선 파일을 봇별로 따로 씀, 재시작해도 같은 이름으로)
+# - BOT_SHARDS: 같은 네이버 키를 쓰는 봇 수 (하루 한도/초당 호출 수를 나눠서 씀, backfill_runner --shards와 같은 방식)
+BOT_SHARDED = os.getenv("BOT_SHARDED") == '1'
+BOT_LEASE_SECONDS = int(os.getenv("BOT_LEASE_SECONDS", 600))
+BOT_CLAIM_LIMIT = int(os.getenv("BOT_CLAIM_LIMIT", 10))
+BOT_SHARD_ID = os.getenv("BOT_SHARD_ID", "0")
+BOT_SHARDS = max(1, int(os.getenv("BOT_SHARDS", 1))) if BOT_SHARDED else 1
+
+if BOT_SHARDED:
+    SCHEDULE_STATE = f'cache/bot_schedule.{BOT_SHARD_ID}.json'
+    WATERMARK_PATH = WATERMARK_PATH.replace('.json', f'.{BOT_SHARD_ID}.json')
+BOT_REQUEST_BUDGET_PER_HOUR = DAILY_QUOTA // BOT_SHARDS * 0.8 / 24
+
 # ==========================================
 # [준비] AI 분석기 미리 로딩 (봇 켜질 때 1번만)
 # ==========================================
 print("🤖 봇 가동 시작! AI 모델을 로딩합니다...")
 analyzer = BiasAnalyzer()
+# 점수 도장용 키워드별 설정 해시 (update_db_scores --incremental이 새로 넣은 기사를 다시 계산하지 않도록)
+config_hashes = keyword_config_hashes(analyzer.df_conf)
+# 연결을 재사용하는 네이버 클라이언트 (스케줄 실행마다 새로 만들지 않음)
+if BOT_SHARDS > 1:
+    # 봇이 여러 개면 초당/하루 호출 한도도 나눠서 씀
+    naver = NaverNewsClient(os.getenv("NAVER_CLIENT_ID"), os.getenv("NAVER_CLIENT_SECRET"),
+                            rate_per_sec=RATE_PER_SEC / BOT_SHARDS, daily_quota=DAILY_QUOTA // BOT_SHARDS)
+else:
+    naver = get_client()
+watermarks = WatermarkStore(WATERMARK_PATH)
+near_dups = NearDupIndex()
+near_dup_last_id = 0   # 유사 중복 색인에 넣은 마지막 기사 id (다른 봇이 저장한 기사도 실행마다 이어서 넣음)
+new_counts = {}   # 이번 실행에서 키워드별로 새로 나온 기사 수 (스케줄러 속도 계산용)
+# 기준선은 저장까지 끝난 기사로만 올림 (가져온 기사 / 저장됐거나 이미 있던 기사를 키워드별로 모아뒀다가 마지막에 갱신)
+fetched_items = {}
+stored_items = {}
 
 def get_db_connection():
     return pymysql.connect(host=DB_HOST, user=DB_USER, password=DB_PASS, db=DB_NAME, port=DB_PORT, charset='utf8')
@@ -46,146 +110,336 @@ def calculate_scores_smart(title, description, search_keyword):
     """
     # 1. 기사 벡터 계산 (이건 기본)
     full_text = f"{title} {description}"
-    tokens = analyzer.twitter.nouns(full_text)
-    valid_tokens = [t for t in tokens if t in analyzer.model.wv and len(t) > 1]
+    tokens = analyzer.nouns(full_text)  # 캐시를 거친 명사 추출
+    rows = analyzer.token_rows(tokens)
     
     # 기사에 쓸만한 명사가 하나도 없으면 0점 (이건 어쩔 수 없음)
-    if not valid_tokens: 
+    if not rows: 
         return 0.0, 0.0, None
 
-    article_vec = np.mean([analyzer.model.wv[t] for t in valid_tokens], axis=0)
+    article_vec = analyzer.article_vector(rows)
 
     # -----------------------------------------------------------
     # 2. 기준점(키워드) 벡터 만들기 - 여기가 핵심! ⚡
     # -----------------------------------------------------------
     # 검색어(search_keyword)가 모델에 딱 있으면 베스트
-    if search_keyword in analyzer.model.wv:
-        my_vec = analyzer.model.wv[search_keyword]
-        
-    else:
-        # 없으면? 검색어를 쪼개서 벡터를 만듦 (예: "4대강 보 해체" -> "4대강"+"보"+"해체" 평균)
-        # 1) 검색어 자체를 형태소 분석
-        kw_tokens = analyzer.twitter.nouns(search_keyword)
-        kw_valid = [t for t in kw_tokens if t in analyzer.model.wv]
-        
-        if kw_valid:
-            # 쪼갠 단어들의 평균 벡터 사용
-            my_vec = np.mean([analyzer.model.wv[t] for t in kw_valid], axis=0)
-        else:
-            # 쪼개도 아는 단어가 없으면... 분석 불가 (어쩔 수 없음)
-            return 0.0, 0.0, None
+    # 없으면? 검색어를 쪼개서 벡터를 만듦 (예: "4대강 보 해체" -> "4대강"+"보"+"해체" 평균)
+    # (정규화된 기준점은 analyzer가 키워드별로 한 번만 계산해서 캐시해둠)
+    my_unit = analyzer.phrase_unit_vector(search_keyword)
+    if my_unit is None:
+        # 쪼개도 아는 단어가 없으면... 분석 불가 (어쩔 수 없음)
+        return 0.0, 0.0, None
 
     # 3. 반대어(Antonym) 벡터 가져오기
-    # (이미 analysis_service에서 계산해둠)
-    if search_keyword in analyzer.antonym_vec_map:
-        oppo_vec = analyzer.antonym_vec_map[search_keyword]
+    # (이미 analysis_service에서 정규화까지 계산해둠)
+    if search_keyword in analyzer.antonym_unit_map:
+        oppo_unit = analyzer.antonym_unit_map[search_keyword]
     else:
         # 반대어 설정이 안 된 키워드라면 분석 불가
         return 0.0, 0.0, None
 
     # 4. 최종 점수 계산 (코사인 유사도)
     try:
-        sim_cons = np.dot(article_vec, my_vec) / (norm(article_vec)*norm(my_vec))
-        sim_prog = np.dot(article_vec, oppo_vec) / (norm(article_vec)*norm(oppo_vec))
+        sim_cons, sim_prog = analyzer.cosine_pair(article_vec, my_unit, oppo_unit)
         
         # 키워드를 찾았으니 검색어를 결과로 리턴
-        return float(sim_cons), float(sim_prog), search_keyword
+        return sim_cons, sim_prog, search_keyword
         
     except:
         return 0.0, 0.0, None
 
+# ==========================================
+# [파이프라인] 단계별 처리 함수
+# ==========================================
+def fetch_stage(task):
+    """(키워드, 카테고리) -> 아직 안 본 새 기사들 (최신순으로 페이지를 넘기다 본 기사가 나오면 멈춤)"""
+    keyword, category = task
+    # 키워드별로 새 기사가 나오는 속도에 맞춘 요청 개수
+    display = watermarks.suggest_display(keyword)
+    max_pages = BOT_MAX_PAGES if watermarks.known(keyword) else 1
+    fresh = []
+    try:
+        for items in naver.iter_pages(keyword, max_items=display * max_pages, display=display, sort="date"):
+            new_items = watermarks.unseen(keyword, items)
+            fresh.extend(new_items)
+            # 본 기사가 섞여 있으면 그 뒤(더 예전 기사)는 전부 이미 본 것
+            if len(new_items) < len(items):
+                break
+    except QuotaExceeded as e:
+        print(f"🛑 {e}")
+        fetched_items[keyword] = fresh
+        return [(keyword, category, item) for item in fresh]
+    fetched_items[keyword] = fresh
+    new_counts[keyword] = len(fresh)
+    return [(keyword, category, item) for item in fresh]
+
+def normalize_stage(fetched):
+    """HTML 태그 제거 + 링크 정리"""
+    keyword, category, item = fetched
+    article = normalize_item(item)
+    return [{
+        'keyword': keyword,
+        'category': category,
+        'title': article['title'],
+        'desc': article['description'],
+        'link': article['link'],
+        'item': item,   # 기준선 갱신용 원본
+    }]
+
+def score_articles(batch):
+    """기사 묶음을 한 번에 분석 (형태소 분석 + 행렬곱)"""
+    if not batch:
+        return batch
+    if MULTI_KEYWORD_MODE:
+        # 기사 벡터는 1번만 계산하고, 검색어 + 기사에 나온 키워드 전부를 한 번에 비교
+        all_scores = analyzer.batch_keyword_similarities(
+            [(a['title'], a['desc']) for a in batch], [[a['keyword']] for a in batch], phrase_anchors=True)
+    else:
+        all_scores = [None] * len(batch)
+
+    for article, scores in zip(batch, all_scores):
+        keyword = article['keyword']
+        if scores is not None:
+            sim_cons, sim_prog = scores.get(keyword, (0.0, 0.0))
+            detected_kw = keyword if keyword in scores else None
+        else:
+            # ★ 스마트 분석 실행
+            scores = {}
+            sim_cons, sim_prog, detected_kw = calculate_scores_smart(article['title'], article['desc'], keyword)
+        set_result(article, sim_cons, sim_prog, detected_kw, scores)
+    return batch
+
+def set_result(article, sim_cons, sim_prog, detected_kw, scores):
+    # 점수가 0이면 중립, 아니면 판정
+    judgement = 'NEUTRAL'
+    if sim_cons != 0 or sim_prog != 0:
+        diff = sim_cons - sim_prog
+        if diff > JUDGE_THRESHOLD: judgement = 'CONS'
+        elif diff < -JUDGE_THRESHOLD: judgement = 'PROG'
+
+    article.update(sim_cons=sim_cons, sim_prog=sim_prog,
+                   bias_level=sim_cons - sim_prog,  # 이게 바로 우리가 원하는 그 점수!
+                   judgement=judgement,
+                   # 주의: detected_kw가 None이면 원래 keyword를 넣음
+                   final_kw=detected_kw if detected_kw else article['keyword'],
+                   detected_kw=detected_kw,
+                   scores=scores)
+
+def reuse_result(article, payload):
+    """대표 기사의 분석 결과를 재사용 (같은 검색어였거나 그 검색어 점수가 있을 때만). 성공하면 True"""
+    if payload is None:
+        return False
+    keyword = article['keyword']
+    if keyword == payload['keyword']:
+        set_result(article, payload['sim_cons'], payload['sim_prog'], payload['detected_kw'], payload['scores'])
+        return True
+    if keyword in payload['scores']:
+        sim_cons, sim_prog = payload['scores'][keyword]
+        set_result(article, sim_cons, sim_prog, keyword, payload['scores'])
+        return True
+    return False
+
+def result_payload(article):
+    return {'keyword': article['keyword'], 'sim_cons': article['sim_cons'], 'sim_prog': article['sim_prog'],
+            'detected_kw': article['detected_kw'], 'scores': article['scores']}
+
+def score_stage(batch):
+    """유사 중복 기사는 대표 기사의 점수를 재사용하고, 나머지만 묶어서 분석"""
+    if not NEAR_DUP_MODE:
+        return score_articles(batch)
+
+    todo, waiting, out = [], [], []
+    for article in batch:
+        key = link_hash(article['link'])[:16]
+        cluster, payload, _ = near_dups.assign(key, f"{article['title']} {article['desc']}")
+        article['key'] = key
+        article['dup_cluster'] = cluster
+        if cluster == key:
+            todo.append(article)        # 대표 기사 -> 분석
+        elif NEAR_DUP_MODE == 'skip':
+            mark_stored(article)        # 중복 기사는 버림 (처리는 끝난 것으로 봄)
+        elif reuse_result(article, payload):
+            out.append(article)         # 점수 재사용
+        elif payload is None:
+            waiting.append(article)     # 대표 기사가 같은 묶음에서 아직 분석 전
+        else:
+            todo.append(article)        # 검색어가 달라서 재사용 불가 -> 분석
+
+    score_articles(todo)
+    for article in todo:
+        if article['dup_cluster'] == article['key']:
+            near_dups.set_payload(article['key'], result_payload(article))
+    out.extend(todo)
+
+    # 같은 묶음 안의 대표 기사 결과로 다시 시도, 안 되면 직접 분석
+    retry = []
+    for article in waiting:
+        if reuse_result(article, near_dups.payload(article['dup_cluster'])):
+            out.append(article)
+        else:
+            retry.append(article)
+    out.extend(score_articles(retry))
+    return out
+
+def warm_near_dups(cur):
+    """
+    최근 DB 기사로 유사 중복 색인 채우기 (처음엔 최근 NEAR_DUP_WARM개, 그 뒤로는 지난 실행 이후 새로 들어온 기사만)
+    - 여러 봇이 돌 때 다른 봇이 저장한 기사도 색인에 들어가서 봇끼리도 중복을 찾음
+    """
+    global near_dup_last_id
+    if not NEAR_DUP_MODE:
+        return
+    first = near_dup_last_id == 0
+    cur.execute("""
+        SELECT id, link_hash, title, description, detected_keywords, bias_score_cons, bias_score_prog
+        FROM NEWS_ARTICLES WHERE link_hash IS NOT NULL AND id > %s ORDER BY id DESC LIMIT %s
+    """, (near_dup_last_id, NEAR_DUP_WARM))
+    rows = cur.fetchall()
+    if rows:
+        near_dup_last_id = max(near_dup_last_id, rows[0][0])
+    for _, h, title, desc, kw, cons, prog in reversed(rows):
+        cons, prog = float(cons or 0.0), float(prog or 0.0)
+        scores = {kw: (cons, prog)} if kw and (cons or prog) else {}
+        near_dups.assign(h[:16], f"{title} {desc}", {'keyword': kw, 'sim_cons': cons, 'sim_prog': prog,
+                                                     'detected_kw': kw if scores else None, 'scores': scores})
+    if first:
+        print(f"🧬 유사 중복 색인 준비: {near_dups.stats()}")
+
+ARTICLE_COLUMNS = ['category', 'title', 'link', 'description', 'bias_score_cons', 'bias_score_prog', 'bias_level',
+                   'final_judgement', 'detected_keywords', 'score_model_hash', 'score_config_hash', 'dup_cluster']
+WRITE_FLUSH_SIZE = 200     # 이만큼 모이면 여러 행 INSERT 1번 + 커밋
+WRITE_FLUSH_INTERVAL = 5.0 # 또는 첫 기사 후 이 시간(초)이 지나면
+
+def mark_stored(*articles):
+    """저장됐거나(이미 있던 기사 포함) 일부러 버린 기사 -> 기준선에 올려도 되는 기사"""
+    for article in articles:
+        stored_items.setdefault(article['keyword'], []).append(article['item'])
+
+def update_watermarks():
+    """이번 실행에서 가져온 기사 중 저장까지 끝난 기사로만 키워드별 기준선 갱신"""
+    for keyword, fresh in fetched_items.items():
+        watermarks.update(keyword, stored_items.get(keyword, []), new_count=new_counts.get(keyword), fetched=fresh)
+
+def make_writer(conn, counters):
+    """기사 버퍼 저장기 (중복 링크는 link_hash UNIQUE 인덱스로 INSERT IGNORE)"""
+    def on_inserted(cur, inserted):
+        # 새로 들어간 기사들만 분석 성공 카운트 + 키워드별 점수를 한 번에 저장
+        keyword_rows = []
+        for article_id, row in inserted:
+            if row['bias_score_cons'] != 0 or row['bias_score_prog'] != 0:
+                counters['analyzed'] += 1 # 분석 성공 카운트
+            keyword_rows += keyword_score_rows(article_id, row['scores'], JUDGE_THRESHOLD,
+                                               analyzer.model_hash, config_hashes)
+        if keyword_rows:
+            cur.executemany(UPSERT_KEYWORD_SCORE_SQL, keyword_rows)
+
+    def on_flushed(stored, failed):
+        # 커밋까지 끝난 기사만 기준선 후보로 (실패한 기사는 다음 실행 때 다시 가져옴)
+        mark_stored(*stored)
+
+    return ArticleWriter(conn, ARTICLE_COLUMNS, now_columns=['created_at'],
+                         flush_size=WRITE_FLUSH_SIZE, flush_interval=WRITE_FLUSH_INTERVAL,
+                         on_inserted=on_inserted, on_flushed=on_flushed)
+
+def make_write_stage(writer):
+    """DB 저장 단계 (커넥션을 공유하므로 워커 1개로만 사용)"""
+    def write_stage(article):
+        # DB 저장 (detected_keywords 컬럼에 실제로 분석한 단어를 넣음)
+        writer.add({
+            'category': article['category'], 'title': article['title'], 'link': article['link'],
+            'description': article['desc'],
+            'bias_score_cons': article['sim_cons'], 'bias_score_prog': article['sim_prog'],
+            'bias_level': article['bias_level'], 'final_judgement': article['judgement'],
+            'detected_keywords': article['final_kw'],
+            'score_model_hash': analyzer.model_hash,
+            'score_config_hash': config_hashes.get(article['final_kw']),
+            'dup_cluster': article.get('dup_cluster'),
+            'scores': article['scores'],
+            'keyword': article['keyword'], 'item': article['item'],
+        })
+        return ()
+
+    return write_stage
+
 # ==========================================
 # [수정] Job 함수 (실행 로직)
 # ==========================================
-def job():
-    print(f"\n⏰ [스케줄 실행] 뉴스 수집 및 분석 시작 ({datetime.now()})")
+def job(keywords=None):
+    """
+    keywords: 이번에 수집할 키워드 (None이면 전체)
+    Return: {키워드: 새 기사 수} (실패하면 None)
+    """
+    print(f"\n⏰ [스케줄 실행] 뉴스 수집 및 분석 시작 ({datetime.now()}, 키워드 {len(keywords) if keywords else '전체'}개)")
     
     try:
         # DB 연결 확인
         conn = get_db_connection()
         cur = conn.cursor()
+        ensure_score_stamps(cur)
+        ensure_link_hash(cur)
+        ensure_columns(cur, 'NEWS_ARTICLES', DUP_CLUSTER_COLUMNS)
+        warm_near_dups(cur)
+        if MULTI_KEYWORD_MODE:
+            ensure_keyword_score_table(cur)
         
         # 키워드 파일 로드
         df_conf = pd.read_csv(CONF_FILE) if 'bias_data_final.csv' in CONF_FILE else pd.read_csv(CONF_FILE, encoding='cp949')
+        if keywords is not None:
+            df_conf = df_conf[df_conf['keyword'].isin(keywords)]
+        new_counts.clear()
+        fetched_items.clear()
+        stored_items.clear()
+        
+        counters = {'analyzed': 0}
+        writer = make_writer(conn, counters)
         
-        total_collected = 0
-        analyzed_count = 0
+        # 수집 → 정제 → 분석(배치) → 저장 을 단계별 스레드로 동시에 돌림
+        pipeline = Pipeline([
+            Stage("fetch", fetch_stage, workers=FETCH_WORKERS),
+            Stage("normalize", normalize_stage, workers=NORMALIZE_WORKERS),
+            Stage("score", score_stage, workers=SCORE_WORKERS, batch_size=SCORE_BATCH),
+            Stage("write", make_write_stage(writer), workers=1),
+        ], queue_size=PIPELINE_QUEUE_SIZE)
+        t0 = time.time()
+        pipeline.run(zip(df_conf['keyword'], df_conf['category']))
         
-        for i, row in df_conf.iterrows():
-            keyword = row['keyword']
-            category = row['category']
-            
-            # API 호출 (20개)
-            url = "https://openapi.naver.com/v1/search/news.json"
-            headers = {"X-Naver-Client-Id": NAVER_CLIENT_ID, "X-Naver-Client-Secret": NAVER_CLIENT_SECRET}
-            params = {"query": keyword, "display": 20, "sort": "date"}
-            
-            try:
-                resp = requests.get(url, headers=headers, params=params)
-                if resp.status_code != 200: continue
-                items = resp.json().get('items', [])
-            except:
-                continue
-            
-            for item in items:
-                title = re.sub(r'<.*?>|&quot;|&gt;|&lt;', '', item['title'])
-                desc = re.sub(r'<.*?>|&quot;|&gt;|&lt;', '', item['description'])
-                link = item['originallink'] or item['link']
-                
-                # ★ 스마트 분석 실행
-                sim_cons, sim_prog, detected_kw = calculate_scores_smart(title, desc, keyword)
-                
-                # 1. 차이(편향 레벨) 계산
-                bias_level = sim_cons - sim_prog  # 이게 바로 우리가 원하는 그 점수!
-                
-                # 점수가 0이면 중립, 아니면 판정
-                judgement = 'NEUTRAL'
-                if sim_cons != 0 or sim_prog != 0:
-                    analyzed_count += 1 # 분석 성공 카운트
-                    diff = sim_cons - sim_prog
-                    if diff > 0.02: judgement = 'CONS'
-                    elif diff < -0.02: judgement = 'PROG'
-                
-                # DB 저장 (detected_keywords 컬럼에 실제로 분석한 단어를 넣음)
-                # 주의: detected_kw가 None이면 원래 keyword를 넣음
-                final_kw = detected_kw if detected_kw else keyword
-                
-                sql = """
-                    INSERT INTO NEWS_ARTICLES 
-                    (category, title, link, description, bias_score_cons, bias_score_prog, bias_level, final_judgement, detected_keywords, created_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())
-                """
-                
-                try:
-                    cur.execute(sql, (category, title, link, desc, sim_cons, sim_prog, bias_level, judgement, final_kw))
-                    total_collected += 1
-                except Exception as e:
-                    pass # 중복은 패스
-            
-            if total_collected % 100 == 0:
-                conn.commit()
-            
-            time.sleep(0.05) 
-            
-        conn.commit()
+        writer.close()
         conn.close()
-        print(f"🎉 수집 완료! (총 {total_collected}개 수집 / 그 중 {analyzed_count}개 유효 분석)")
+        update_watermarks()  # 저장까지 끝난 뒤에 기준선 기록
+        watermarks.save()
+        pipeline.report()
+        print(f"   🧬 유사 중복: {near_dups.stats()}")
+        st = writer.stats()
+        print(f"🎉 수집 완료! (총 {st['inserted']}개 수집 / 그 중 {counters['analyzed']}개 유효 분석 / "
+              f"중복 {st['duplicate']}개 / 실패 {st['failed']}개, "
+              f"{time.time() - t0:.1f}초, 남은 쿼터 {naver.quota.remaining}회)")
+        return dict(new_counts)
         
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
+        watermarks.reload()  # 메모리에만 반영된 기준선은 버림 (파일에 저장된 상태로)
+        return None
 
 # ==========================================
-# [스케줄링] 주기 설정
+# [스케줄링] 키워드별 적응형 주기
 # ==========================================
-# 테스트를 위해 10초 뒤에 한 번 실행하고, 그 뒤엔 매일 3번 실행
+# 고정 6시간 주기 대신, 키워드마다 새 기사 속도에 맞춰 다음 실행 시각을 정함
+# (시작하자마자 처음 보는 키워드는 바로 1회 실행, 일정은 cache/bot_schedule.json에서 확인)
 print("⏳ 스케줄러 대기 중... (Ctrl+C로 종료)")
 
-# (1) 즉시 실행 확인용
-job()
-
-# (2) 정해진 시간마다 실행 (예: 6시간마다)
-schedule.every(6).hours.do(job)
+scheduler = KeywordScheduler(
+    analyzer.df_conf['keyword'].tolist(), SCHEDULE_STATE,
+    min_interval=BOT_MIN_INTERVAL, max_interval=BOT_MAX_INTERVAL, default_interval=BOT_DEFAULT_INTERVAL,
+    target_new=BOT_TARGET_NEW, budget_per_hour=BOT_REQUEST_BUDGET_PER_HOUR, cost_per_run=1.5)
+print(scheduler.describe(limit=10))
 
-while True:
-    schedule.run_pending()
-    time.sleep(1)
\ No newline at end of file
+if BOT_SHARDED:
+    # 다음 실행 시각/속도는 DB(KEYWORD_LEASES)가 기준, 이 프로세스는 빌린 키워드만 수집
+    queue = LeaseQueue(get_db_connection, 'bot', lease_seconds=BOT_LEASE_SECONDS)
+    queue.ensure_table()
+    queue.sync_keywords(analyzer.df_conf['keyword'].tolist())
+    print(f"🔀 분산 모드: 작업자 {queue.worker_id} (봇 {BOT_SHARD_ID}, {BOT_SHARDS}개가 한도를 나눠 씀 / "
+          f"임대 {BOT_LEASE_SECONDS}초)")
+    run_leased(queue, scheduler, job, claim_limit=BOT_CLAIM_LIMIT)
+else:
+    scheduler.run_forever(job)
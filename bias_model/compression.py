@@ -0,0 +1,49 @@
+# ==========================================
+# 응답 압축 (Accept-Encoding에 맞춰 brotli / gzip)
+# ==========================================
+# 뉴스 JSON은 한글 본문이 많아서 압축하면 크기가 크게 줄어듭니다.
+# - 브라우저가 보낸 Accept-Encoding(q값 포함)을 보고 br > gzip 순으로 고름
+# - brotli 패키지가 없으면 gzip만 사용 (pip install brotli)
+# - MIN_COMPRESS_SIZE보다 작은 응답은 압축하지 않음 (헤더 비용이 더 큼)
+import gzip
+
+try:
+    import brotli
+except ImportError:
+    brotli = None  # 없으면 gzip만
+
+MIN_COMPRESS_SIZE = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5   # 0~11 (높을수록 작지만 느림, 5 정도가 gzip 6과 비슷한 속도)
+
+SUPPORTED = ('br', 'gzip') if brotli else ('gzip',)
+
+def negotiate(accept_encoding, size=None):
+    """Accept-Encoding 헤더 → 'br' / 'gzip' / None (압축 안 함)"""
+    if not accept_encoding or (size is not None and size < MIN_COMPRESS_SIZE):
+        return None
+    weights = {}
+    for part in accept_encoding.split(','):
+        name, _, params = part.strip().partition(';')
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip().lower()] = q
+    star = weights.get('*', 0.0)
+    best = None
+    for enc in SUPPORTED:   # 같은 q값이면 앞쪽(br)을 우선
+        q = weights.get(enc, star)
+        if q > 0 and (best is None or q > best[1]):
+            best = (enc, q)
+    return best[0] if best else None
+
+def compress(body, encoding):
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)   # mtime 고정 → 같은 입력은 같은 출력
+    return body
@@ -0,0 +1,68 @@
+# ==========================================
+# 데이터 버전 카운터 (API 응답 캐시 무효화용)
+# ==========================================
+# 기사 데이터는 수집/재분석 작업이 저장할 때만 바뀝니다.
+# - 저장하는 쪽: 커밋 직전에 bump_data_version()으로 DATA_VERSIONS의 숫자를 1 올림 (같은 트랜잭션)
+# - API 쪽: VersionWatcher로 그 숫자만 가끔(기본 1초에 1번) 읽어서, 숫자가 바뀌면 캐시된 응답을 버림
+# 그래서 요청마다 기사 테이블을 읽지 않고도 새 기사가 들어오면 1초 안에 반영됩니다.
+import threading
+import time
+
+import pymysql
+
+from score_store import _col
+
+DATA_VERSION_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS DATA_VERSIONS (
+    name VARCHAR(50) NOT NULL PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) DEFAULT CHARSET=utf8mb4;
+"""
+
+NEWS_VERSION = 'news'   # NEWS_ARTICLES (+ NEWS_KEYWORD_SCORES) 내용
+ER_NO_SUCH_TABLE = 1146
+
+def ensure_data_version_table(cur):
+    cur.execute(DATA_VERSION_TABLE_SQL)
+
+def bump_data_version(cur, name=NEWS_VERSION):
+    """버전 +1 (커밋은 호출한 쪽에서 - 데이터 저장과 같은 트랜잭션으로)"""
+    cur.execute("INSERT INTO DATA_VERSIONS (name, version) VALUES (%s, 1) "
+                "ON DUPLICATE KEY UPDATE version = version + 1", (name,))
+
+def read_data_version(cur, name=NEWS_VERSION):
+    """Return: 버전 숫자 (DATA_VERSIONS 테이블이 아직 없으면 None → 캐시를 쓰지 않음)"""
+    try:
+        cur.execute("SELECT version FROM DATA_VERSIONS WHERE name = %s", (name,))
+    except pymysql.err.ProgrammingError as e:
+        if e.args and e.args[0] == ER_NO_SUCH_TABLE:
+            return None   # 수집 작업이 처음 저장할 때 만들어짐
+        raise
+    row = cur.fetchone()
+    return _col(row, 0, 'version') if row else 0
+
+class VersionWatcher:
+    """
+    read()로 읽은 버전을 check_interval초 동안 재사용
+    (읽기에 실패하면 마지막 값을 그대로 쓰고, 한 번도 못 읽었으면 None → 캐시를 쓰지 말라는 뜻)
+    """
+    def __init__(self, read, check_interval=1.0):
+        self.read = read
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._version = None
+        self._checked = 0.0
+
+    def current(self):
+        now = time.monotonic()
+        if now - self._checked < self.check_interval:
+            return self._version
+        with self._lock:
+            if now - self._checked >= self.check_interval:   # 다른 스레드가 방금 읽었으면 생략
+                try:
+                    self._version = self.read()
+                except Exception as e:
+                    print("⚠️ 데이터 버전 확인 실패:", e)
+                self._checked = time.monotonic()
+        return self._version
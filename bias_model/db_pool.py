@@ -0,0 +1,157 @@
+# ==========================================
+# MySQL 연결 풀 (API 서버용)
+# ==========================================
+# 요청마다 pymysql.connect()를 하면 매번 TCP 연결 + 로그인 비용이 들고,
+# 동시 요청이 몰리면 MySQL 최대 연결 수를 다 써버립니다.
+# - 최대 max_size개까지만 연결을 만들고, 나머지 요청은 빈 연결이 생길 때까지 대기 (timeout초 넘으면 PoolTimeout)
+# - 꺼낼 때 검사: 오래 쉬고 있던 연결은 ping으로 살아있는지 확인, max_lifetime이 지난 연결은 새로 만듦
+# - 돌려받을 때 rollback으로 끝나지 않은 트랜잭션 정리
+# - stats()로 사용 중 / 대기 중 요청 수 / 대기 시간 확인
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import pymysql
+
+class PoolTimeout(Exception):
+    """timeout초 안에 빈 연결을 못 얻음"""
+
+class ConnectionPool:
+    def __init__(self, db_config, max_size=10, timeout=10.0, max_lifetime=1800, ping_after=5.0, connect=None):
+        """
+        - db_config: pymysql.connect(**db_config)에 넘길 설정
+        - max_lifetime: 연결 최대 수명(초) - MySQL wait_timeout보다 짧게
+        - ping_after: 이 시간(초) 넘게 쉬었던 연결은 꺼낼 때 ping으로 확인 (0이면 매번)
+        - connect: 연결을 만드는 함수 (기본 pymysql.connect(**db_config))
+        """
+        self.db_config = db_config
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.ping_after = ping_after
+        self._connect = connect or (lambda: pymysql.connect(**db_config))
+
+        self._cond = threading.Condition()
+        self._idle = deque()     # (연결, 만든 시각, 반납 시각) - 최근 반납한 것부터 씀 (LIFO)
+        self._born = {}          # id(연결) -> 만든 시각 (사용 중인 연결 포함)
+        self._in_use = 0
+        self._waiters = 0
+        self._stats = {'checkouts': 0, 'created': 0, 'discarded': 0, 'timeouts': 0,
+                       'wait_total': 0.0, 'wait_max': 0.0, 'waiters_max': 0}
+
+    # ------------------------------------------
+    # 내부: 연결 만들기 / 버리기 / 검사
+    # ------------------------------------------
+    def _discard(self, conn):
+        self._born.pop(id(conn), None)
+        self._stats['discarded'] += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _usable(self, conn, born, released, now):
+        if now - born > self.max_lifetime:
+            return False
+        if now - released >= self.ping_after:
+            try:
+                conn.ping(reconnect=False)
+            except Exception:
+                return False
+        return True
+
+    # ------------------------------------------
+    # 꺼내기 / 돌려주기
+    # ------------------------------------------
+    def acquire(self):
+        start = time.perf_counter()
+        deadline = start + self.timeout
+        with self._cond:
+            self._waiters += 1
+            self._stats['waiters_max'] = max(self._stats['waiters_max'], self._waiters)
+            try:
+                while not self._idle and self._in_use + len(self._idle) >= self.max_size:
+                    left = deadline - time.perf_counter()
+                    if left <= 0:
+                        self._stats['timeouts'] += 1
+                        raise PoolTimeout(f"{self.timeout}초 안에 DB 연결을 얻지 못했습니다 (사용 중 {self._in_use}/{self.max_size})")
+                    self._cond.wait(left)
+                idle = self._idle.pop() if self._idle else None
+                self._in_use += 1  # 자리를 먼저 잡고, 검사/연결은 락 밖에서
+            finally:
+                self._waiters -= 1
+
+        try:
+            conn = None
+            if idle:
+                conn, born, released = idle
+                if not self._usable(conn, born, released, time.time()):
+                    with self._cond:
+                        self._discard(conn)
+                    conn = None
+            if conn is None:
+                conn = self._connect()
+                with self._cond:
+                    self._born[id(conn)] = time.time()
+                    self._stats['created'] += 1
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+        waited = time.perf_counter() - start
+        with self._cond:
+            self._stats['checkouts'] += 1
+            self._stats['wait_total'] += waited
+            self._stats['wait_max'] = max(self._stats['wait_max'], waited)
+        return conn
+
+    def release(self, conn, broken=False):
+        """broken=True면 (에러 난 연결) 다시 쓰지 않고 닫음"""
+        if not broken:
+            try:
+                conn.rollback()
+            except Exception:
+                broken = True
+        with self._cond:
+            self._in_use -= 1
+            born = self._born.get(id(conn))
+            if broken or born is None or time.time() - born > self.max_lifetime:
+                self._discard(conn)
+            else:
+                self._idle.append((conn, born, time.time()))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        """with pool.connection() as conn: ... (끝나면 자동 반납)"""
+        conn = self.acquire()
+        try:
+            yield conn
+        except pymysql.err.OperationalError:
+            self.release(conn, broken=True)   # 연결 끊김 등 → 풀에 돌려놓지 않음
+            raise
+        except BaseException:
+            self.release(conn)
+            raise
+        else:
+            self.release(conn)
+
+    # ------------------------------------------
+    # 확인 / 종료
+    # ------------------------------------------
+    def stats(self):
+        with self._cond:
+            st = dict(self._stats)
+            st.update(size=self._in_use + len(self._idle), max_size=self.max_size,
+                      in_use=self._in_use, idle=len(self._idle), waiters=self._waiters)
+        st['wait_avg_ms'] = round(st.pop('wait_total') / st['checkouts'] * 1000, 3) if st['checkouts'] else 0.0
+        st['wait_max_ms'] = round(st.pop('wait_max') * 1000, 3)
+        return st
+
+    def close(self):
+        with self._cond:
+            while self._idle:
+                self._discard(self._idle.pop()[0])
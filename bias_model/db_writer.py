@@ -0,0 +1,240 @@
+# ==========================================
+# 기사 대량 저장 (버퍼 + 여러 행 INSERT + 링크 해시 중복 방지)
+# ==========================================
+# - 같은 기사인지는 정규화한 링크의 해시(link_hash, UNIQUE 인덱스)로 판단
+# - 기사를 모아뒀다가 개수(flush_size)나 시간(flush_interval)이 차면
+#   INSERT IGNORE / INSERT ... ON DUPLICATE KEY UPDATE 한 문장으로 저장 후 커밋
+# - 새로 저장 / 중복 / 실패 건수를 따로 집계 (예전처럼 예외를 "중복은 패스"로 삼키지 않음)
+import hashlib
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from data_version import NEWS_VERSION, bump_data_version, ensure_data_version_table
+from score_store import _col, ensure_columns
+
+LINK_HASH_COLUMNS = {'link_hash': "CHAR(40) NULL"}
+LINK_HASH_INDEX = 'uq_link_hash'
+# 유사 중복 묶음 (near_dup의 대표 기사 링크 해시 앞 16자리)
+DUP_CLUSTER_COLUMNS = {'dup_cluster': "CHAR(16) NULL"}
+
+# 같은 기사인데 붙었다 말았다 하는 추적용 파라미터
+TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid')
+
+def normalize_link(link):
+    """스킴/호스트 소문자, 추적 파라미터·#조각·끝 슬래시 제거, 쿼리 정렬"""
+    link = (link or '').strip()
+    if not link:
+        return ''
+    parts = urlsplit(link)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if not k.lower().startswith(TRACKING_PARAMS))
+    path = parts.path.rstrip('/') or '/'
+    scheme = 'https' if parts.scheme.lower() in ('http', 'https') else parts.scheme.lower()
+    return urlunsplit((scheme, parts.netloc.lower(), path, urlencode(query), ''))
+
+def link_hash(link):
+    return hashlib.sha1(normalize_link(link).encode('utf-8')).hexdigest()
+
+def ensure_link_hash(cur, table='NEWS_ARTICLES', backfill_size=5000):
+    """
+    link_hash 컬럼 + UNIQUE 인덱스 준비 (처음 한 번만 기존 기사에 해시를 채움)
+    이미 중복으로 들어가 있던 옛 기사는 가장 먼저 들어온 것만 해시를 갖고 나머지는 NULL로 둠
+    """
+    ensure_columns(cur, table, LINK_HASH_COLUMNS)
+    cur.execute(
+        "SELECT 1 FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s LIMIT 1",
+        (table, LINK_HASH_INDEX))
+    if cur.fetchone():
+        return
+
+    print(f"🔧 {table}.link_hash 채우는 중 (최초 1회)...")
+    seen = set()
+    last_id = 0
+    while True:
+        cur.execute(f"SELECT id, link FROM {table} WHERE id > %s ORDER BY id LIMIT %s", (last_id, backfill_size))
+        rows = cur.fetchall()
+        if not rows:
+            break
+        updates = []
+        for row in rows:
+            h = link_hash(_col(row, 1, 'link'))
+            if h not in seen:
+                seen.add(h)
+                updates.append((h, _col(row, 0, 'id')))
+        if updates:
+            cur.executemany(f"UPDATE {table} SET link_hash = %s WHERE id = %s", updates)
+        last_id = _col(rows[-1], 0, 'id')
+    cur.execute(f"ALTER TABLE {table} ADD UNIQUE KEY {LINK_HASH_INDEX} (link_hash)")
+
+class ArticleWriter:
+    """
+    기사 버퍼 저장기
+    - columns: 저장할 컬럼 (row dict의 키와 같음, link_hash는 자동으로 붙음)
+    - now_columns: NOW()로 채울 컬럼 (예: created_at)
+    - update_columns: 지정하면 중복 기사일 때 이 컬럼들을 갱신 (ON DUPLICATE KEY UPDATE),
+                      없으면 INSERT IGNORE로 건너뜀
+    - on_inserted: 새로 저장된 [(기사 id, row), ...]를 받는 콜백 (같은 트랜잭션 안에서 호출)
+    - data_version: 저장된 게 있으면 커밋 전에 올릴 데이터 버전 이름 (API 캐시 무효화, None이면 안 올림)
+    - on_flushed: 커밋 후 (DB에 들어갔거나 이미 있던 row 리스트, 저장 실패한 row 리스트)를 받는 콜백
+    """
+    def __init__(self, conn, columns, table='NEWS_ARTICLES', now_columns=(), update_columns=None,
+                 flush_size=200, flush_interval=5.0, on_inserted=None, data_version=NEWS_VERSION,
+                 on_flushed=None):
+        self.conn = conn
+        self.cur = conn.cursor()
+        self.table = table
+        self.columns = list(columns) + ['link_hash']
+        self.now_columns = list(now_columns)
+        self.update_columns = list(update_columns or [])
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.on_inserted = on_inserted
+        self.on_flushed = on_flushed
+        self.data_version = data_version
+        if data_version:
+            ensure_data_version_table(self.cur)
+
+        self.buffer = {}          # link_hash -> row (버퍼 안 중복도 여기서 걸러짐)
+        self.buffer_dups = []     # 버퍼 안 중복으로 걸러진 row (on_flushed에 "이미 있음"으로 알림)
+        self.first_buffered = None
+        self.inserted = 0
+        self.duplicate = 0
+        self.failed = 0
+        self.flushes = 0
+        self._error_shown = False
+
+        col_sql = ', '.join(self.columns + self.now_columns)
+        self._row_sql = '(' + ', '.join(['%s'] * len(self.columns) + ['NOW()'] * len(self.now_columns)) + ')'
+        verb = 'INSERT' if self.update_columns else 'INSERT IGNORE'
+        self._insert_sql = f"{verb} INTO {table} ({col_sql}) VALUES "
+        self._update_sql = ''
+        if self.update_columns:
+            self._update_sql = ' ON DUPLICATE KEY UPDATE ' + ', '.join(
+                f"{c} = VALUES({c})" for c in self.update_columns)
+
+    # ------------------------------------------
+    # 쌓기
+    # ------------------------------------------
+    def add(self, row):
+        h = link_hash(row['link'])
+        if h in self.buffer:
+            self.duplicate += 1
+            self.buffer_dups.append(row)
+        else:
+            self.buffer[h] = row
+            if self.first_buffered is None:
+                self.first_buffered = time.monotonic()
+        if len(self.buffer) >= self.flush_size or \
+                time.monotonic() - self.first_buffered >= self.flush_interval:
+            self.flush()
+
+    # ------------------------------------------
+    # 저장
+    # ------------------------------------------
+    def _values(self, h, row):
+        return [row[c] for c in self.columns[:-1]] + [h]
+
+    def _existing(self, hashes):
+        """이미 DB에 있는 링크 해시"""
+        marks = ', '.join(['%s'] * len(hashes))
+        self.cur.execute(f"SELECT link_hash FROM {self.table} WHERE link_hash IN ({marks})", hashes)
+        return {_col(r, 0, 'link_hash') for r in self.cur.fetchall()}
+
+    def _ids(self, hashes):
+        marks = ', '.join(['%s'] * len(hashes))
+        self.cur.execute(f"SELECT id, link_hash FROM {self.table} WHERE link_hash IN ({marks})", hashes)
+        return {_col(r, 1, 'link_hash'): _col(r, 0, 'id') for r in self.cur.fetchall()}
+
+    def _insert(self, items):
+        """여러 행 INSERT 1문장. 영향받은 행 수를 돌려줌"""
+        sql = self._insert_sql + ', '.join([self._row_sql] * len(items)) + self._update_sql
+        params = [v for h, row in items for v in self._values(h, row)]
+        return self.cur.execute(sql, params)
+
+    def _report_error(self, e, row):
+        if not self._error_shown:
+            print(f"\n[❌ 저장 실패 원인]: {e}")
+            print(f"[문제가 된 데이터]: {row.get('title')}")
+            self._error_shown = True
+
+    def flush(self):
+        """
+        버퍼를 한 트랜잭션으로 저장
+        (중간에 오류가 나면 롤백하고 버퍼 전체를 실패로 집계 → on_flushed로도 실패로 알림)
+        """
+        if not self.buffer:
+            return
+        items = list(self.buffer.items())
+        buffer_dups = self.buffer_dups
+        self.flushes += 1
+        try:
+            inserted_count, duplicate_count, failed_rows = self._flush_items(items)
+        except Exception as e:
+            try:
+                self.conn.rollback()
+            except Exception:
+                pass   # 연결이 끊긴 경우 등
+            self._report_error(e, items[0][1])
+            self.failed += len(items) + len(buffer_dups)
+            self.duplicate -= len(buffer_dups)   # add()에서 중복으로 셌던 것도 저장 안 됐으므로 실패로
+            stored, failed_rows = [], [row for _, row in items] + buffer_dups
+        else:
+            self.inserted += inserted_count
+            self.duplicate += duplicate_count
+            self.failed += len(failed_rows)
+            failed_ids = {id(row) for row in failed_rows}
+            stored = [row for _, row in items if id(row) not in failed_ids] + buffer_dups
+        finally:
+            # 커밋이 됐든 실패로 집계했든 이 묶음은 끝 (같은 행을 계속 다시 넣지 않음)
+            self.buffer = {}
+            self.buffer_dups = []
+            self.first_buffered = None
+
+        if self.on_flushed:
+            self.on_flushed(stored, failed_rows)
+
+    def _flush_items(self, items):
+        """Return: (새로 저장된 수, 중복 수, 실패한 row 리스트) - 커밋까지 끝나야 돌아옴"""
+        existing = self._existing([h for h, _ in items])
+        # 갱신 모드면 중복 기사도 같이 넣어서 갱신, 아니면 새 기사만
+        todo = items if self.update_columns else [(h, row) for h, row in items if h not in existing]
+        ok = []
+        failed_rows = []
+        affected = 0
+        if todo:
+            try:
+                affected = self._insert(todo)
+                ok = todo
+            except Exception:
+                # 여러 행 중 하나가 문제면 한 건씩 다시 넣어서 문제 행만 실패 처리
+                for h, row in todo:
+                    try:
+                        affected += self._insert([(h, row)])
+                        ok.append((h, row))
+                    except Exception as e:
+                        failed_rows.append(row)
+                        self._report_error(e, row)
+
+        new = [(h, row) for h, row in ok if h not in existing]
+        if self.update_columns:
+            inserted_count = len(new)
+        else:
+            # 확인 후 다른 프로세스가 먼저 넣은 기사는 IGNORE로 빠짐 -> 영향받은 행 수가 정확한 저장 건수
+            inserted_count = min(affected, len(new))
+        duplicate_count = len(items) - len(failed_rows) - inserted_count
+
+        if new and self.on_inserted:
+            ids = self._ids([h for h, _ in new])
+            self.on_inserted(self.cur, [(ids[h], row) for h, row in new if h in ids])
+        if self.data_version and (inserted_count or (self.update_columns and ok)):
+            bump_data_version(self.cur, self.data_version)
+        self.conn.commit()
+        return inserted_count, duplicate_count, failed_rows
+
+    def close(self):
+        self.flush()
+
+    def stats(self):
+        return {'inserted': self.inserted, 'duplicate': self.duplicate,
+                'failed': self.failed, 'flushes': self.flushes}
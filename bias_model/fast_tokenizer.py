@@ -0,0 +1,52 @@
+# ==========================================
+# JVM 없이 동작하는 빠른 토크나이저 (모델 어휘 최장일치)
+# ==========================================
+# 분석에 쓰이는 단어는 어차피 "Word2Vec 어휘에 있는 단어"뿐이므로,
+# 형태소 분석기 대신 어휘 사전에서 가장 긴 단어를 앞에서부터 찾아 자릅니다.
+#  - 어휘 dict(token_to_row)를 그대로 재사용 -> 트라이를 따로 만들지 않아 메모리 추가 없음
+#  - 어휘에 실제로 있는 단어 길이만 (긴 것부터) 확인 -> 위치당 몇 번의 해시 조회로 끝남
+import re
+
+# 한글/영문/숫자 덩어리(어절 비슷한 단위)만 대상으로 함
+_RUN_PATTERN = re.compile(r'[가-힣A-Za-z0-9]+')
+
+class VocabTokenizer:
+    def __init__(self, vocab, extra_words=()):
+        """
+        - vocab: 모델 어휘 (dict 또는 set, `in` 검사만 사용)
+        - extra_words: 추가로 인식할 단어 (bias_data_final.csv의 키워드/반대어)
+          띄어쓰기가 들어간 구문은 어절 단위 매칭이라 제외됩니다.
+        """
+        self.vocab = vocab
+        self.extra = {w for w in extra_words if w and ' ' not in w and w not in vocab}
+        lengths = {len(w) for w in vocab} | {len(w) for w in self.extra}
+        # 긴 단어부터 시도 (최장일치)
+        self.lengths = sorted((n for n in lengths if n > 0), reverse=True)
+
+    def _known(self, word):
+        return word in self.vocab or word in self.extra
+
+    def nouns(self, text):
+        """twitter.nouns()를 대신하는 함수 (어휘에 있는 단어 목록을 등장 순서대로 반환)"""
+        tokens = []
+        for match in _RUN_PATTERN.finditer(text or ''):
+            run = match.group()
+            # 한 글자 단어는 어절 전체가 그 글자일 때만 인정 (예: "4대강 보 해체"의 "보")
+            if len(run) == 1:
+                if self._known(run):
+                    tokens.append(run)
+                continue
+
+            i, n = 0, len(run)
+            while i < n:
+                for size in self.lengths:
+                    if size < 2 or i + size > n:
+                        continue
+                    word = run[i:i + size]
+                    if self._known(word):
+                        tokens.append(word)
+                        i += size
+                        break
+                else:
+                    i += 1  # 아는 단어가 없으면 한 글자 건너뜀 (조사 등)
+        return tokens
@@ -0,0 +1,242 @@
+# ==========================================
+# 키워드 작업 임대(lease) 테이블 - 여러 프로세스/서버로 수집 나누기
+# ==========================================
+# 봇을 여러 개 띄워도 같은 키워드를 동시에 수집하지 않도록,
+# 작업자가 KEYWORD_LEASES 테이블에서 SELECT ... FOR UPDATE SKIP LOCKED로 키워드를 "빌려" 갑니다.
+# - 빌린 동안은 heartbeat로 lease_until을 계속 연장
+# - 작업자가 죽으면 lease_until이 지나서 다른 작업자가 다시 가져감 (만료)
+# - 끝나면 다음 실행 시각(next_due)과 새 기사 속도(rate)를 기록하고 반납
+# 시간은 모두 DB의 NOW() 기준 (서버마다 시계가 달라도 안전)
+# MySQL 8.0+ (SKIP LOCKED) 필요
+import os
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+from score_store import _col
+
+LEASE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS KEYWORD_LEASES (
+    source VARCHAR(30) NOT NULL,
+    keyword VARCHAR(100) NOT NULL,
+    owner VARCHAR(100) NULL,
+    lease_until DATETIME NULL,
+    heartbeat_at DATETIME NULL,
+    next_due DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_done DATETIME NULL,
+    rate DOUBLE NULL,
+    attempts INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (source, keyword),
+    KEY idx_due (source, next_due)
+) DEFAULT CHARSET=utf8mb4;
+"""
+
+DEFAULT_LEASE_SECONDS = 600
+
+def default_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+class LeaseQueue:
+    """
+    - connect: 새 pymysql 연결을 돌려주는 함수 (heartbeat 스레드는 자기 연결을 따로 씀)
+    - source: 작업 종류 ('bot', 'auto' 등) - 같은 테이블을 같이 써도 서로 안 섞임
+    """
+    def __init__(self, connect, source, worker_id=None, lease_seconds=DEFAULT_LEASE_SECONDS):
+        self.connect = connect
+        self.source = source
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self.conn = connect()
+
+    def _execute(self, sql, params=(), conn=None):
+        conn = conn or self.conn
+        cur = conn.cursor()
+        n = cur.execute(sql, params)
+        conn.commit()
+        return n
+
+    # ------------------------------------------
+    # 준비
+    # ------------------------------------------
+    def ensure_table(self):
+        self._execute(LEASE_TABLE_SQL)
+
+    def sync_keywords(self, keywords):
+        """설정 파일의 키워드를 큐에 등록 (이미 있으면 그대로, 새 키워드는 바로 실행 대상)"""
+        keywords = list(dict.fromkeys(keywords))
+        if not keywords:
+            return
+        cur = self.conn.cursor()
+        cur.executemany("INSERT IGNORE INTO KEYWORD_LEASES (source, keyword, next_due) VALUES (%s, %s, NOW())",
+                        [(self.source, kw) for kw in keywords])
+        self.conn.commit()
+
+    # ------------------------------------------
+    # 빌리기 / 연장 / 반납
+    # ------------------------------------------
+    def claim(self, limit=10):
+        """
+        실행할 때가 됐고 아무도 안 빌린(또는 임대가 만료된) 키워드를 최대 limit개 빌림
+        Return: [{'keyword', 'rate', 'last_done'(유닉스 시간 또는 None)}, ...]
+        """
+        cur = self.conn.cursor()
+        try:
+            cur.execute("""
+                SELECT keyword, rate, UNIX_TIMESTAMP(last_done) AS last_done FROM KEYWORD_LEASES
+                WHERE source = %s AND next_due <= NOW() AND (lease_until IS NULL OR lease_until < NOW())
+                ORDER BY next_due
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            """, (self.source, limit))
+            rows = cur.fetchall()
+            claimed = [{'keyword': _col(r, 0, 'keyword'), 'rate': _col(r, 1, 'rate'),
+                        'last_done': None if _col(r, 2, 'last_done') is None else float(_col(r, 2, 'last_done'))}
+                       for r in rows]
+            if claimed:
+                marks = ', '.join(['%s'] * len(claimed))
+                cur.execute(f"""
+                    UPDATE KEYWORD_LEASES
+                    SET owner = %s, lease_until = NOW() + INTERVAL %s SECOND, heartbeat_at = NOW(),
+                        attempts = attempts + 1
+                    WHERE source = %s AND keyword IN ({marks})
+                """, [self.worker_id, self.lease_seconds, self.source] + [c['keyword'] for c in claimed])
+            self.conn.commit()
+            return claimed
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def heartbeat(self, keywords, conn=None):
+        """임대 연장. Return: 아직 내가 들고 있는 키워드 수 (만료돼서 뺏겼으면 줄어듦)"""
+        keywords = list(keywords)
+        if not keywords:
+            return 0
+        marks = ', '.join(['%s'] * len(keywords))
+        return self._execute(f"""
+            UPDATE KEYWORD_LEASES SET lease_until = NOW() + INTERVAL %s SECOND, heartbeat_at = NOW()
+            WHERE source = %s AND owner = %s AND keyword IN ({marks})
+        """, [self.lease_seconds, self.source, self.worker_id] + keywords, conn)
+
+    def complete(self, keyword, next_in_seconds, rate=None):
+        """작업 완료: next_in_seconds 뒤에 다시 실행 대상이 되도록 반납"""
+        return self._execute("""
+            UPDATE KEYWORD_LEASES
+            SET owner = NULL, lease_until = NULL, last_done = NOW(), attempts = 0,
+                next_due = NOW() + INTERVAL %s SECOND, rate = %s
+            WHERE source = %s AND keyword = %s AND owner = %s
+        """, (int(next_in_seconds), rate, self.source, keyword, self.worker_id))
+
+    def release(self, keyword, retry_in_seconds=0):
+        """작업 실패: 기록은 그대로 두고 retry_in_seconds 뒤에 다시 시도"""
+        return self._execute("""
+            UPDATE KEYWORD_LEASES
+            SET owner = NULL, lease_until = NULL, next_due = NOW() + INTERVAL %s SECOND
+            WHERE source = %s AND keyword = %s AND owner = %s
+        """, (int(retry_in_seconds), self.source, keyword, self.worker_id))
+
+    @contextmanager
+    def heartbeating(self, keywords, interval=None):
+        """with 블록 동안 백그라운드 스레드가 임대를 계속 연장"""
+        interval = interval or max(1, self.lease_seconds // 3)
+        stop = threading.Event()
+
+        def beat():
+            conn = self.connect()
+            try:
+                while not stop.wait(interval):
+                    try:
+                        self.heartbeat(keywords, conn)
+                    except Exception as e:
+                        print(f"⚠️ 임대 연장 실패: {e}")
+            finally:
+                conn.close()
+
+        thread = threading.Thread(target=beat, daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def snapshot(self):
+        """[(keyword, owner, lease_until, next_due, rate)] 다음 실행 순 (확인용)"""
+        cur = self.conn.cursor()
+        cur.execute("""
+            SELECT keyword, owner, lease_until, next_due, rate FROM KEYWORD_LEASES
+            WHERE source = %s ORDER BY next_due
+        """, (self.source,))
+        rows = cur.fetchall()
+        self.conn.commit()
+        return [tuple(_col(r, i, name) for i, name in enumerate(['keyword', 'owner', 'lease_until', 'next_due', 'rate']))
+                for r in rows]
+
+    def reconnect(self):
+        """DB 오류 뒤 연결을 새로 만듦 (끊긴 연결을 계속 쓰지 않도록)"""
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+        self.conn = self.connect()
+
+    def close(self):
+        self.conn.close()
+
+def _recover(queue):
+    try:
+        queue.reconnect()
+    except Exception as e:
+        print(f"⚠️ DB 재연결 실패: {e}")
+
+def run_leased(queue, scheduler, run_keywords, claim_limit=10, idle_sleep=30):
+    """
+    임대 큐에서 키워드를 빌려 실행하는 작업자 루프 (KeywordScheduler로 다음 실행 시각 계산)
+    - run_keywords(키워드 리스트) -> {키워드: 새 기사 수} (None이면 전체 실패)
+    """
+    while True:
+        try:
+            claimed = queue.claim(claim_limit)
+        except Exception as e:
+            # 일시적인 DB 오류 / 잠금 대기 초과 → 작업자를 죽이지 않고 잠시 뒤 다시
+            print(f"⚠️ 키워드 임대 실패: {e} ({idle_sleep}초 뒤 다시 시도)")
+            _recover(queue)
+            time.sleep(idle_sleep)
+            continue
+        if not claimed:
+            time.sleep(idle_sleep)
+            continue
+        keywords = [c['keyword'] for c in claimed]
+        for c in claimed:
+            # 다른 작업자가 마지막으로 기록한 속도/실행 시각을 이어받음
+            scheduler.adopt(c['keyword'], c['rate'], c['last_done'])
+        print(f"📥 [{queue.worker_id}] 키워드 {len(keywords)}개 임대: {', '.join(keywords)}")
+
+        try:
+            with queue.heartbeating(keywords):
+                counts = run_keywords(keywords)
+        except Exception as e:
+            print(f"❌ 실행 실패: {e}")
+            counts = None
+
+        unfinished = []
+        for kw in keywords:
+            try:
+                if counts is not None and kw in counts:
+                    scheduler.record(kw, counts[kw])
+                    queue.complete(kw, scheduler.interval(kw), scheduler.state[kw]['rate'])
+                else:
+                    queue.release(kw, scheduler.min_interval)
+            except Exception as e:
+                print(f"⚠️ '{kw}' 반납 실패: {e}")
+                unfinished.append(kw)
+        if unfinished:
+            # 연결을 다시 만들어서 반납 (그래도 안 되면 임대 만료 후 다른 작업자가 가져감)
+            _recover(queue)
+            for kw in unfinished:
+                try:
+                    queue.release(kw, scheduler.min_interval)
+                except Exception as e:
+                    print(f"⚠️ '{kw}' 반납 재시도 실패 (임대 만료 후 다시 실행됨): {e}")
+            time.sleep(idle_sleep)
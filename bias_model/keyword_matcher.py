@@ -0,0 +1,131 @@
+# ==========================================
+# 키워드/동의어/반대어 다중 패턴 매처 (Aho-Corasick)
+# ==========================================
+# 기존에는 사전의 단어 하나하나마다 `word in text`를 돌려서
+# (사전 크기 x 기사 길이) 만큼 문자열 검색을 했습니다.
+# 모든 단어를 하나의 오토마톤으로 묶어두면 기사 한 번 훑기로 전부 찾을 수 있습니다.
+from collections import deque, namedtuple
+
+import pandas as pd
+
+# start/end: 기사 내 위치 (text[start:end] == word), payloads: 이 단어에 걸린 정보 목록
+Match = namedtuple('Match', ['start', 'end', 'word', 'payloads'])
+
+class KeywordMatcher:
+    def __init__(self):
+        self._goto = [{}]       # 상태별 다음 글자 -> 다음 상태
+        self._fail = [0]        # 실패 링크
+        self._out = [[]]        # 상태에서 끝나는 단어 번호 목록
+        self.words = []         # 단어 번호 -> 단어
+        self.payloads = []      # 단어 번호 -> payload 목록
+        self._word_ids = {}
+        self._built = False
+
+    def add(self, word, payload):
+        """단어와 정보(payload dict)를 등록 (같은 단어를 여러 번 넣으면 payload가 쌓임)"""
+        word = str(word).strip()
+        if not word:
+            return
+        if word in self._word_ids:
+            self.payloads[self._word_ids[word]].append(payload)
+            return
+
+        word_id = len(self.words)
+        self._word_ids[word] = word_id
+        self.words.append(word)
+        self.payloads.append([payload])
+
+        state = 0
+        for ch in word:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(word_id)
+        self._built = False
+
+    def build(self):
+        """실패 링크 계산 (BFS). add가 끝난 뒤 한 번 호출"""
+        queue = deque()
+        for nxt in self._goto[0].values():
+            self._fail[nxt] = 0
+            queue.append(nxt)
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+        self._built = True
+        return self
+
+    def find_all(self, text):
+        """기사 한 번 훑기로 모든 등장 위치를 반환 (겹치는 단어도 모두 포함)"""
+        if not self._built:
+            self.build()
+        goto, fail, out = self._goto, self._fail, self._out
+        matches = []
+        state = 0
+        for i, ch in enumerate(text or ''):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for word_id in out[state]:
+                word = self.words[word_id]
+                matches.append(Match(i + 1 - len(word), i + 1, word, self.payloads[word_id]))
+        return matches
+
+    def matched_payloads(self, text, kind=None):
+        """
+        등장한 단어별 payload를 한 번씩만 반환 (`word in text`와 같은 의미)
+        - kind: 'dictionary' / 'keyword' / 'antonym' 중 하나만 골라볼 때 사용
+        """
+        seen = set()
+        result = []
+        for m in self.find_all(text):
+            if m.word in seen:
+                continue
+            seen.add(m.word)
+            for payload in m.payloads:
+                if kind is None or payload['kind'] == kind:
+                    result.append((m.word, payload))
+        return result
+
+    def first_keyword(self, *texts):
+        """
+        여러 텍스트 중 어디든 등장한 설정 키워드 중 CSV 순서상 가장 앞선 키워드
+        (update_db_scores의 '먼저 나오는 키워드 우선' 규칙과 동일)
+        """
+        best = None
+        for text in texts:
+            for _, payload in self.matched_payloads(text, 'keyword'):
+                if best is None or payload['priority'] < best['priority']:
+                    best = payload
+        return best['keyword'] if best else None
+
+def build_matcher(bias_dict=None, df_conf=None):
+    """
+    main.load_bias_dictionary 결과(단어 -> 성향/가중치)와
+    bias_data_final.csv(키워드/반대어)를 하나의 매처로 묶음
+    """
+    matcher = KeywordMatcher()
+    if bias_dict:
+        for order, (word, info) in enumerate(bias_dict.items()):
+            matcher.add(word, {'kind': 'dictionary', 'order': order,
+                               'tendency': info['tendency'], 'weight': info['weight']})
+    if df_conf is not None:
+        for priority, row in enumerate(df_conf.itertuples(index=False)):
+            keyword = row.keyword
+            matcher.add(keyword, {'kind': 'keyword', 'keyword': keyword, 'priority': priority,
+                                  'tendency': row.tendency, 'weight': row.weight})
+            if pd.notna(row.antonym):
+                for ant in str(row.antonym).split(','):
+                    matcher.add(ant, {'kind': 'antonym', 'keyword': keyword, 'priority': priority})
+    return matcher.build()
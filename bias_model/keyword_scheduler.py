@@ -0,0 +1,169 @@
+# ==========================================
+# 키워드별 적응형 수집 주기 스케줄러
+# ==========================================
+# schedule.every(6).hours 처럼 모든 키워드를 같은 주기로 돌리면
+# 조용한 키워드도 속보가 쏟아지는 키워드와 같은 API 호출을 씁니다.
+# - 키워드마다 최근 실행들의 "시간당 새 기사 수"(지수이동평균)를 기록하고
+# - 한 번 돌 때 target_new개 정도의 새 기사가 쌓이도록 주기를 정함 (min~max 사이)
+# - 전체 키워드의 시간당 호출 수가 budget_per_hour를 넘으면 모든 주기를 같은 비율로 늘림
+# - 키워드별 다음 실행 시각은 상태 파일(JSON)과 describe()로 확인
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+RATE_ALPHA = 0.4   # 새 기사 속도 지수이동평균 가중치
+
+class KeywordScheduler:
+    def __init__(self, keywords, state_path, min_interval=1800, max_interval=86400, default_interval=6 * 3600,
+                 target_new=20, budget_per_hour=None, cost_per_run=1.0):
+        """
+        - 주기(interval)는 초 단위
+        - target_new: 한 번 실행할 때 모이길 바라는 새 기사 수 (보통 요청 display 크기)
+        - budget_per_hour: 시간당 최대 API 호출 수 (None이면 제한 없음)
+        - cost_per_run: 키워드 1번 실행에 드는 평균 호출 수
+        """
+        self.state_path = state_path
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.default_interval = default_interval
+        self.target_new = target_new
+        self.budget_per_hour = budget_per_hour
+        self.cost_per_run = cost_per_run
+        self._lock = threading.Lock()
+
+        saved = {}
+        if state_path and os.path.exists(state_path):
+            try:
+                with open(state_path, encoding='utf-8') as f:
+                    saved = json.load(f)
+            except (OSError, ValueError):
+                print(f"⚠️ 스케줄 상태 파일을 읽지 못해 새로 시작합니다: {state_path}")
+        now = time.time()
+        # 새 키워드는 바로 실행 (next_due = 지금)
+        self.state = {kw: saved.get(kw, {'rate': None, 'last_run': None, 'next_due': now})
+                      for kw in dict.fromkeys(keywords)}
+        self._rebalance()
+
+    # ------------------------------------------
+    # 주기 계산
+    # ------------------------------------------
+    def _raw_interval(self, st):
+        if st['rate'] is None:
+            return self.default_interval
+        if st['rate'] <= 0:
+            return self.max_interval
+        interval = self.target_new / st['rate'] * 3600
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    def _budget_scale(self):
+        """전체 호출량이 예산을 넘으면 주기를 늘릴 배율 (>= 1)"""
+        if not self.budget_per_hour:
+            return 1.0
+        calls_per_hour = sum(3600 / self._raw_interval(st) for st in self.state.values()) * self.cost_per_run
+        return max(1.0, calls_per_hour / self.budget_per_hour)
+
+    def interval(self, keyword):
+        return self._raw_interval(self.state[keyword]) * self._scale
+
+    def _rebalance(self):
+        """예산 배율을 다시 계산하고, 이미 잡힌 다음 실행 시각도 새 주기에 맞춰 당김/미룸"""
+        self._scale = self._budget_scale()
+        for kw, st in self.state.items():
+            if st['last_run'] is not None:
+                st['next_due'] = st['last_run'] + self.interval(kw)
+
+    # ------------------------------------------
+    # 실행
+    # ------------------------------------------
+    def due(self, now=None, limit=None):
+        """지금 실행할 키워드 (오래 밀린 것부터)"""
+        now = now or time.time()
+        with self._lock:
+            ready = sorted((st['next_due'], kw) for kw, st in self.state.items() if st['next_due'] <= now)
+        keywords = [kw for _, kw in ready]
+        return keywords[:limit] if limit else keywords
+
+    def record(self, keyword, new_count, now=None):
+        """실행 결과(새 기사 수)로 속도를 갱신하고 다음 실행 시각을 정함"""
+        now = now or time.time()
+        with self._lock:
+            st = self.state.setdefault(keyword, {'rate': None, 'last_run': None, 'next_due': now})
+            if st['last_run'] is not None:
+                hours = max((now - st['last_run']) / 3600, 1 / 60)
+                rate = new_count / hours
+                st['rate'] = rate if st['rate'] is None else RATE_ALPHA * rate + (1 - RATE_ALPHA) * st['rate']
+            st['last_run'] = now
+            self._rebalance()
+
+    def adopt(self, keyword, rate, last_run):
+        """다른 작업자(임대 큐)가 기록한 속도/마지막 실행 시각이 더 최신이면 이어받음"""
+        with self._lock:
+            st = self.state.setdefault(keyword, {'rate': None, 'last_run': None, 'next_due': time.time()})
+            if last_run is not None and (st['last_run'] is None or last_run > st['last_run']):
+                st['rate'], st['last_run'] = rate, last_run
+
+    def postpone(self, keyword, seconds, now=None):
+        """실행 실패 시 속도는 그대로 두고 seconds 뒤에 다시 시도"""
+        now = now or time.time()
+        with self._lock:
+            if keyword in self.state:
+                self.state[keyword]['next_due'] = now + seconds
+
+    def seconds_until_next(self, now=None):
+        now = now or time.time()
+        with self._lock:
+            if not self.state:
+                return None
+            return max(0.0, min(st['next_due'] for st in self.state.values()) - now)
+
+    def run_forever(self, run_keywords, tick=30, batch_limit=None):
+        """
+        밀린 키워드를 모아 run_keywords(키워드 리스트) -> {키워드: 새 기사 수}로 실행하는 루프
+        (None을 돌려주거나 결과에 없는 키워드는 실패로 보고 min_interval 뒤에 다시 시도)
+        (실행 사이에는 다음 실행 시각까지 최대 tick초씩 대기)
+        """
+        while True:
+            keywords = self.due(limit=batch_limit)
+            if keywords:
+                counts = run_keywords(keywords)
+                for kw in keywords:
+                    if counts is not None and kw in counts:
+                        self.record(kw, counts[kw])
+                    else:
+                        self.postpone(kw, self.min_interval)  # 실행 실패 / 결과 없음
+                self.save()
+                print(self.describe(limit=5))
+            wait = self.seconds_until_next()
+            time.sleep(tick if wait is None else min(tick, max(1.0, wait)))
+
+    # ------------------------------------------
+    # 확인 / 저장
+    # ------------------------------------------
+    def schedule_table(self):
+        """[(키워드, 다음 실행 datetime, 시간당 새 기사 수, 주기(초))] 다음 실행 순"""
+        with self._lock:
+            rows = [(kw, datetime.fromtimestamp(st['next_due']), st['rate'], self.interval(kw))
+                    for kw, st in self.state.items()]
+        return sorted(rows, key=lambda r: r[1])
+
+    def describe(self, limit=None):
+        rows = self.schedule_table()
+        lines = [f"🗓️ 다음 수집 일정 (키워드 {len(rows)}개, 예산 배율 x{self._scale:.2f})"]
+        for kw, due, rate, interval in rows[:limit]:
+            rate_txt = '-' if rate is None else f"{rate:.1f}건/h"
+            lines.append(f"   {due:%m-%d %H:%M}  {kw}  (속도 {rate_txt}, 주기 {interval / 3600:.1f}h)")
+        if limit and len(rows) > limit:
+            lines.append(f"   ... 외 {len(rows) - limit}개")
+        return "\n".join(lines)
+
+    def save(self):
+        if not self.state_path:
+            return
+        os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+        tmp = self.state_path + '.tmp'
+        with self._lock:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, self.state_path)
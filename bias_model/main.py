@@ -1,10 +1,10 @@
 import pandas as pd
-import requests
-import re
 import pymysql
-import time
 from tqdm import tqdm
 import os
+from keyword_matcher import build_matcher
+from db_writer import ArticleWriter, ensure_link_hash
+from naver_client import get_client, normalize_item
 from dotenv import load_dotenv
 
 # .env 파일에 있는 내용을 불러옵니다
@@ -13,9 +13,6 @@ load_dotenv()
 # =============================================================================
 # [설정] 사용자 정보 입력
 # =============================================================================
-NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID")     
-NAVER_CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET")
-
 # ★ 중요: 포트 번호 수정!
 DB_HOST = os.getenv("DB_HOST")
 DB_USER = os.getenv("DB_USER")
@@ -48,15 +45,21 @@ def load_bias_dictionary(filepath):
 # =============================================================================
 # [기능 2] 편향도 계산기
 # =============================================================================
-def calculate_bias(text, bias_dict):
+def calculate_bias(text, bias_dict, matcher=None):
+    """
+    matcher: build_matcher(bias_dict)로 미리 만든 매처 (없으면 여기서 만듦)
+    -> 사전 단어마다 `word in text`를 돌리지 않고 기사를 한 번만 훑음
+    """
     if not bias_dict: return 0, 0, "Error", ""
+    if matcher is None: matcher = build_matcher(bias_dict)
     score_board = {'진보': 0, '보수': 0}
     detected_words = []
     
-    for word, info in bias_dict.items():
-        if word in text:
-            score_board[info['tendency']] += info['weight']
-            detected_words.append(word)
+    # 사전 순서대로 정렬 (기존 결과 문자열과 같은 순서 유지)
+    found = sorted(matcher.matched_payloads(text, 'dictionary'), key=lambda x: x[1]['order'])
+    for word, info in found:
+        score_board[info['tendency']] += info['weight']
+        detected_words.append(word)
             
     prog, cons = score_board['진보'], score_board['보수']
     if prog > cons: result = "진보 우세"
@@ -70,11 +73,8 @@ def calculate_bias(text, bias_dict):
 # [기능 3] 네이버 뉴스 수집
 # =============================================================================
 def get_naver_news(query, display=10):
-    url = "https://openapi.naver.com/v1/search/news.json"
-    headers = {"X-Naver-Client-Id": NAVER_CLIENT_ID, "X-Naver-Client-Secret": NAVER_CLIENT_SECRET}
     try:
-        res = requests.get(url, headers=headers, params={"query": query, "display": display, "sort": "sim"})
-        return res.json().get('items', []) if res.status_code == 200 else []
+        return get_client().collect(query, max_items=display, display=display, sort="sim")
     except: return []
 
 # =============================================================================
@@ -115,37 +115,27 @@ def save_to_db(data_list):
         cur.execute(create_table_sql)
         # =========================================================
         
-        sql = """
-            INSERT INTO NEWS_ARTICLES 
-            (category, title, link, description, bias_score_prog, bias_score_cons, final_judgment, detected_keywords)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        """
+        # 같은 링크는 link_hash UNIQUE 인덱스로 건너뜀 (여러 행 INSERT IGNORE)
+        ensure_link_hash(cur)
+        writer = ArticleWriter(conn, ['category', 'title', 'link', 'description', 'bias_score_prog',
+                                      'bias_score_cons', 'final_judgment', 'detected_keywords'])
         
         print("\n💾 데이터베이스에 저장 중...")
-        success_cnt = 0
-        error_shown = False 
-        
         for item in tqdm(data_list, desc="DB Insert"):
-            try:
-                cur.execute(sql, (
-                    item['category'], 
-                    item['title'], 
-                    item['link'][:999],        
-                    item['description'][:2000], 
-                    item['prog_score'], 
-                    item['cons_score'], 
-                    item['judgment'], 
-                    item['keywords']
-                ))
-                success_cnt += 1
-            except Exception as e:
-                if not error_shown:
-                    print(f"\n[❌ 저장 실패 원인]: {e}")
-                    print(f"[문제가 된 데이터]: {item['title']}")
-                    error_shown = True
+            writer.add({
+                'category': item['category'], 
+                'title': item['title'], 
+                'link': item['link'][:999],        
+                'description': item['description'][:2000], 
+                'bias_score_prog': item['prog_score'], 
+                'bias_score_cons': item['cons_score'], 
+                'final_judgment': item['judgment'], 
+                'detected_keywords': item['keywords'],
+            })
+        writer.close()
         
-        conn.commit()
-        print(f"🎉 총 {success_cnt}건 저장 완료!")
+        st = writer.stats()
+        print(f"🎉 총 {st['inserted']}건 저장 완료! (중복 {st['duplicate']}건 / 실패 {st['failed']}건)")
         
     except Exception as e:
         print(f"❌ DB 접속/생성 오류: {e}")
@@ -157,21 +147,20 @@ def save_to_db(data_list):
 def main():
     bias_dict = load_bias_dictionary(DATA_FILE)
     if not bias_dict: return
+    matcher = build_matcher(bias_dict)
     all_results = []
     print(f"\n🚀 뉴스 수집 및 분석 시작...")
 
     for category in tqdm(TARGET_CATEGORIES, desc="카테고리별 진행"):
         news_items = get_naver_news(f"정치 {category}", display=NEWS_COUNT)
-        for item in news_items:
-            title = re.sub(r'<.*?>|&quot;|&gt;|&lt;', '', item['title'])
-            desc = re.sub(r'<.*?>|&quot;|&gt;|&lt;', '', item['description'])
+        for item in map(normalize_item, news_items):
+            title, desc = item['title'], item['description']
             full_text = title + " " + desc
-            p, c, res, keys = calculate_bias(full_text, bias_dict)
+            p, c, res, keys = calculate_bias(full_text, bias_dict, matcher)
             all_results.append({
-                'category': category, 'title': title, 'link': item['originallink'] or item['link'],
+                'category': category, 'title': title, 'link': item['link'],
                 'description': desc, 'prog_score': p, 'cons_score': c, 'judgment': res, 'keywords': keys
             })
-        time.sleep(0.5)
 
     save_to_db(all_results)
 
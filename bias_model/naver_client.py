@@ -0,0 +1,281 @@
+# ==========================================
+# 네이버 검색 API 클라이언트 (연결 재사용 + 속도 제한 + 재시도)
+# ==========================================
+# - requests.Session 하나로 keep-alive 연결을 재사용
+# - 토큰 버킷으로 초당 호출 수 제한, 하루 호출 한도(쿼터) 집계
+# - 429 / 5xx 응답은 지수 백오프로 재시도
+# - 여러 키워드 동시 수집(acollect_many)은 스레드 풀 위에서 실행 (bot.py는 pipeline의 fetch 단계가 담당)
+# - 페이지 넘기기(동기/비동기 반복자)와 제목·요약 정리(태그 제거)를 한 곳에서 제공
+#
+# 모든 수집 코드(bot, main, scripts/*)는 get_client()로 같은 클라이언트를 씁니다.
+# NAVER_API_BASE_URL을 지정하면 실제 네이버 대신 그 주소로 요청
+# (예: scripts/naver_standin_server.py를 띄우고 http://127.0.0.1:8765)
+import asyncio
+import hashlib
+import os
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_BASE_URL = "https://openapi.naver.com"
+NEWS_PATH = "/v1/search/news.json"
+
+def news_url():
+    """뉴스 검색 주소 (.env를 읽은 뒤에 호출되도록 클라이언트 생성 시점에 결정)"""
+    return os.getenv("NAVER_API_BASE_URL", DEFAULT_BASE_URL).rstrip('/') + NEWS_PATH
+
+MAX_DISPLAY = 100   # 한 번에 받을 수 있는 최대 개수
+MAX_START = 1000    # start 파라미터 최대값 (검색 결과 1000개까지만 볼 수 있음)
+
+# 네이버 오픈 API 검색 한도 (애플리케이션 기준) - 필요하면 .env로 조정
+RATE_PER_SEC = float(os.getenv("NAVER_RATE_PER_SEC", 10))
+DAILY_QUOTA = int(os.getenv("NAVER_DAILY_QUOTA", 25000))
+
+REQUEST_TIMEOUT = 5      # 초
+MAX_RETRIES = 4
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# 제목/요약에 섞여 오는 <b> 태그와 HTML 엔티티 제거 (기존 수집 코드와 같은 규칙)
+TAG_PATTERN = re.compile(r'<.*?>|&quot;|&gt;|&lt;')
+
+def clean_text(text):
+    return TAG_PATTERN.sub('', text or '')
+
+def normalize_item(item):
+    """API 결과 1건 -> {'title', 'description', 'link', 'pubDate'} (원문 링크 우선)"""
+    return {
+        'title': clean_text(item.get('title')),
+        'description': clean_text(item.get('description')),
+        'link': item.get('originallink') or item.get('link') or '',
+        'pubDate': item.get('pubDate'),
+    }
+
+def page_key(query, start, display, sort):
+    """요청 1페이지를 가리키는 키 (녹화 파일 / 응답 캐시 이름)"""
+    raw = f"{query}\x1f{start}\x1f{display}\x1f{sort}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+class QuotaExceeded(Exception):
+    """하루 호출 한도를 다 썼을 때"""
+
+class TokenBucket:
+    """초당 rate개씩 토큰이 차는 버킷 (여러 스레드가 같이 사용)"""
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 1개를 얻을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+class DailyQuota:
+    """하루 호출 수 집계 (날짜가 바뀌면 0부터)"""
+    def __init__(self, limit):
+        self.limit = limit
+        self.day = date.today()
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def take(self):
+        with self._lock:
+            today = date.today()
+            if today != self.day:
+                self.day, self.used = today, 0
+            if self.used >= self.limit:
+                raise QuotaExceeded(f"네이버 API 하루 한도({self.limit}회)를 모두 사용했습니다.")
+            self.used += 1
+
+    @property
+    def remaining(self):
+        return max(0, self.limit - self.used)
+
+class NaverNewsClient:
+    def __init__(self, client_id, client_secret, rate_per_sec=RATE_PER_SEC, daily_quota=DAILY_QUOTA,
+                 pool_size=16, base_url=None):
+        self.base_url = base_url or news_url()
+        self.session = requests.Session()
+        self.session.headers.update({"X-Naver-Client-Id": client_id or "",
+                                     "X-Naver-Client-Secret": client_secret or ""})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.bucket = TokenBucket(rate_per_sec)
+        self.quota = DailyQuota(daily_quota)
+        self.pool_size = pool_size
+        self._executor = None
+        self.cache = None   # enable_cache()로 켜는 응답 디스크 캐시 (대량 수집용)
+        # 호출 통계
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+        self._stats_lock = threading.Lock()
+
+    def _count(self, name):
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def enable_cache(self, cache):
+        """response_cache.ResponseCache를 연결 (캐시에 있는 페이지는 API를 부르지 않음)"""
+        self.cache = cache
+        return self
+
+    def stats(self):
+        stats = {'calls': self.calls, 'retries': self.retries, 'failures': self.failures,
+                 'quota_used': self.quota.used, 'quota_remaining': self.quota.remaining}
+        if self.cache is not None:
+            stats['cache'] = self.cache.stats()
+        return stats
+
+    def search(self, query, display=20, start=1, sort="date"):
+        """
+        뉴스 검색 1페이지. 성공하면 items 리스트, 재시도 후에도 실패하면 예외
+        (429/5xx는 백오프 후 재시도, Retry-After 헤더가 있으면 그만큼 대기)
+        """
+        if self.cache is not None:
+            body = self.cache.get(query, start, display, sort)
+            if body is not None:
+                return body.get('items', [])
+
+        params = {"query": query, "display": display, "start": start, "sort": sort}
+        for attempt in range(MAX_RETRIES + 1):
+            if attempt:
+                self._count('retries')
+            self.bucket.acquire()
+            self.quota.take()
+            self._count('calls')
+            try:
+                resp = self.session.get(self.base_url, params=params, timeout=REQUEST_TIMEOUT)
+            except requests.RequestException:
+                if attempt == MAX_RETRIES:
+                    self._count('failures')
+                    raise
+                self._backoff(attempt)
+                continue
+
+            if resp.status_code == 200:
+                body = resp.json()
+                if self.cache is not None:
+                    self.cache.put(query, start, display, sort, body)
+                return body.get('items', [])
+            if resp.status_code in RETRY_STATUS and attempt < MAX_RETRIES:
+                self._backoff(attempt, resp.headers.get("Retry-After"))
+                continue
+            self._count('failures')
+            resp.raise_for_status()
+            return []  # 그 외 2xx (사실상 없음)
+
+    @staticmethod
+    def _backoff(attempt, retry_after=None):
+        if retry_after and str(retry_after).isdigit():
+            time.sleep(int(retry_after))
+        else:
+            time.sleep(min(8.0, 0.5 * (2 ** attempt)) + random.uniform(0, 0.25))
+
+    # ------------------------------------------
+    # 페이지 넘기기
+    # ------------------------------------------
+    def iter_pages(self, query, max_items=MAX_START, display=MAX_DISPLAY, sort="sim", start=1):
+        """
+        검색 결과를 페이지 단위로 돌려주는 반복자 (items 리스트를 하나씩 yield)
+        - 결과가 없거나 덜 찬 페이지가 나오면 끝
+        - 요청 실패는 출력 후 중단 (하루 한도 초과는 호출한 쪽으로 그대로 전달)
+        """
+        display = min(display, MAX_DISPLAY)
+        fetched = 0
+        while fetched < max_items and start <= MAX_START:
+            try:
+                items = self.search(query, display=display, start=start, sort=sort)
+            except QuotaExceeded:
+                raise
+            except Exception as e:
+                print(f"Request Error: {e}")
+                return
+            if not items:
+                return
+            yield items[:max_items - fetched]
+            fetched += len(items)
+            if len(items) < display:
+                return
+            start += display
+
+    def iter_items(self, query, max_items=MAX_START, **kwargs):
+        for items in self.iter_pages(query, max_items, **kwargs):
+            yield from items
+
+    def collect(self, query, max_items=MAX_START, **kwargs):
+        return list(self.iter_items(query, max_items, **kwargs))
+
+    # ------------------------------------------
+    # 비동기 (asyncio) - 요청은 스레드 풀에서 돌리고 속도 제한/재시도는 동기 버전과 공유
+    # ------------------------------------------
+    async def asearch(self, query, **params):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.pool_size)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: self.search(query, **params))
+
+    async def aiter_pages(self, query, max_items=MAX_START, display=MAX_DISPLAY, sort="sim", start=1):
+        """iter_pages의 async for 버전"""
+        display = min(display, MAX_DISPLAY)
+        fetched = 0
+        while fetched < max_items and start <= MAX_START:
+            try:
+                items = await self.asearch(query, display=display, start=start, sort=sort)
+            except QuotaExceeded:
+                raise
+            except Exception as e:
+                print(f"Request Error: {e}")
+                return
+            if not items:
+                return
+            yield items[:max_items - fetched]
+            fetched += len(items)
+            if len(items) < display:
+                return
+            start += display
+
+    async def acollect_many(self, queries, max_items=MAX_START, **kwargs):
+        """여러 검색어를 동시에 끝까지 수집 -> {검색어: items}"""
+        async def one(query):
+            items = []
+            async for page in self.aiter_pages(query, max_items, **kwargs):
+                items.extend(page)
+            return query, items
+        return dict(await asyncio.gather(*(one(q) for q in dict.fromkeys(queries))))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self.session.close()
+
+# ==========================================
+# 공용 클라이언트 (프로세스당 1개)
+# ==========================================
+_shared = None
+_shared_lock = threading.Lock()
+
+def get_client():
+    """.env의 키로 만든 공용 클라이언트 (연결 풀/속도 제한/쿼터를 모든 수집 코드가 공유)"""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = NaverNewsClient(os.getenv("NAVER_CLIENT_ID"), os.getenv("NAVER_CLIENT_SECRET"))
+        return _shared
@@ -0,0 +1,147 @@
+# ==========================================
+# 유사 중복 기사 찾기 (MinHash + LSH)
+# ==========================================
+# 같은 통신사 기사가 언론사/키워드만 바꿔서 여러 번 들어오면 매번 형태소 분석 + 점수 계산을 하게 됩니다.
+# 제목+요약을 정규화해서 글자 n-gram(shingle) 집합으로 만들고 MinHash 서명을 계산한 뒤,
+# 서명을 밴드로 잘라 버킷에 넣어두면(LSH) 비슷한 기사 후보를 바로 찾을 수 있습니다.
+# - 후보의 추정 Jaccard 유사도가 threshold 이상이면 같은 묶음(cluster)으로 보고
+#   먼저 들어온 기사(대표)의 점수를 재사용하거나 건너뜀
+# - 표준 라이브러리 + numpy만 사용 (model_2 쪽에서도 그대로 import)
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+SHINGLE_SIZE = 4        # 글자 4-gram (한국어는 띄어쓰기가 흔들려서 공백 제거 후 글자 단위)
+NUM_PERM = 64           # MinHash 서명 길이
+BANDS = 16              # LSH 밴드 수 (밴드당 4개 -> 유사도 0.5 근처부터 후보로 잡힘)
+THRESHOLD = 0.8         # 이 이상이면 같은 기사로 봄
+MAX_ITEMS = 20000       # 메모리에 들고 있을 최근 기사 수
+
+_PRIME = (1 << 31) - 1
+_rng = np.random.RandomState(20250)  # 프로세스가 달라도 같은 서명이 나오도록 고정 시드
+_PERM_A = _rng.randint(1, _PRIME, size=NUM_PERM).astype(np.int64)
+_PERM_B = _rng.randint(0, _PRIME, size=NUM_PERM).astype(np.int64)
+
+_NON_WORD = re.compile(r'[^0-9a-z가-힣]+')
+_BRACKETS = re.compile(r'\[[^\]]*\]|\([^)]*\)|<[^>]*>')  # [속보], (서울=연합뉴스) 같은 머리말
+
+def normalize_text(text):
+    """괄호 머리말 제거, 소문자, 한글/영문/숫자만 남기고 공백도 제거"""
+    text = _BRACKETS.sub(' ', (text or '').lower())
+    return _NON_WORD.sub('', text)
+
+def shingles(text, k=SHINGLE_SIZE):
+    text = normalize_text(text)
+    if len(text) <= k:
+        return {text} if text else set()
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+def signature(text):
+    """MinHash 서명 (길이 NUM_PERM의 int64 배열). 글자가 없으면 None"""
+    grams = shingles(text)
+    if not grams:
+        return None
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(g.encode('utf-8'), digest_size=4).digest(), 'little') for g in grams),
+        dtype=np.int64, count=len(grams))
+    # (a*x + b) mod p 를 순열 NUM_PERM개에 대해 한 번에 -> 열별 최솟값
+    return ((np.outer(_PERM_A, hashes) + _PERM_B[:, None]) % _PRIME).min(axis=1)
+
+def similarity(sig_a, sig_b):
+    """서명이 일치하는 비율 = Jaccard 유사도 추정값"""
+    return float(np.mean(sig_a == sig_b))
+
+class NearDupIndex:
+    """
+    최근 기사들의 MinHash LSH 색인 (여러 스레드에서 같이 사용 가능)
+    - key: 기사 식별자 (예: 링크 해시), cluster: 대표 기사의 key
+    - payload: 재사용할 분석 결과 (점수 등)
+    """
+    def __init__(self, threshold=THRESHOLD, bands=BANDS, max_items=MAX_ITEMS):
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = NUM_PERM // bands
+        self.max_items = max_items
+        self.items = OrderedDict()   # 대표 기사 key -> [signature, cluster, payload]
+        self.members = OrderedDict() # 중복 기사 key -> 대표 기사 key
+        self.buckets = {}            # (밴드 번호, 밴드 값) -> {key, ...}
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.dup_hits = 0
+
+    def _band_keys(self, sig):
+        r = self.rows
+        return [(b, sig[b * r:(b + 1) * r].tobytes()) for b in range(self.bands)]
+
+    def _best_match(self, sig):
+        candidates = set()
+        for band_key in self._band_keys(sig):
+            candidates |= self.buckets.get(band_key, set())
+        if not candidates:
+            return None, 0.0
+        keys = list(candidates)
+        # 후보 서명을 쌓아서 한 번에 비교
+        sims = (np.vstack([self.items[k][0] for k in keys]) == sig).mean(axis=1)
+        i = int(sims.argmax())
+        if sims[i] >= self.threshold:
+            return keys[i], float(sims[i])
+        return None, float(sims[i])
+
+    def _insert(self, key, sig, cluster, payload):
+        self.items[key] = [sig, cluster, payload]
+        for band_key in self._band_keys(sig):
+            self.buckets.setdefault(band_key, set()).add(key)
+        while len(self.items) > self.max_items:
+            old_key, (old_sig, _, _) = self.items.popitem(last=False)
+            for band_key in self._band_keys(old_sig):
+                bucket = self.buckets.get(band_key)
+                if bucket is not None:
+                    bucket.discard(old_key)
+                    if not bucket:
+                        del self.buckets[band_key]
+
+    def assign(self, key, text, payload=None):
+        """
+        기사를 색인에 넣고 묶음을 정함
+        Return: (cluster, 대표 기사의 payload 또는 None, 유사도)
+                - 비슷한 기사가 없으면 자기 자신이 대표: (key, None, 0.0)
+        (버킷에는 대표 기사만 넣어서 같은 기사가 수십 건 쌓여도 후보 비교 수가 늘지 않음)
+        """
+        with self._lock:
+            if key in self.items:
+                return key, self.items[key][2], 1.0
+            if key in self.members:
+                cluster = self.members[key]
+                return cluster, self.items[cluster][2] if cluster in self.items else None, 1.0
+        sig = signature(text)
+        if sig is None:
+            return key, None, 0.0
+        with self._lock:
+            self.lookups += 1
+            match, sim = self._best_match(sig)
+            if match is None:
+                self._insert(key, sig, key, payload)
+                return key, None, sim
+            self.dup_hits += 1
+            self.members[key] = match
+            while len(self.members) > self.max_items:
+                self.members.popitem(last=False)
+            return match, self.items[match][2], sim
+
+    def set_payload(self, key, payload):
+        """대표 기사 분석이 끝난 뒤 결과를 기록 (다음 중복 기사가 재사용)"""
+        with self._lock:
+            if key in self.items:
+                self.items[key][2] = payload
+
+    def payload(self, key):
+        with self._lock:
+            item = self.items.get(key)
+            return item[2] if item else None
+
+    def stats(self):
+        return {'clusters': len(self.items), 'members': len(self.members),
+                'lookups': self.lookups, 'duplicates': self.dup_hits}
@@ -0,0 +1,169 @@
+# ==========================================
+# 뉴스 목록 조회 (커서 기반 페이지 넘기기)
+# ==========================================
+# OFFSET으로 페이지를 넘기면 뒤 페이지일수록 앞의 행을 전부 읽고 버려서 느려집니다.
+# 대신 마지막으로 받은 기사의 (created_at, id)를 커서로 주고,
+# "그보다 오래된 기사"부터 인덱스를 타고 바로 읽기 때문에 몇 번째 페이지든 첫 페이지와 비용이 같습니다.
+# - 커서는 클라이언트가 그대로 돌려주기만 하면 되는 불투명 문자열 (base64)
+# - 정렬: created_at DESC, id DESC (같은 시각에 들어온 기사도 빠짐/중복 없이)
+import base64
+import json
+
+from score_store import _col, ensure_indexes, missing_indexes
+
+NEWS_TABLE = 'NEWS_ARTICLES'
+# 목록 조회용 복합 인덱스 (전체 최신순 / 카테고리별 최신순)
+NEWS_LIST_INDEXES = {
+    'idx_created_id': '(created_at, id)',
+    'idx_category_created_id': '(category, created_at, id)',
+}
+
+DEFAULT_PAGE_SIZE = 30
+MAX_PAGE_SIZE = 100
+MAX_BATCH_IDS = 50   # /api/news/batch 한 번에 받을 수 있는 기사 수
+
+# ?fields= 로 고를 수 있는 컬럼 (link_hash / 점수 도장 같은 내부 컬럼은 내보내지 않음)
+# (테이블을 만든 스크립트마다 컬럼이 조금씩 달라서, 실제 테이블에 있는 것만 씀)
+PUBLIC_FIELDS = (
+    'id', 'category', 'keyword', 'title', 'link', 'description', 'content',
+    'bias_score_cons', 'bias_score_prog', 'bias_level', 'final_judgement', 'final_judgment',
+    'bias', 'bias_score', 'detected_keywords', 'dup_cluster', 'created_at',
+)
+# 목록 기본값: 카드에 필요한 제목 + 점수만 (본문/설명은 fields=all 또는 상세 조회로)
+LIST_DEFAULT_FIELDS = (
+    'id', 'category', 'title', 'bias_score_cons', 'bias_score_prog', 'bias_level',
+    'final_judgement', 'final_judgment', 'bias', 'bias_score', 'created_at',
+)
+
+class InvalidCursor(ValueError):
+    """깨졌거나 다른 조건(카테고리)에서 받은 커서"""
+
+class InvalidFields(ValueError):
+    """?fields= 에 없는 컬럼 이름"""
+
+class InvalidIds(ValueError):
+    """?ids= 가 비었거나 숫자가 아니거나 너무 많음"""
+
+def ensure_list_indexes(cur):
+    return ensure_indexes(cur, NEWS_TABLE, NEWS_LIST_INDEXES)
+
+def missing_list_indexes(cur):
+    """아직 안 만든 목록 조회용 인덱스 (scripts/migrate_news_indexes.py로 추가)"""
+    return missing_indexes(cur, NEWS_TABLE, NEWS_LIST_INDEXES)
+
+def table_columns(cur, table=NEWS_TABLE):
+    """테이블의 실제 컬럼 이름 (정의 순서)"""
+    cur.execute(
+        "SELECT COLUMN_NAME FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s "
+        "ORDER BY ORDINAL_POSITION", (table,))
+    return [_col(row, 0, 'COLUMN_NAME') for row in cur.fetchall()]
+
+def resolve_fields(requested, columns, default=None):
+    """
+    ?fields= 값 → SELECT할 컬럼 리스트 (id는 항상 포함)
+    - 없으면 default (None이면 공개 컬럼 전부), 'all'이면 공개 컬럼 전부
+    - 'title,link' 처럼 쉼표로 구분, 모르는 이름이면 InvalidFields
+    """
+    available = [c for c in columns if c in PUBLIC_FIELDS]
+    if not requested:
+        names = available if default is None else [c for c in available if c in default]
+    elif requested.strip() == 'all':
+        names = available
+    else:
+        names = [n.strip() for n in requested.split(',') if n.strip()]
+        unknown = [n for n in names if n not in PUBLIC_FIELDS]
+        if unknown:
+            raise InvalidFields(f"알 수 없는 fields: {', '.join(unknown)} (가능: {', '.join(available)})")
+        names = [n for n in names if n in available]
+    return list(dict.fromkeys(['id'] + names))
+
+def encode_cursor(row, category=None):
+    """row: DictCursor 결과 (created_at, id 포함)"""
+    payload = {'t': str(row['created_at']), 'i': row['id'], 'c': category}
+    raw = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor, category=None):
+    """Return: (created_at 문자열, id)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        payload = json.loads(raw.decode('utf-8'))
+        created_at, news_id, cursor_category = str(payload['t']), int(payload['i']), payload.get('c')
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise InvalidCursor(f"잘못된 cursor 입니다: {e}")
+    if cursor_category != category:
+        raise InvalidCursor("cursor를 받은 조회 조건(category)과 지금 조건이 다릅니다.")
+    return created_at, news_id
+
+def page_size(value):
+    """?limit= 값 → 1 ~ MAX_PAGE_SIZE (없거나 이상하면 기본값)"""
+    try:
+        return min(MAX_PAGE_SIZE, max(1, int(value)))
+    except (TypeError, ValueError):
+        return DEFAULT_PAGE_SIZE
+
+def list_news(cur, category=None, cursor=None, limit=DEFAULT_PAGE_SIZE, fields=None):
+    """
+    최신순 기사 한 페이지 (fields: 가져올 컬럼 리스트, None이면 전부)
+    Return: (rows, next_cursor) - 마지막 페이지면 next_cursor는 None
+    """
+    where, params = [], []
+    if category:
+        where.append("category = %s")
+        params.append(category)
+    if cursor:
+        created_at, news_id = decode_cursor(cursor, category)
+        where.append("(created_at < %s OR (created_at = %s AND id < %s))")
+        params += [created_at, created_at, news_id]
+
+    # 커서를 만들려면 id / created_at은 필요 → 같이 읽고 요청에 없으면 응답에서 뺌
+    extra = [c for c in ('id', 'created_at') if fields and c not in fields]
+    columns = ', '.join(list(fields) + extra) if fields else '*'
+    sql = f"SELECT {columns} FROM {NEWS_TABLE}"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    # 한 개 더 읽어서 다음 페이지가 있는지 확인
+    sql += " ORDER BY created_at DESC, id DESC LIMIT %s"
+    cur.execute(sql, params + [limit + 1])
+    rows = list(cur.fetchall())
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1], category)
+    if extra:
+        for row in rows:
+            for c in extra:
+                del row[c]
+    return rows, next_cursor
+
+def get_news_by_id(cur, news_id, fields=None):
+    columns = ', '.join(fields) if fields else '*'
+    cur.execute(f"SELECT {columns} FROM {NEWS_TABLE} WHERE id = %s", (news_id,))
+    return cur.fetchone()
+
+def parse_ids(value, max_count=MAX_BATCH_IDS):
+    """?ids=3,1,2 → [3, 1, 2] (요청 순서 유지, 중복 제거)"""
+    parts = [p.strip() for p in (value or '').split(',') if p.strip()]
+    if not parts:
+        raise InvalidIds("ids를 쉼표로 구분해서 보내주세요. (예: ?ids=3,1,2)")
+    try:
+        ids = list(dict.fromkeys(int(p) for p in parts))
+    except ValueError:
+        raise InvalidIds(f"ids는 숫자만 가능합니다: {value}")
+    if len(ids) > max_count:
+        raise InvalidIds(f"한 번에 최대 {max_count}개까지 조회할 수 있습니다. (요청 {len(ids)}개)")
+    return ids
+
+def get_news_by_ids(cur, ids, fields=None):
+    """
+    WHERE id IN (...) 한 번으로 여러 기사 조회
+    Return: 요청 순서대로 [{'id', 'found', 'data'}, ...] (없는 기사는 found=False, data=None)
+    """
+    if not ids:
+        return []
+    columns = ', '.join(list(fields) + ([] if 'id' in fields else ['id'])) if fields else '*'
+    marks = ', '.join(['%s'] * len(ids))
+    cur.execute(f"SELECT {columns} FROM {NEWS_TABLE} WHERE id IN ({marks})", list(ids))
+    found = {row['id']: row for row in cur.fetchall()}
+    return [{'id': i, 'found': i in found, 'data': found.get(i)} for i in ids]
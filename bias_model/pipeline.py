@@ -0,0 +1,156 @@
+# ==========================================
+# 단계별 수집 파이프라인 (생산자/소비자 + 크기 제한 큐)
+# ==========================================
+# 수집 → 정제 → 토큰화/점수 → DB 저장 처럼 단계를 나누고
+# 단계 사이를 maxsize가 있는 Queue로 이어서
+# - 네트워크 대기 중에도 점수 계산이 돌고 (반대도 마찬가지)
+# - 뒤 단계가 밀리면 앞 단계가 put()에서 멈춰서 메모리가 일정하게 유지됨 (backpressure)
+import queue
+import threading
+import time
+
+_DONE = object()  # 단계 종료 신호
+
+class Stage:
+    """
+    파이프라인 한 단계
+    - func: 입력 1개(batch_size > 1이면 입력 리스트)를 받아 다음 단계로 보낼 결과들(iterable)을 돌려줌
+            (None을 돌려주면 보낼 것 없음)
+    - workers: 이 단계를 동시에 처리할 스레드 수
+    - batch_size / batch_timeout: 최대 batch_size개까지 모아서 처리, 첫 입력 후 batch_timeout초가 지나면 모인 만큼 처리
+    """
+    def __init__(self, name, func, workers=1, batch_size=1, batch_timeout=0.5):
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        # 통계
+        self.count_in = 0
+        self.count_out = 0
+        self.errors = 0
+        self.busy = 0.0
+        self.max_depth = 0
+        self._lock = threading.Lock()
+
+    def stats(self, elapsed, inbox):
+        return {
+            "stage": self.name,
+            "in": self.count_in,
+            "out": self.count_out,
+            "errors": self.errors,
+            "rate": self.count_in / elapsed if elapsed > 0 else 0.0,
+            "busy_sec": round(self.busy, 2),
+            "queue": inbox.qsize(),
+            "max_queue": self.max_depth,
+        }
+
+class Pipeline:
+    def __init__(self, stages, queue_size=500, report_interval=10):
+        self.stages = stages
+        self.queue_size = queue_size
+        self.report_interval = report_interval
+        # 단계 i의 입력 큐 (마지막 단계의 결과는 버림)
+        self.queues = [queue.Queue(maxsize=queue_size) for _ in stages]
+        self.started = None
+
+    # ------------------------------------------
+    # 내부 동작
+    # ------------------------------------------
+    def _next_batch(self, stage, inbox):
+        """입력 큐에서 배치 하나 꺼내기. 종료 신호를 받으면 (배치, True)"""
+        item = inbox.get()
+        if item is _DONE:
+            return [], True
+        batch = [item]
+        deadline = time.monotonic() + stage.batch_timeout
+        while len(batch) < stage.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = inbox.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _DONE:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _worker(self, idx, finished):
+        stage = self.stages[idx]
+        inbox = self.queues[idx]
+        outbox = self.queues[idx + 1] if idx + 1 < len(self.stages) else None
+
+        done = False
+        while not done:
+            batch, done = self._next_batch(stage, inbox)
+            if not batch:
+                continue
+            with stage._lock:
+                stage.count_in += len(batch)
+                stage.max_depth = max(stage.max_depth, inbox.qsize())
+
+            t0 = time.perf_counter()
+            try:
+                results = stage.func(batch if stage.batch_size > 1 else batch[0]) or ()
+                n_out = 0
+                for result in results:
+                    n_out += 1
+                    if outbox is not None:
+                        outbox.put(result)  # 다음 단계가 밀리면 여기서 대기
+            except Exception as e:
+                with stage._lock:
+                    stage.errors += len(batch)
+                print(f"⚠️ [{stage.name}] 처리 실패: {e}")
+                n_out = 0
+            with stage._lock:
+                stage.busy += time.perf_counter() - t0
+                stage.count_out += n_out
+
+        with stage._lock:
+            finished[idx] += 1
+            last = finished[idx] == stage.workers
+        if not last:
+            # 같은 단계의 다른 워커도 멈추도록 종료 신호를 다시 넣음
+            inbox.put(_DONE)
+        elif outbox is not None:
+            # 이 단계의 마지막 워커가 끝나면 다음 단계에 종료 신호 전달
+            outbox.put(_DONE)
+
+    def _feed(self, source):
+        inbox = self.queues[0]
+        for item in source:
+            inbox.put(item)
+        inbox.put(_DONE)
+
+    # ------------------------------------------
+    # 실행 / 통계
+    # ------------------------------------------
+    def stats(self):
+        elapsed = time.time() - self.started if self.started else 0.0
+        return [stage.stats(elapsed, inbox) for stage, inbox in zip(self.stages, self.queues)]
+
+    def report(self):
+        for s in self.stats():
+            print(f"   📊 [{s['stage']}] 입력 {s['in']} / 출력 {s['out']} / 실패 {s['errors']} | "
+                  f"{s['rate']:.1f}건/s | 대기열 {s['queue']}/{self.queue_size} (최대 {s['max_queue']})")
+
+    def run(self, source):
+        """source(첫 단계 입력들)를 끝까지 흘려보내고 단계별 통계를 돌려줌"""
+        self.started = time.time()
+        finished = [0] * len(self.stages)
+        threads = [threading.Thread(target=self._feed, args=(source,), daemon=True)]
+        for idx, stage in enumerate(self.stages):
+            for _ in range(stage.workers):
+                threads.append(threading.Thread(target=self._worker, args=(idx, finished), daemon=True))
+        for t in threads:
+            t.start()
+
+        last_report = time.time()
+        while any(t.is_alive() for t in threads):
+            threads[-1].join(timeout=1)
+            if self.report_interval and time.time() - last_report >= self.report_interval:
+                self.report()
+                last_report = time.time()
+        return self.stats()
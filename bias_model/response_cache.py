@@ -0,0 +1,121 @@
+# ==========================================
+# 네이버 API 응답 디스크 캐시
+# ==========================================
+# 대량 수집(backfill) 스크립트를 다시 돌릴 때 이미 받은 페이지는 디스크에서 바로 읽어서
+# 하루 호출 한도와 대기 시간을 아낍니다.
+# - 키: (검색어, start, display, sort) 해시 -> cache/naver_responses/ab/abcdef....json
+# - TTL이 지난 파일은 다시 요청, 전체 크기가 max_bytes를 넘으면 오래 안 쓴 파일부터 삭제
+import json
+import os
+import threading
+import time
+
+from naver_client import page_key
+
+RESPONSE_CACHE_DIR = 'cache/naver_responses'
+DEFAULT_TTL = 7 * 24 * 3600          # 7일 (정확도순 과거 기사 결과는 잘 안 바뀜)
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+
+class ResponseCache:
+    def __init__(self, cache_dir=RESPONSE_CACHE_DIR, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        self._size = self._scan_size()
+
+    def _path(self, query, start, display, sort):
+        key = page_key(query, start, display, sort)
+        return os.path.join(self.cache_dir, key[:2], key + '.json')
+
+    def _scan_size(self):
+        total = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    pass
+        return total
+
+    def get(self, query, start, display, sort):
+        """캐시된 응답 본문(dict). 없거나 만료됐으면 None"""
+        path = self._path(query, start, display, sort)
+        try:
+            age = time.time() - os.path.getmtime(path)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        if self.ttl is not None and age > self.ttl:
+            with self._lock:
+                self.expired += 1
+            return None
+        try:
+            with open(path, encoding='utf-8') as f:
+                body = json.load(f)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            os.utime(path, (time.time(), os.path.getmtime(path)))  # 최근 사용 시각(atime)만 갱신
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return body
+
+    def put(self, query, start, display, sort, body):
+        path = self._path(query, start, display, sort)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        try:
+            old = os.path.getsize(path)
+        except OSError:
+            old = 0
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+        with self._lock:
+            self._size += len(data) - old
+            over = self._size > self.max_bytes
+        if over:
+            self.evict()
+
+    def evict(self):
+        """오래 안 쓴 파일부터 지워서 max_bytes의 90% 아래로"""
+        with self._lock:
+            entries = []
+            for root, _, files in os.walk(self.cache_dir):
+                for name in files:
+                    if not name.endswith('.json'):
+                        continue
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    entries.append((max(st.st_atime, st.st_mtime), st.st_size, path))
+            total = sum(size for _, size, _ in entries)
+            target = self.max_bytes * 0.9
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                    self.evicted += 1
+                except OSError:
+                    pass
+            self._size = total
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'expired': self.expired,
+                'evicted': self.evicted, 'bytes': self._size}
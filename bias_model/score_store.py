@@ -0,0 +1,142 @@
+# ==========================================
+# 기사 x 키워드 점수 테이블 (다중 키워드 모드)
+# ==========================================
+# 한 기사에 여러 이슈가 함께 나오면 키워드마다 점수를 따로 저장합니다.
+# (NEWS_ARTICLES의 점수 컬럼에는 대표 키워드 1개의 점수만 들어감)
+#
+# 점수마다 "어떤 모델 / 어떤 키워드 설정으로 계산했는지" 도장(stamp)을 같이 찍어서,
+# 재분석 때 모델이나 해당 키워드 설정이 바뀐 기사만 다시 계산할 수 있게 합니다.
+import hashlib
+
+import pandas as pd
+
+KEYWORD_SCORE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS NEWS_KEYWORD_SCORES (
+    article_id INT NOT NULL,
+    keyword VARCHAR(100) NOT NULL,
+    sim_keyword FLOAT,
+    sim_antonym FLOAT,
+    bias_level FLOAT,
+    judgement VARCHAR(20),
+    model_hash VARCHAR(32),
+    config_hash VARCHAR(32),
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (article_id, keyword),
+    KEY idx_keyword_level (keyword, bias_level)
+) DEFAULT CHARSET=utf8mb4;
+"""
+
+UPSERT_KEYWORD_SCORE_SQL = """
+    INSERT INTO NEWS_KEYWORD_SCORES
+    (article_id, keyword, sim_keyword, sim_antonym, bias_level, judgement, model_hash, config_hash)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        sim_keyword = VALUES(sim_keyword),
+        sim_antonym = VALUES(sim_antonym),
+        bias_level = VALUES(bias_level),
+        judgement = VALUES(judgement),
+        model_hash = VALUES(model_hash),
+        config_hash = VALUES(config_hash)
+"""
+
+# 마지막 재분석 때 사용한 키워드별 설정 (다음 증분 재분석에서 바뀐 키워드를 찾는 기준)
+KEYWORD_CONFIG_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS SCORE_KEYWORD_CONFIG (
+    keyword VARCHAR(100) NOT NULL PRIMARY KEY,
+    config_hash VARCHAR(32) NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) DEFAULT CHARSET=utf8mb4;
+"""
+
+# NEWS_ARTICLES에 추가하는 도장 컬럼 (대표 키워드 기준)
+ARTICLE_STAMP_COLUMNS = {
+    'score_model_hash': "VARCHAR(32) NULL",
+    'score_config_hash': "VARCHAR(32) NULL",
+}
+KEYWORD_SCORE_STAMP_COLUMNS = {
+    'model_hash': "VARCHAR(32) NULL",
+    'config_hash': "VARCHAR(32) NULL",
+}
+
+def _col(row, index, name):
+    """일반 커서(튜플) / DictCursor(dict) 결과 둘 다 지원"""
+    return row[name] if isinstance(row, dict) else row[index]
+
+def keyword_config_hashes(df_conf):
+    """키워드별 설정 해시 (점수에 영향을 주는 키워드 + 반대어 기준)"""
+    hashes = {}
+    for keyword, antonym in zip(df_conf['keyword'], df_conf['antonym']):
+        antonym = '' if pd.isna(antonym) else ','.join(a.strip() for a in str(antonym).split(','))
+        hashes[keyword] = hashlib.sha1(f"{keyword}|{antonym}".encode('utf-8')).hexdigest()[:16]
+    return hashes
+
+def ensure_columns(cur, table, columns):
+    """테이블에 없는 컬럼만 추가 (MySQL은 ADD COLUMN IF NOT EXISTS가 없어서 직접 확인)"""
+    cur.execute(
+        "SELECT COLUMN_NAME FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+        (table,))
+    existing = {_col(row, 0, 'COLUMN_NAME') for row in cur.fetchall()}
+    for name, ddl in columns.items():
+        if name not in existing:
+            cur.execute(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}")
+
+def missing_indexes(cur, table, indexes):
+    """{인덱스 이름: "(컬럼, ...)"} 중 테이블에 아직 없는 인덱스 이름 리스트 (읽기만 함)"""
+    cur.execute(
+        "SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+        (table,))
+    existing = {_col(row, 0, 'INDEX_NAME') for row in cur.fetchall()}
+    return [name for name in indexes if name not in existing]
+
+def ensure_indexes(cur, table, indexes):
+    """
+    테이블에 없는 인덱스만 추가 ({인덱스 이름: "(컬럼, ...)"})
+    Return: 새로 만든 인덱스 이름 리스트
+    """
+    created = missing_indexes(cur, table, indexes)
+    for name in created:
+        # 온라인으로 추가 (만드는 동안에도 INSERT/SELECT가 막히지 않음)
+        cur.execute(f"ALTER TABLE {table} ADD INDEX {name} {indexes[name]}, ALGORITHM=INPLACE, LOCK=NONE")
+    return created
+
+def ensure_keyword_score_table(cur):
+    """테이블이 없으면 생성 (예전에 만든 테이블이면 도장 컬럼 추가)"""
+    cur.execute(KEYWORD_SCORE_TABLE_SQL)
+    ensure_columns(cur, 'NEWS_KEYWORD_SCORES', KEYWORD_SCORE_STAMP_COLUMNS)
+
+def ensure_score_stamps(cur):
+    """증분 재분석에 필요한 도장 컬럼/테이블 준비"""
+    ensure_columns(cur, 'NEWS_ARTICLES', ARTICLE_STAMP_COLUMNS)
+    cur.execute(KEYWORD_CONFIG_TABLE_SQL)
+
+def load_saved_config(cur):
+    """마지막 재분석 때의 {키워드: 설정 해시}"""
+    cur.execute("SELECT keyword, config_hash FROM SCORE_KEYWORD_CONFIG")
+    return {_col(r, 0, 'keyword'): _col(r, 1, 'config_hash') for r in cur.fetchall()}
+
+def save_config(cur, config_hashes):
+    """현재 키워드 설정을 기준으로 기록 (삭제된 키워드는 지움)"""
+    cur.execute("DELETE FROM SCORE_KEYWORD_CONFIG")
+    cur.executemany("INSERT INTO SCORE_KEYWORD_CONFIG (keyword, config_hash) VALUES (%s, %s)",
+                    list(config_hashes.items()))
+
+def judge(sim_cons, sim_prog, threshold):
+    """점수 차이로 CONS / PROG / NEUTRAL 판정"""
+    diff = sim_cons - sim_prog
+    if diff > threshold: return 'CONS'
+    if diff < -threshold: return 'PROG'
+    return 'NEUTRAL'
+
+def keyword_score_rows(article_id, scores, threshold, model_hash=None, config_hashes=None):
+    """{키워드: (cons, prog)} -> executemany용 튜플 목록 (모델/키워드 설정 도장 포함)"""
+    config_hashes = config_hashes or {}
+    return [(article_id, kw, cons, prog, cons - prog, judge(cons, prog, threshold),
+             model_hash, config_hashes.get(kw))
+            for kw, (cons, prog) in scores.items()]
+
+def save_keyword_scores(cur, article_id, scores, threshold, model_hash=None, config_hashes=None):
+    """기사 1건의 키워드별 점수를 한 번에 저장 (이미 있으면 갱신)"""
+    rows = keyword_score_rows(article_id, scores, threshold, model_hash, config_hashes)
+    if rows:
+        cur.executemany(UPSERT_KEYWORD_SCORE_SQL, rows)
+    return len(rows)
@@ -0,0 +1,229 @@
+import sys
+import os
+import argparse
+import sqlite3
+import time
+from multiprocessing import Pool
+
+# 현재 파일의 위치를 기준으로, 한 단계 위(부모 폴더)를 경로에 추가
+BASE_DIR = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+sys.path.append(BASE_DIR)
+
+import pymysql
+import pandas as pd
+from dotenv import load_dotenv
+
+load_dotenv(os.path.join(BASE_DIR, '.env'))
+
+from db_writer import ArticleWriter, ensure_link_hash
+from naver_client import MAX_START, NaverNewsClient, QuotaExceeded, RATE_PER_SEC, DAILY_QUOTA, normalize_item
+from response_cache import ResponseCache
+
+# ==========================================
+# 이어하기 되는 대량 수집기 (backfill)
+# ==========================================
+# bulk_collect / bulk_collect_keywords 처럼 키워드마다 과거 기사를 페이지 단위로 모으되
+# - (키워드, 페이지)마다 "다 끝났음"을 로컬 상태 DB(SQLite)에 기록하고
+# - 페이지를 받는 즉시 DB에 저장(커밋)한 뒤에 완료 표시를 하므로
+# 중간에 죽어도 다시 실행하면 정확히 끊긴 페이지부터 이어서 진행합니다.
+# --shards N 이면 키워드를 N조각으로 나눠 프로세스 N개가 동시에 수집합니다.
+#
+#   python scripts/backfill_runner.py                     # bias_data_final.csv 키워드 전체
+#   python scripts/backfill_runner.py --preset categories # bulk_collect처럼 '정치 외교' 등 분야 검색
+#   python scripts/backfill_runner.py --status            # 진행 상황만 보기
+DB_HOST = os.getenv("DB_HOST")
+DB_USER = os.getenv("DB_USER")
+DB_PASS = os.getenv("DB_PASS")
+DB_NAME = os.getenv("DB_NAME")
+try:
+    DB_PORT = int(os.getenv("DB_PORT"))
+except:
+    DB_PORT = 3306
+
+KEYWORDS_FILE = os.path.join(BASE_DIR, 'data', 'bias_data_final.csv')
+STATE_PATH = os.path.join(BASE_DIR, 'cache', 'backfill_state.sqlite')
+RESPONSE_CACHE_DIR = os.path.join(BASE_DIR, 'cache', 'naver_responses')
+
+MAX_NEWS_PER_KEYWORD = 500
+PAGE_SIZE = 100  # 네이버 API 최대 display
+TARGET_CATEGORIES = ['정치 외교', '정치 안보', '정치 사법', '정치 노동', '정치 환경']
+
+# ==========================================
+# [상태 저장소] (키워드, 페이지) 완료 기록
+# ==========================================
+class BackfillState:
+    """여러 프로세스가 같이 쓰므로 WAL 모드 + 대기 시간"""
+    def __init__(self, path=STATE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path, timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                query TEXT NOT NULL,
+                sort TEXT NOT NULL,
+                start INTEGER NOT NULL,
+                items INTEGER NOT NULL,
+                inserted INTEGER NOT NULL,
+                last_page INTEGER NOT NULL,
+                done_at REAL NOT NULL,
+                PRIMARY KEY (query, sort, start)
+            )""")
+        self.db.commit()
+
+    def done_pages(self, query, sort):
+        """{start: last_page 여부}"""
+        rows = self.db.execute("SELECT start, last_page FROM pages WHERE query = ? AND sort = ?", (query, sort))
+        return {start: bool(last) for start, last in rows}
+
+    def mark(self, query, sort, start, items, inserted, last_page):
+        self.db.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (query, sort, start, items, inserted, int(last_page), time.time()))
+        self.db.commit()
+
+    def summary(self):
+        return self.db.execute(
+            "SELECT query, COUNT(*), SUM(items), SUM(inserted), MAX(last_page) FROM pages GROUP BY query, sort "
+            "ORDER BY query").fetchall()
+
+    def reset(self):
+        self.db.execute("DELETE FROM pages")
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+# ==========================================
+# [수집] 샤드 1개 (프로세스 1개)
+# ==========================================
+def get_db_connection():
+    return pymysql.connect(host=DB_HOST, user=DB_USER, password=DB_PASS, db=DB_NAME, port=DB_PORT, charset='utf8mb4')
+
+def load_tasks(preset):
+    """(검색어, 저장할 카테고리) 목록"""
+    if preset == 'categories':
+        return [(q, q.replace("정치 ", "")) for q in TARGET_CATEGORIES]  # "정치 외교" -> "외교"
+    try:
+        df = pd.read_csv(KEYWORDS_FILE)
+    except:
+        df = pd.read_csv(KEYWORDS_FILE, encoding='cp949')
+    return list(dict.fromkeys(zip(df['keyword'], df['category'])))
+
+def page_starts(max_items):
+    return [s for s in range(1, max_items + 1, PAGE_SIZE) if s <= MAX_START]
+
+def run_shard(shard, shards, tasks, max_items, sort, use_cache):
+    """tasks 중 shard번째 조각을 수집. Return: (처리한 페이지 수, 새로 저장한 기사 수)"""
+    my_tasks = tasks[shard::shards]
+    state = BackfillState()
+    # 프로세스가 여러 개면 초당/하루 호출 한도도 나눠서 씀
+    client = NaverNewsClient(os.getenv("NAVER_CLIENT_ID"), os.getenv("NAVER_CLIENT_SECRET"),
+                             rate_per_sec=RATE_PER_SEC / shards, daily_quota=DAILY_QUOTA // shards)
+    if use_cache:
+        client.enable_cache(ResponseCache(RESPONSE_CACHE_DIR))
+
+    conn = get_db_connection()
+    cur = conn.cursor()
+    ensure_link_hash(cur)
+    conn.commit()
+    # 페이지마다 직접 flush하므로 크기/시간 기준은 넉넉하게
+    writer = ArticleWriter(conn, ['category', 'title', 'link', 'description'], now_columns=['created_at'],
+                           flush_size=PAGE_SIZE + 1, flush_interval=float('inf'))
+
+    pages = 0
+    try:
+        for query, category in my_tasks:
+            done = state.done_pages(query, sort)
+            if any(done.values()):
+                continue  # 마지막 페이지까지 이미 끝난 검색어
+            finished = False
+            for start in page_starts(max_items):
+                if start in done:
+                    continue
+                try:
+                    items = client.search(query, display=PAGE_SIZE, start=start, sort=sort)
+                except QuotaExceeded:
+                    raise
+                except Exception as e:
+                    # 이 검색어는 다음 실행 때 이 페이지부터 다시
+                    print(f"⚠️ '{query}' {start}번째부터 요청 실패: {e}")
+                    break
+                before, failed_before = writer.inserted, writer.failed
+                for item in map(normalize_item, items):
+                    writer.add({'category': category, 'title': item['title'],
+                                'link': item['link'], 'description': item['description']})
+                writer.flush()  # 페이지 단위로 DB 커밋 -> 그 다음에 완료 표시
+                if writer.failed > failed_before:
+                    # 저장 못 한 기사가 있으면 완료 표시 없이 다음 실행 때 이 페이지부터 다시
+                    print(f"⚠️ '{query}' {start}번째 페이지 저장 실패 {writer.failed - failed_before}건")
+                    break
+                last_page = len(items) < PAGE_SIZE or start + PAGE_SIZE > min(max_items, MAX_START)
+                state.mark(query, sort, start, len(items), writer.inserted - before, last_page)
+                pages += 1
+                if last_page:
+                    finished = True
+                    break
+            if finished:
+                print(f"   [샤드 {shard + 1}/{shards}] '{query}' 완료 (누적 저장 {writer.inserted}건)")
+    except QuotaExceeded as e:
+        print(f"🛑 [샤드 {shard + 1}/{shards}] {e} - 내일 다시 실행하면 이어서 진행합니다.")
+    except Exception as e:
+        print(f"❌ [샤드 {shard + 1}/{shards}] 중단: {e} - 다시 실행하면 이어서 진행합니다.")
+    finally:
+        conn.close()
+        state.close()
+        client.close()
+    return pages, writer.inserted
+
+# ==========================================
+# [메인]
+# ==========================================
+def print_status(tasks, sort):
+    state = BackfillState()
+    rows = {q: r for q, *r in state.summary()}
+    finished = 0
+    for query, _ in tasks:
+        if query in rows:
+            n_pages, n_items, n_inserted, last = rows[query]
+            finished += bool(last)
+            print(f"   {'✅' if last else '⏳'} {query}: {n_pages}페이지 / {n_items}건 (새로 저장 {n_inserted}건)")
+        else:
+            print(f"   ⬜ {query}: 시작 전")
+    print(f"📊 완료 {finished}/{len(tasks)}개 검색어")
+    state.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="이어하기 되는 네이버 뉴스 대량 수집")
+    parser.add_argument('--preset', choices=['keywords', 'categories'], default='keywords',
+                        help="keywords: bias_data_final.csv 키워드 / categories: 정치 분야 검색어")
+    parser.add_argument('--max-per-keyword', type=int, default=MAX_NEWS_PER_KEYWORD, help="검색어당 최대 기사 수 (최대 1000)")
+    parser.add_argument('--sort', choices=['sim', 'date'], default='sim', help="sim: 정확도순(과거 기사) / date: 최신순")
+    parser.add_argument('--shards', type=int, default=1, help="검색어를 나눠 동시에 돌릴 프로세스 수")
+    parser.add_argument('--no-cache', action='store_true', help="응답 디스크 캐시 사용 안 함")
+    parser.add_argument('--status', action='store_true', help="진행 상황만 출력")
+    parser.add_argument('--reset', action='store_true', help="진행 기록을 지우고 처음부터")
+    args = parser.parse_args()
+
+    tasks = load_tasks(args.preset)
+    if args.status:
+        print_status(tasks, args.sort)
+        return
+    if args.reset:
+        BackfillState().reset()
+        print("🧹 진행 기록을 초기화했습니다.")
+
+    print(f"🚀 검색어 {len(tasks)}개 수집 시작 (검색어당 최대 {args.max_per_keyword}개 / 프로세스 {args.shards}개)")
+    t0 = time.time()
+    jobs = [(s, args.shards, tasks, args.max_per_keyword, args.sort, not args.no_cache) for s in range(args.shards)]
+    if args.shards == 1:
+        results = [run_shard(*jobs[0])]
+    else:
+        with Pool(args.shards) as pool:
+            results = pool.starmap(run_shard, jobs)
+
+    pages = sum(p for p, _ in results)
+    inserted = sum(n for _, n in results)
+    print(f"\n🎉 이번 실행: {pages}페이지 처리 / 새 기사 {inserted}건 저장 ({time.time() - t0:.1f}초)")
+    print_status(tasks, args.sort)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+import sys
+import os
+import time
+
+# 현재 파일의 위치를 기준으로, 한 단계 위(부모 폴더)를 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from analysis_service import BiasAnalyzer, ARTIFACT_PATH
+
+# ==========================================
+# [빌드] 분석기 사전/기준점 결과물 만들기
+# ==========================================
+# bias_data_final.csv나 모델을 바꾼 뒤 한 번 실행해두면
+# app.py / bot.py / 스크립트들이 시작할 때 사전 구축(형태소 분석)을 건너뜁니다.
+# (실행하지 않아도 분석기가 처음 뜰 때 자동으로 만들어집니다)
+
+if __name__ == "__main__":
+    start = time.time()
+    analyzer = BiasAnalyzer(use_artifact=False)
+    analyzer.save_artifact()
+    print(f"✅ 결과물 저장 완료 ({time.time() - start:.1f}초): {ARTIFACT_PATH}")
+    print(f"   - 키: {analyzer.artifact_key()}")
+    print(f"   - 사용자 사전 단어 {len(analyzer.user_words)}개 / 반대어 기준점 {len(analyzer.antonym_vec_map)}개")
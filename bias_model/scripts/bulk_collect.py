@@ -6,11 +6,10 @@ sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
 
 # (이 아래에 원래 있던 import 코드들이 오면 됩니다)
 from analysis_service import BiasAnalyzer
+from naver_client import get_client, normalize_item
+from response_cache import ResponseCache
 import pandas as pd
-import requests
-import re
 import pymysql
-import time
 from tqdm import tqdm
 from dotenv import load_dotenv
 
@@ -34,34 +33,14 @@ DB_PORT = int(os.getenv("DB_PORT"))
 TARGET_CATEGORIES = ['정치 외교', '정치 안보', '정치 사법', '정치 노동', '정치 환경']
 MAX_NEWS_PER_CATEGORY = 1000 
 
+# 다시 돌릴 때 이미 받은 페이지는 디스크 캐시에서 읽음 (TTL 7일, 최대 500MB)
+RESPONSE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(os.path.dirname(__file__))), 'cache', 'naver_responses')
+
 def get_naver_news_bulk(keyword, total_count):
-    news_list = []
-    # 네이버 API는 한 번에 100개까지만 줌 -> 반복 호출 필요
-    for start_index in range(1, total_count, 100):
-        url = "https://openapi.naver.com/v1/search/news.json"
-        headers = {"X-Naver-Client-Id": NAVER_CLIENT_ID, "X-Naver-Client-Secret": NAVER_CLIENT_SECRET}
-        params = {
-            "query": keyword,
-            "display": 100, # 최대 100
-            "start": start_index, 
-            "sort": "sim" # 정확도순 (또는 'date' 최신순)
-        }
-        try:
-            resp = requests.get(url, headers=headers, params=params)
-            if resp.status_code == 200:
-                items = resp.json().get('items', [])
-                if not items: break # 더 이상 기사가 없으면 중단
-                news_list.extend(items)
-            else:
-                print(f"API Error: {resp.status_code}")
-                break
-        except Exception as e:
-            print(f"Request Error: {e}")
-            break
-        
-        time.sleep(0.5) # API 매너
-        
-    return news_list[:total_count] # 정확히 목표 개수만큼 자르기
+    # 네이버 API는 한 번에 100개까지만 줌 -> 공용 클라이언트가 페이지를 넘기며 목표 개수만큼 수집
+    # (호출 간격은 클라이언트의 속도 제한이 지켜줌)
+    return get_client().collect(keyword, max_items=total_count, display=100,
+                                sort="sim")  # 정확도순 (또는 'date' 최신순)
 
 def save_bulk_to_db(data_list):
     if not data_list: return
@@ -89,6 +68,7 @@ def save_bulk_to_db(data_list):
         if conn: conn.close()
 
 def main():
+    get_client().enable_cache(ResponseCache(RESPONSE_CACHE_DIR))
     print("🚀 과거 기사 대량 수집 시작...")
     all_data = []
     
@@ -96,18 +76,16 @@ def main():
         print(f"\n[{category}] 분야 수집 중...")
         items = get_naver_news_bulk(category, MAX_NEWS_PER_CATEGORY)
         
-        for item in items:
-            title = re.sub(r'<.*?>|&quot;|&gt;|&lt;', '', item['title'])
-            desc = re.sub(r'<.*?>|&quot;|&gt;|&lt;', '', item['description'])
-            
+        for item in map(normalize_item, items):
             all_data.append({
                 'category': category.replace("정치 ", ""), # "정치 외교" -> "외교"
-                'title': title,
-                'link': item['originallink'] or item['link'],
-                'description': desc
+                'title': item['title'],
+                'link': item['link'],
+                'description': item['description']
             })
             
     save_bulk_to_db(all_data)
+    print(f"📦 API 호출 통계: {get_client().stats()}")
     print("\n🎉 대량 수집 끝! 이제 export_csv.py를 실행해서 CSV를 뽑아주세요.")
 
 if __name__ == "__main__":
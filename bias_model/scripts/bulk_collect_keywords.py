@@ -24,11 +24,11 @@ else:
 # 4. 모듈 Import & 설정
 # ========================================================
 from analysis_service import BiasAnalyzer
+from watermark import WatermarkStore
+from naver_client import get_client, normalize_item
+from response_cache import ResponseCache
 import pandas as pd
-import requests
-import re
 import pymysql
-import time
 from tqdm import tqdm
 
 # 5. API 키 확인 (디버깅용 - 실행 시 ID가 보여야 성공!)
@@ -70,40 +70,31 @@ if not os.path.exists(KEYWORDS_FILE):
 # 500으로 설정하면 -> 115개 키워드 * 500 = 57,500개 (약 1시간+ 소요, 6개월치 충분)
 MAX_NEWS_PER_KEYWORD = 500 
 
+# 키워드별 기준선 (지난 실행에서 가져온 기사 링크) - 다시 돌릴 때 이미 본 페이지에서 멈춤
+WATERMARK_PATH = os.path.join(BASE_DIR, 'cache', 'watermarks_backfill.json')
+watermarks = WatermarkStore(WATERMARK_PATH)
+
+# 다시 돌릴 때 이미 받은 페이지는 디스크 캐시에서 읽음 (TTL 7일, 최대 500MB)
+RESPONSE_CACHE_DIR = os.path.join(BASE_DIR, 'cache', 'naver_responses')
+
+ER_DUP_ENTRY = 1062   # MySQL 중복 키 오류 (이미 저장된 기사)
+
 def get_naver_news_past(keyword, total_count):
     news_list = []
-    # 100개씩 끊어서 과거 페이지로 넘어감 (Pagination)
-    for start_index in range(1, total_count, 100):
-        if start_index > 1000: break # 네이버 API 최대 한계
-
-        url = "https://openapi.naver.com/v1/search/news.json"
-        headers = {"X-Naver-Client-Id": NAVER_CLIENT_ID, "X-Naver-Client-Secret": NAVER_CLIENT_SECRET}
-        params = {
-            "query": keyword,
-            "display": 100,
-            "start": start_index, 
-            "sort": "sim"  # 'sim'(정확도순)을 쓰면 과거의 중요한 기사도 잘 나옵니다.
-                           # 'date'(날짜순)을 쓰면 무조건 최신부터 가져옵니다.
-        }
-        try:
-            resp = requests.get(url, headers=headers, params=params)
-            if resp.status_code == 200:
-                items = resp.json().get('items', [])
-                if not items: break
-                news_list.extend(items)
-            else:
-                print(f"API Error: {resp.status_code}")
-                break
-        except Exception as e:
-            print(f"Request Error: {e}")
-            break
-        
-        time.sleep(0.3) # API 보호용 딜레이
+    # 100개씩 끊어서 과거 페이지로 넘어감 (Pagination, 네이버 API 최대 1000개까지)
+    # 'sim'(정확도순)을 쓰면 과거의 중요한 기사도 잘 나옵니다. ('date'(날짜순)을 쓰면 무조건 최신부터)
+    for items in get_client().iter_pages(keyword, max_items=total_count, display=100, sort="sim"):
+        # 정확도순이라 날짜 대신 링크로만 판단: 페이지 전체가 이미 본 기사면 더 넘기지 않음
+        new_items = watermarks.unseen(keyword, items, by_date=False)
+        if not new_items: break
+        news_list.extend(new_items)
         
     return news_list[:total_count]
 
 def save_bulk_to_db(data_list):
-    if not data_list: return
+    """Return: DB에 들어갔거나 이미 있던 기사 링크 set (DB 오류로 못 넣은 기사는 빠짐 → 기준선에 안 올림)"""
+    stored = set()
+    if not data_list: return stored
     conn = None
     try:
         conn = pymysql.connect(host=DB_HOST, user=DB_USER, password=DB_PASS, db=DB_NAME, port=DB_PORT, charset='utf8')
@@ -113,15 +104,21 @@ def save_bulk_to_db(data_list):
         sql = "INSERT INTO news (category, title, link, description) VALUES (%s, %s, %s, %s)"
         
         success = 0
+        done = set()
         # executemany를 쓰면 더 빠르지만, 오류 확인을 위해 반복문 사용
         for item in data_list:
             try:
                 cur.execute(sql, (item['category'], item['title'], item['link'], item['description']))
                 success += 1
-            except:
-                pass # 중복 기사 등은 무시
+                done.add(item['link'])
+            except pymysql.err.IntegrityError as e:
+                if e.args and e.args[0] == ER_DUP_ENTRY:
+                    done.add(item['link'])   # 이미 있는 기사
+            except Exception:
+                pass # 그 밖의 실패는 다음 실행 때 다시 가져옴
         
         conn.commit()
+        stored = done   # 커밋까지 끝나야 저장된 것으로 침
         # 중간 점검 출력
         if success > 0:
             print(f"   └─ {success}건 저장 완료")
@@ -130,8 +127,11 @@ def save_bulk_to_db(data_list):
         print(f"DB Error: {e}")
     finally:
         if conn: conn.close()
+    return stored
 
 def main():
+    get_client().enable_cache(ResponseCache(RESPONSE_CACHE_DIR))
+
     # 1. 키워드 파일 로드
     try:
         df = pd.read_csv(KEYWORDS_FILE)
@@ -150,21 +150,22 @@ def main():
         
         # DB 저장용 데이터 가공
         db_data = []
-        for item in items:
-            title = re.sub(r'<.*?>|&quot;|&gt;|&lt;', '', item['title'])
-            desc = re.sub(r'<.*?>|&quot;|&gt;|&lt;', '', item['description'])
-            
+        for item in map(normalize_item, items):
             db_data.append({
                 'category': category,
-                'title': title,
-                'link': item['originallink'] or item['link'],
-                'description': desc
+                'title': item['title'],
+                'link': item['link'],
+                'description': item['description']
             })
         
         # 바로바로 저장 (메모리 절약)
-        save_bulk_to_db(db_data)
-        time.sleep(0.5)
+        stored = save_bulk_to_db(db_data)
+        # 저장됐거나 이미 있던 기사만 "본 기사"로 기록 (bot.py의 on_flushed와 같은 방식)
+        stored_items = [item for item, data in zip(items, db_data) if data['link'] in stored]
+        watermarks.update(keyword, stored_items, new_count=len(items), fetched=items)
+        watermarks.save()
 
+    print(f"📦 API 호출 통계: {get_client().stats()}")
     print("\n🎉 6개월치(추정) 데이터 수집 완료! export_csv.py를 실행하세요.")
 
 if __name__ == "__main__":
@@ -0,0 +1,129 @@
+import sys
+import os
+
+# 현재 파일의 위치를 기준으로, 한 단계 위(부모 폴더)를 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+import argparse
+import time
+from collections import Counter
+from multiprocessing import Pool
+
+import pymysql
+from dotenv import load_dotenv
+
+from job_leases import LeaseQueue
+
+# .env 파일에 있는 내용을 불러옵니다 (로컬 테스트용 MySQL 8.0+ 권장)
+load_dotenv()
+
+DB_HOST = os.getenv("DB_HOST")
+DB_USER = os.getenv("DB_USER")
+DB_PASS = os.getenv("DB_PASS")
+DB_NAME = os.getenv("DB_NAME")
+DB_PORT = int(os.getenv("DB_PORT"))
+
+# 실제 봇('bot')/auto_system('auto') 기록과 섞이지 않도록 테스트 전용 source 사용
+TEST_SOURCE = 'lease_check'
+
+# ==========================================
+# KEYWORD_LEASES 동작 확인 (여러 프로세스 동시 임대 / 만료 / heartbeat)
+# ==========================================
+# 사용법: python scripts/check_job_leases.py --workers 8 --keywords 200
+
+def get_db_connection():
+    return pymysql.connect(host=DB_HOST, user=DB_USER, password=DB_PASS, db=DB_NAME, port=DB_PORT, charset='utf8mb4')
+
+def worker(args):
+    """키워드를 빌려서 (가짜로) 일하고 반납 - 빌린 키워드 목록을 돌려줌"""
+    index, claim_limit, work_sec = args
+    queue = LeaseQueue(get_db_connection, TEST_SOURCE, worker_id=f"check-{index}", lease_seconds=60)
+    got = []
+    try:
+        while True:
+            claimed = queue.claim(claim_limit)
+            if not claimed:
+                return got
+            for c in claimed:
+                time.sleep(work_sec)
+                queue.complete(c['keyword'], 3600, rate=1.0)
+                got.append(c['keyword'])
+    finally:
+        queue.close()
+
+def reset(queue, n_keywords):
+    cur = queue.conn.cursor()
+    cur.execute("DELETE FROM KEYWORD_LEASES WHERE source = %s", (TEST_SOURCE,))
+    queue.conn.commit()
+    queue.sync_keywords([f"kw{i:04d}" for i in range(n_keywords)])
+
+def check_concurrent(queue, workers, n_keywords, claim_limit, work_sec):
+    print(f"\n1️⃣ 동시 임대: 작업자 {workers}개, 키워드 {n_keywords}개")
+    reset(queue, n_keywords)
+    t0 = time.time()
+    with Pool(workers) as pool:
+        results = pool.map(worker, [(i, claim_limit, work_sec) for i in range(workers)])
+    counts = Counter(kw for got in results for kw in got)
+    doubled = [kw for kw, c in counts.items() if c > 1]
+    print(f"   작업자별 처리 수: {[len(got) for got in results]} ({time.time() - t0:.1f}초)")
+    print(f"   처리된 키워드 {len(counts)}/{n_keywords}개, 두 번 이상 처리 {len(doubled)}개")
+    return len(counts) == n_keywords and not doubled
+
+def check_expiry(queue):
+    print("\n2️⃣ 임대 만료: 작업자 A가 빌리고 죽으면 B가 다시 가져가는지")
+    reset(queue, 1)
+    a = LeaseQueue(get_db_connection, TEST_SOURCE, worker_id='check-A', lease_seconds=2)
+    b = LeaseQueue(get_db_connection, TEST_SOURCE, worker_id='check-B', lease_seconds=2)
+    try:
+        first = a.claim(1)
+        blocked = b.claim(1)
+        time.sleep(3)
+        retaken = b.claim(1)
+        late = a.complete('kw0000', 3600)   # 이미 뺏긴 임대로는 반납 안 됨
+        print(f"   A 임대 {len(first)}개 → B 즉시 시도 {len(blocked)}개 → 만료 후 B {len(retaken)}개, A 늦은 반납 {late}건")
+        return len(first) == 1 and not blocked and len(retaken) == 1 and late == 0
+    finally:
+        a.close()
+        b.close()
+
+def check_heartbeat(queue):
+    print("\n3️⃣ heartbeat: 오래 걸리는 작업은 임대가 계속 연장되는지")
+    reset(queue, 1)
+    a = LeaseQueue(get_db_connection, TEST_SOURCE, worker_id='check-A', lease_seconds=3)
+    b = LeaseQueue(get_db_connection, TEST_SOURCE, worker_id='check-B', lease_seconds=3)
+    try:
+        claimed = a.claim(1)
+        with a.heartbeating([c['keyword'] for c in claimed], interval=1):
+            time.sleep(5)
+            stolen = b.claim(1)
+        done = a.complete('kw0000', 3600)
+        print(f"   임대 시간(3초)보다 긴 5초 작업 중 B가 가져간 수 {len(stolen)}개, A 반납 {done}건")
+        return not stolen and done == 1
+    finally:
+        a.close()
+        b.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="KEYWORD_LEASES 임대 큐 동작 확인 (로컬 MySQL)")
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--keywords', type=int, default=200)
+    parser.add_argument('--claim-limit', type=int, default=3)
+    parser.add_argument('--work-sec', type=float, default=0.01, help="키워드 1개 처리에 걸리는 가짜 작업 시간")
+    args = parser.parse_args()
+
+    queue = LeaseQueue(get_db_connection, TEST_SOURCE, worker_id='check-main')
+    queue.ensure_table()
+    results = {
+        '동시 임대': check_concurrent(queue, args.workers, args.keywords, args.claim_limit, args.work_sec),
+        '임대 만료': check_expiry(queue),
+        'heartbeat': check_heartbeat(queue),
+    }
+    cur = queue.conn.cursor()
+    cur.execute("DELETE FROM KEYWORD_LEASES WHERE source = %s", (TEST_SOURCE,))
+    queue.conn.commit()
+    queue.close()
+
+    print("\n📋 결과")
+    for name, ok in results.items():
+        print(f"   {'✅' if ok else '❌'} {name}")
+    sys.exit(0 if all(results.values()) else 1)
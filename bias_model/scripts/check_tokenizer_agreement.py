@@ -0,0 +1,75 @@
+import sys
+import os
+import time
+
+# 현재 파일의 위치를 기준으로, 한 단계 위(부모 폴더)를 경로에 추가
+BASE_DIR = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+sys.path.append(BASE_DIR)
+
+from analysis_service import BiasAnalyzer
+import pandas as pd
+from tqdm import tqdm
+
+# ==========================================
+# [비교] Okt(Twitter) vs 어휘 토크나이저 일치도 / 속도 측정
+# ==========================================
+# 사용법: python scripts/check_tokenizer_agreement.py [코퍼스 CSV] [최대 기사 수]
+# 코퍼스 기본값: direct_collect_csv.py가 만든 data/algoriverse_corpus_final.csv
+CORPUS_CSV = os.path.join(BASE_DIR, 'data', 'algoriverse_corpus_final.csv')
+JUDGE_THRESHOLD = 0.03  # update_db_scores.py와 같은 판정 기준
+
+def judge(score):
+    if score is None: return None
+    if score > JUDGE_THRESHOLD: return 'CONS'
+    if score < -JUDGE_THRESHOLD: return 'PROG'
+    return 'NEUTRAL'
+
+def main():
+    corpus_path = sys.argv[1] if len(sys.argv) > 1 else CORPUS_CSV
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    df = pd.read_csv(corpus_path).head(limit)
+    texts = [f"{t} {d}" for t, d in zip(df['title'].fillna(''), df['description'].fillna(''))]
+    print(f"📂 코퍼스: {corpus_path} ({len(texts)}건)")
+
+    # 캐시가 측정을 방해하지 않도록 디스크 캐시는 끔
+    okt = BiasAnalyzer(token_cache_path=None)
+    fast = BiasAnalyzer(token_cache_path=None, tokenizer='vocab')
+
+    # 1. 속도 (캐시를 거치지 않은 순수 토크나이저)
+    start = time.time()
+    okt_tokens = [okt.token_rows(okt._raw_nouns(t)) for t in tqdm(texts, desc="Okt")]
+    okt_sec = time.time() - start
+
+    start = time.time()
+    fast_tokens = [fast.token_rows(fast._raw_nouns(t)) for t in tqdm(texts, desc="Vocab")]
+    fast_sec = time.time() - start
+
+    # 2. 분석에 실제로 쓰이는 단어(어휘 안, 2글자 이상) 기준 일치도
+    jaccards, exact = [], 0
+    for a, b in zip(okt_tokens, fast_tokens):
+        sa, sb = set(a), set(b)
+        jaccards.append(len(sa & sb) / len(sa | sb) if sa | sb else 1.0)
+        exact += sa == sb
+
+    # 3. 점수/판정 일치도 (기사에서 처음 발견된 키워드 기준)
+    diffs, same_judge, scored = [], 0, 0
+    for title, desc in zip(df['title'].fillna(''), df['description'].fillna('')):
+        kw = next((k for k in okt.df_conf['keyword'] if k in title or k in desc), None)
+        if kw is None: continue
+        s1, s2 = okt.analyze_article(title, desc, kw), fast.analyze_article(title, desc, kw)
+        if s1 is None or s2 is None: continue
+        scored += 1
+        diffs.append(abs(s1 - s2))
+        same_judge += judge(s1) == judge(s2)
+
+    print("\n📊 [토크나이저 비교 결과]")
+    print(f"   - 속도: Okt {okt_sec:.2f}초 / 어휘 {fast_sec:.2f}초 (x{okt_sec / max(fast_sec, 1e-9):.1f})")
+    print(f"   - 단어 집합 평균 Jaccard: {sum(jaccards) / len(jaccards):.4f}")
+    print(f"   - 단어 집합 완전 일치: {exact / len(texts) * 100:.1f}%")
+    if scored:
+        print(f"   - 점수 비교 기사 {scored}건: 평균 차이 {sum(diffs) / scored:.4f} / 최대 {max(diffs):.4f}")
+        print(f"   - 판정(CONS/PROG/NEUTRAL) 일치율: {same_judge / scored * 100:.1f}%")
+
+if __name__ == "__main__":
+    main()
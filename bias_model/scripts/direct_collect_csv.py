@@ -14,10 +14,9 @@ sys.path.append(BASE_DIR)
 # 2. Import
 # ========================================================
 from analysis_service import BiasAnalyzer
+from naver_client import get_client, normalize_item
+from response_cache import ResponseCache
 import pandas as pd
-import requests
-import re
-import time
 from tqdm import tqdm
 from dotenv import load_dotenv
 
@@ -41,6 +40,9 @@ INPUT_CSV = os.path.join(BASE_DIR, 'data', 'bias_data_final.csv')
 # 저장할 파일: data/algoriverse_corpus_final.csv (여기에 저장해야 깔끔함)
 OUTPUT_CSV = os.path.join(BASE_DIR, 'data', 'algoriverse_corpus_final.csv')
 
+# 다시 돌릴 때 이미 받은 페이지는 디스크 캐시에서 읽음 (TTL 7일, 최대 500MB)
+RESPONSE_CACHE_DIR = os.path.join(BASE_DIR, 'cache', 'naver_responses')
+
 # 파일 확인 (디버깅용)
 if not os.path.exists(INPUT_CSV):
     print(f"❌ 오류: 입력 파일을 찾을 수 없습니다!")
@@ -50,6 +52,8 @@ else:
     print(f"📂 저장 경로 설정 완료: {OUTPUT_CSV}")
 
 def main():
+    get_client().enable_cache(ResponseCache(RESPONSE_CACHE_DIR))
+
     # 1. 키워드 파일 읽기
     try:
         df_conf = pd.read_csv(INPUT_CSV)
@@ -68,31 +72,22 @@ def main():
         category = row['category']
         
         # 'sim'(관련도순)으로 해야 과거 '검수완박' 같은 기사가 잡힙니다.
-        url = "https://openapi.naver.com/v1/search/news.json"
-        headers = {"X-Naver-Client-Id": NAVER_CLIENT_ID, "X-Naver-Client-Secret": NAVER_CLIENT_SECRET}
-        params = {"query": keyword, "display": 100, "sort": "sim"}
-        
+        # (호출 간격은 공용 클라이언트의 속도 제한이 지켜줌)
         try:
-            resp = requests.get(url, headers=headers, params=params, timeout=5)
-            if resp.status_code == 200:
-                items = resp.json().get('items', [])
-                for item in items:
-                    title = re.sub(r'<.*?>|&quot;|&gt;|&lt;', '', item['title'])
-                    desc = re.sub(r'<.*?>|&quot;|&gt;|&lt;', '', item['description'])
-                    
-                    all_news.append({
-                        'category': category,
-                        'title': title,
-                        'link': item['originallink'] or item['link'],
-                        'description': desc,
-                        'content': title + " " + desc  # 학습용 컬럼 미리 생성
-                    })
-            else:
-                print(f"API Error ({resp.status_code})")
+            items = get_client().collect(keyword, max_items=100, display=100, sort="sim")
+            for item in map(normalize_item, items):
+                title, desc = item['title'], item['description']
+                all_news.append({
+                    'category': category,
+                    'title': title,
+                    'link': item['link'],
+                    'description': desc,
+                    'content': title + " " + desc  # 학습용 컬럼 미리 생성
+                })
         except Exception as e:
             print(f"Connection Error: {e}")
-        
-        time.sleep(0.1) # 차단 방지
+
+    print(f"📦 API 호출 통계: {get_client().stats()}")
 
     # 3. 데이터프레임 변환 및 중복 제거
     if all_news:
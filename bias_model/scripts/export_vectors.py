@@ -0,0 +1,29 @@
+import sys
+import os
+import time
+
+# 현재 파일의 위치를 기준으로, 한 단계 위(부모 폴더)를 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from analysis_service import export_vectors, MODEL_PATH, VECTORS_DIR
+
+# ==========================================
+# [배포용] Word2Vec 모델 -> mmap용 벡터(.npy) 내보내기
+# ==========================================
+# 모델을 새로 학습했을 때 한 번만 실행하면 됩니다.
+# 이후 app.py / bot.py / 재분석 스크립트는 이 폴더를 mmap으로 읽어서
+# 같은 서버의 여러 프로세스가 메모리(페이지 캐시) 1벌을 같이 씁니다.
+
+if __name__ == "__main__":
+    if not os.path.exists(MODEL_PATH):
+        print(f"❌ 모델 파일을 찾을 수 없습니다: {MODEL_PATH}")
+        sys.exit()
+
+    print(f"📂 원본 모델: {MODEL_PATH}")
+    start = time.time()
+    out_dir = export_vectors()
+    print(f"✅ 내보내기 완료 ({time.time() - start:.1f}초): {out_dir}")
+
+    for name in sorted(os.listdir(VECTORS_DIR)):
+        size_mb = os.path.getsize(os.path.join(VECTORS_DIR, name)) / 1024 / 1024
+        print(f"   - {name} ({size_mb:.1f} MB)")
@@ -1,10 +1,7 @@
 import sys
 import os
 import pandas as pd
-import requests
-import re
 import pymysql
-import time
 from tqdm import tqdm
 from dotenv import load_dotenv
 
@@ -13,12 +10,16 @@ from dotenv import load_dotenv
 # ========================================================
 # 현재 파일 위치를 기준으로 부모 폴더(bias_model)를 찾습니다.
 BASE_DIR = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+sys.path.append(BASE_DIR)  # naver_client import용
 
 # ========================================================
 # 2. .env 파일 로딩 (위치 명시)
 # ========================================================
 load_dotenv(os.path.join(BASE_DIR, '.env'))
 
+from db_writer import ensure_link_hash, link_hash
+from naver_client import get_client, normalize_item
+
 # ==========================================
 # [설정] 본인의 DB 및 API 정보
 # ==========================================
@@ -46,6 +47,7 @@ def save_to_db(data_list):
     try:
         conn = pymysql.connect(host=DB_HOST, user=DB_USER, password=DB_PASS, db=DB_NAME, port=DB_PORT, charset='utf8')
         cur = conn.cursor()
+        ensure_link_hash(cur)  # 같은 기사는 link_hash UNIQUE 인덱스로 걸러짐
         
         # ==========================================
         # [수정] 테이블명 변경 (news -> NEWS_ARTICLES)
@@ -54,14 +56,15 @@ def save_to_db(data_list):
         # created_at(수집시간)도 같이 넣어주는 게 좋습니다 (NOW())
         sql = """
             INSERT INTO NEWS_ARTICLES 
-            (category, title, link, description, created_at) 
-            VALUES (%s, %s, %s, %s, NOW())
+            (category, title, link, description, link_hash, created_at) 
+            VALUES (%s, %s, %s, %s, %s, NOW())
         """
         
         for item in data_list:
             try:
                 # 튜플로 데이터 전달
-                cur.execute(sql, (item['category'], item['title'], item['link'], item['description']))
+                cur.execute(sql, (item['category'], item['title'], item['link'], item['description'],
+                                  link_hash(item['link'])))
             except Exception as e:
                 pass # 중복 기사는 무시
         
@@ -91,29 +94,20 @@ def main():
         
         # ★ 핵심: sort='sim' (정확도순)으로 해야 과거의 핫했던 기사가 나옴
         # (sort='date'로 하면 오늘 날짜 기사만 나와서 의미 없음)
-        url = "https://openapi.naver.com/v1/search/news.json"
-        headers = {"X-Naver-Client-Id": NAVER_CLIENT_ID, "X-Naver-Client-Secret": NAVER_CLIENT_SECRET}
-        params = {"query": keyword, "display": 100, "sort": "sim"}
-        
+        # (호출 간격은 공용 클라이언트의 속도 제한이 지켜줌)
         try:
-            resp = requests.get(url, headers=headers, params=params)
-            if resp.status_code == 200:
-                items = resp.json().get('items', [])
-                db_data = []
-                for item in items:
-                    title = re.sub(r'<.*?>|&quot;', '', item['title'])
-                    desc = re.sub(r'<.*?>|&quot;', '', item['description'])
-                    db_data.append({
-                        'category': category, 
-                        'title': title, 
-                        'link': item['originallink'] or item['link'], 
-                        'description': desc
-                    })
-                save_to_db(db_data)
+            items = get_client().collect(keyword, max_items=100, display=100, sort="sim")
+            db_data = []
+            for item in map(normalize_item, items):
+                db_data.append({
+                    'category': category, 
+                    'title': item['title'], 
+                    'link': item['link'], 
+                    'description': item['description']
+                })
+            save_to_db(db_data)
         except Exception as e:
             print(f"Error: {e}")
-            
-        time.sleep(0.1) # 네이버 API 차단 방지
 
     print("\n🎉 수집 완료! 이제 export_csv.py를 실행해서 파일을 추출하세요.")
 
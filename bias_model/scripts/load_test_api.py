@@ -0,0 +1,131 @@
+import sys
+import os
+
+# 현재 파일의 위치를 기준으로, 한 단계 위(부모 폴더)를 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+import argparse
+import json
+import threading
+import time
+import urllib.parse
+import urllib.request
+
+import pymysql
+from dotenv import load_dotenv
+
+from db_pool import ConnectionPool
+
+# .env 파일에 있는 내용을 불러옵니다
+load_dotenv()
+
+# ==========================================
+# 뉴스 API 부하 테스트 (처리량 / 지연시간 p50·p99)
+# ==========================================
+# 1) HTTP 모드: 실행 중인 app.py에 동시 요청을 보냄
+#    python scripts/load_test_api.py --url http://localhost:5000 --concurrency 32 --duration 20
+# 2) direct 모드: Flask 없이 DB만 - 요청마다 새 연결 vs 연결 풀 비교 (로컬 MySQL)
+#    python scripts/load_test_api.py --direct --concurrency 32 --duration 10
+DEFAULT_PATHS = ['/api/news', '/api/news?category=환경', '/api/news?category=노동']
+LIST_SQL = "SELECT * FROM NEWS_ARTICLES ORDER BY created_at DESC LIMIT 30"
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+def run_load(call, concurrency, duration):
+    """concurrency개 스레드가 duration초 동안 call()을 반복 → (지연시간 리스트, 에러 수, 실제 걸린 시간)"""
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + duration
+
+    def loop(i):
+        mine, failed = [], 0
+        n = 0
+        while time.perf_counter() < stop_at:
+            t0 = time.perf_counter()
+            try:
+                call(i, n)
+                mine.append(time.perf_counter() - t0)
+            except Exception:
+                failed += 1
+            n += 1
+        with lock:
+            latencies.extend(mine)
+            errors[0] += failed
+
+    t0 = time.perf_counter()
+    threads = [threading.Thread(target=loop, args=(i,)) for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return latencies, errors[0], time.perf_counter() - t0
+
+def report(name, latencies, errors, elapsed):
+    ms = [x * 1000 for x in latencies]
+    print(f"📊 {name}: {len(ms)}건 / {elapsed:.1f}초 = {len(ms) / elapsed:.1f} req/s, 에러 {errors}건")
+    print(f"   p50 {percentile(ms, 50):.1f}ms / p95 {percentile(ms, 95):.1f}ms / p99 {percentile(ms, 99):.1f}ms / "
+          f"max {max(ms, default=0):.1f}ms")
+
+def http_mode(args):
+    paths = args.path or DEFAULT_PATHS
+    urls = [args.url.rstrip('/') + urllib.parse.quote(p, safe='/?=&') for p in paths]
+
+    def call(i, n):
+        with urllib.request.urlopen(urls[(i + n) % len(urls)], timeout=30) as resp:
+            resp.read()
+
+    print(f"🚀 HTTP 부하 테스트: {args.url} (동시 {args.concurrency}, {args.duration}초, 경로 {len(urls)}개)")
+    report("HTTP", *run_load(call, args.concurrency, args.duration))
+    try:
+        with urllib.request.urlopen(args.url.rstrip('/') + '/api/health/pool', timeout=5) as resp:
+            print(f"   🏊 서버 연결 풀: {json.loads(resp.read())['data']}")
+    except Exception as e:
+        print(f"   ⚠️ 연결 풀 상태를 가져오지 못했습니다: {e}")
+
+def direct_mode(args):
+    db_config = {
+        'host': os.getenv("DB_HOST"), 'user': os.getenv("DB_USER"), 'password': os.getenv("DB_PASS"),
+        'db': os.getenv("DB_NAME"), 'port': int(os.getenv("DB_PORT")), 'charset': 'utf8mb4',
+    }
+
+    def per_request(i, n):
+        conn = pymysql.connect(**db_config)
+        try:
+            cur = conn.cursor()
+            cur.execute(LIST_SQL)
+            cur.fetchall()
+        finally:
+            conn.close()
+
+    pool = ConnectionPool(db_config, max_size=args.pool_size)
+
+    def pooled(i, n):
+        with pool.connection() as conn:
+            cur = conn.cursor()
+            cur.execute(LIST_SQL)
+            cur.fetchall()
+
+    print(f"🚀 DB 직접 부하 테스트 (동시 {args.concurrency}, {args.duration}초, 풀 크기 {args.pool_size})")
+    report("요청마다 새 연결", *run_load(per_request, args.concurrency, args.duration))
+    report("연결 풀", *run_load(pooled, args.concurrency, args.duration))
+    print(f"   🏊 풀 상태: {pool.stats()}")
+    pool.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="뉴스 API 부하 테스트")
+    parser.add_argument('--url', default='http://localhost:5000')
+    parser.add_argument('--path', action='append', help="요청할 경로 (여러 번 지정 가능)")
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--direct', action='store_true', help="Flask 없이 DB 연결 방식만 비교")
+    parser.add_argument('--pool-size', type=int, default=10)
+    args = parser.parse_args()
+
+    if args.direct:
+        direct_mode(args)
+    else:
+        http_mode(args)
@@ -0,0 +1,86 @@
+import sys
+import os
+
+# 현재 파일의 위치를 기준으로, 한 단계 위(부모 폴더)를 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+import argparse
+import time
+
+import pymysql
+from dotenv import load_dotenv
+from flask import Flask
+
+from compression import SUPPORTED, compress
+from news_query import LIST_DEFAULT_FIELDS, list_news, resolve_fields, table_columns
+
+# .env 파일에 있는 내용을 불러옵니다
+load_dotenv()
+
+DB_HOST = os.getenv("DB_HOST")
+DB_USER = os.getenv("DB_USER")
+DB_PASS = os.getenv("DB_PASS")
+DB_NAME = os.getenv("DB_NAME")
+DB_PORT = int(os.getenv("DB_PORT"))
+
+# ==========================================
+# /api/news 목록 응답 크기 / 직렬화 시간 비교 (예전 SELECT * vs 필드 선택 + 압축)
+# ==========================================
+# 실제 DB의 여러 페이지(카테고리 섞어서)를 그대로 읽어서 app.py와 같은 방식(Flask JSON)으로 직렬화합니다.
+# 사용법: python scripts/measure_news_payload.py [--pages 20] [--limit 30]
+
+def serialize_pages(json_provider, pages):
+    """페이지별 응답 JSON 바이트 + 걸린 시간(ms)"""
+    bodies = []
+    t0 = time.perf_counter()
+    for rows, next_cursor in pages:
+        payload = {'status': 'success', 'count': len(rows), 'data': rows, 'next_cursor': next_cursor}
+        bodies.append(json_provider.dumps(payload).encode('utf-8'))
+    return bodies, (time.perf_counter() - t0) * 1000
+
+def read_pages(cur, categories, pages, limit, fields):
+    result = []
+    for category in categories:
+        cursor = None
+        for _ in range(pages):
+            rows, cursor = list_news(cur, category=category, cursor=cursor, limit=limit, fields=fields)
+            result.append((rows, cursor))
+            if not cursor:
+                break
+    return result
+
+def report(name, json_provider, pages):
+    bodies, ser_ms = serialize_pages(json_provider, pages)
+    raw = sum(len(b) for b in bodies)
+    n = len(bodies)
+    print(f"\n📦 {name}: 응답 {n}개, 평균 {raw / n / 1024:.1f}KB, 직렬화 평균 {ser_ms / n:.2f}ms")
+    for enc in SUPPORTED:
+        t0 = time.perf_counter()
+        size = sum(len(compress(b, enc)) for b in bodies)
+        ms = (time.perf_counter() - t0) * 1000
+        print(f"   {enc:>4}: 평균 {size / n / 1024:.1f}KB ({size / raw:.0%}), 압축 평균 {ms / n:.2f}ms")
+    return raw / n
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="뉴스 목록 응답 크기 측정")
+    parser.add_argument('--pages', type=int, default=20, help="카테고리별로 넘겨볼 페이지 수")
+    parser.add_argument('--limit', type=int, default=30)
+    parser.add_argument('--fields', default=None, help="비교할 ?fields= 값 (없으면 목록 기본 필드)")
+    args = parser.parse_args()
+
+    conn = pymysql.connect(host=DB_HOST, user=DB_USER, password=DB_PASS, db=DB_NAME, port=DB_PORT,
+                           charset='utf8mb4', cursorclass=pymysql.cursors.DictCursor)
+    try:
+        cur = conn.cursor()
+        cur.execute("SELECT DISTINCT category FROM NEWS_ARTICLES WHERE category IS NOT NULL")
+        categories = [None] + [row['category'] for row in cur.fetchall()]
+        fields = resolve_fields(args.fields, table_columns(cur), LIST_DEFAULT_FIELDS)
+        print(f"🔍 카테고리 {len(categories) - 1}개 + 전체, 최대 {args.pages}페이지씩 (페이지당 {args.limit}개)")
+        print(f"   선택 필드: {', '.join(fields)}")
+
+        json_provider = Flask(__name__).json
+        before = report("예전 (SELECT *)", json_provider, read_pages(cur, categories, args.pages, args.limit, None))
+        after = report("필드 선택", json_provider, read_pages(cur, categories, args.pages, args.limit, fields))
+        print(f"\n📉 필드 선택만으로 응답 크기 {after / before:.0%} (압축 전 기준)")
+    finally:
+        conn.close()
@@ -0,0 +1,75 @@
+import sys
+import os
+
+# 현재 파일의 위치를 기준으로, 한 단계 위(부모 폴더)를 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+import argparse
+import time
+
+import pymysql
+from dotenv import load_dotenv
+
+from data_version import ensure_data_version_table
+from news_query import NEWS_LIST_INDEXES, ensure_list_indexes, list_news
+
+# .env 파일에 있는 내용을 불러옵니다
+load_dotenv()
+
+DB_HOST = os.getenv("DB_HOST")
+DB_USER = os.getenv("DB_USER")
+DB_PASS = os.getenv("DB_PASS")
+DB_NAME = os.getenv("DB_NAME")
+DB_PORT = int(os.getenv("DB_PORT"))
+
+# ==========================================
+# NEWS_ARTICLES 목록 조회용 복합 인덱스 + DATA_VERSIONS 테이블 추가, 첫 페이지 / 깊은 페이지 비용 비교
+# (app.py는 시작할 때 인덱스가 있는지만 확인하고 경고만 띄움 - 스키마 변경은 이 스크립트로)
+# ==========================================
+# 사용법: python scripts/migrate_news_indexes.py [--category 환경] [--pages 50]
+
+def explain(cur, sql, params):
+    cur.execute("EXPLAIN " + sql, params)
+    for row in cur.fetchall():
+        print(f"      key={row['key']} rows={row['rows']} Extra={row['Extra']}")
+
+def walk_pages(cur, category, pages, limit):
+    """커서로 pages페이지까지 넘기면서 페이지별 조회 시간(ms)"""
+    times, cursor = [], None
+    for _ in range(pages):
+        t0 = time.perf_counter()
+        rows, cursor = list_news(cur, category=category, cursor=cursor, limit=limit, fields=['id'])
+        times.append((time.perf_counter() - t0) * 1000)
+        if not cursor:
+            break
+    return times
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="뉴스 목록 인덱스 마이그레이션")
+    parser.add_argument('--category', default=None, help="확인할 카테고리 (없으면 전체)")
+    parser.add_argument('--pages', type=int, default=50, help="커서로 넘겨볼 페이지 수")
+    parser.add_argument('--limit', type=int, default=30)
+    args = parser.parse_args()
+
+    conn = pymysql.connect(host=DB_HOST, user=DB_USER, password=DB_PASS, db=DB_NAME, port=DB_PORT,
+                           charset='utf8mb4', cursorclass=pymysql.cursors.DictCursor)
+    try:
+        cur = conn.cursor()
+        print(f"🔧 인덱스 확인: {', '.join(f'{k} {v}' for k, v in NEWS_LIST_INDEXES.items())}")
+        t0 = time.time()
+        created = ensure_list_indexes(cur)
+        ensure_data_version_table(cur)   # API 응답 캐시용 데이터 버전 카운터
+        conn.commit()
+        print(f"   {'추가: ' + ', '.join(created) if created else '이미 모두 있음'} ({time.time() - t0:.1f}초)")
+
+        where = "WHERE category = %s " if args.category else ""
+        params = [args.category] if args.category else []
+        print("\n🔍 실행 계획 - 첫 페이지")
+        explain(cur, f"SELECT * FROM NEWS_ARTICLES {where}ORDER BY created_at DESC, id DESC LIMIT %s",
+                params + [args.limit + 1])
+
+        times = walk_pages(cur, args.category, args.pages, args.limit)
+        print(f"\n⏱️ 커서로 {len(times)}페이지 넘김: 첫 페이지 {times[0]:.2f}ms / "
+              f"마지막 페이지 {times[-1]:.2f}ms / 평균 {sum(times) / len(times):.2f}ms")
+    finally:
+        conn.close()
@@ -0,0 +1,135 @@
+import sys
+import os
+# 현재 파일의 위치를 기준으로, 한 단계 위(부모 폴더)를 경로에 추가
+BASE_DIR = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+sys.path.append(BASE_DIR)
+
+import argparse
+import json
+import random
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+from dotenv import load_dotenv
+
+from naver_client import DEFAULT_BASE_URL, NEWS_PATH, page_key
+
+load_dotenv(os.path.join(BASE_DIR, '.env'))
+
+# ==========================================
+# 네이버 뉴스 검색 API 대역(stand-in) 서버
+# ==========================================
+# 녹화해둔 실제 응답을 그대로 돌려줘서, 수집 코드를 네트워크/쿼터 없이 테스트·벤치마크할 수 있게 합니다.
+#   python scripts/naver_standin_server.py --record      # 실제 API로 중계하면서 응답 녹화
+#   python scripts/naver_standin_server.py --synthesize  # 녹화가 없는 요청은 가짜 기사로 응답
+# 그리고 수집 코드 쪽 .env 에 NAVER_API_BASE_URL=http://127.0.0.1:8765 를 넣으면 됩니다.
+RECORDINGS_DIR = os.path.join(BASE_DIR, 'cache', 'naver_recordings')
+DEFAULT_PORT = 8765
+
+def recording_path(rec_dir, query, start, display, sort):
+    return os.path.join(rec_dir, page_key(query, start, display, sort) + '.json')
+
+def synthesize(query, start, display, sort, total):
+    """녹화가 없을 때 쓰는 가짜 응답 (같은 요청이면 항상 같은 결과, 최신순으로 pubDate 감소)"""
+    now = int(time.time()) // 3600 * 3600
+    items = []
+    for rank in range(start, min(start + display, total + 1)):
+        items.append({
+            'title': f"<b>{query}</b> 관련 기사 {rank}",
+            'originallink': f"https://standin.example/{page_key(query, rank, 0, sort)[:12]}",
+            'link': f"https://n.news.naver.com/standin/{rank}",
+            'description': f"{query} 이슈에 대한 &quot;테스트&quot; 요약 {rank}",
+            'pubDate': formatdate(now - rank * 600, localtime=True),
+        })
+    return {'lastBuildDate': formatdate(now, localtime=True), 'total': total,
+            'start': start, 'display': len(items), 'items': items}
+
+class StandInHandler(BaseHTTPRequestHandler):
+    server_version = "NaverStandIn/1.0"
+
+    def _send(self, status, body, headers=None):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        opts = self.server.opts
+        parts = urlsplit(self.path)
+        if parts.path != NEWS_PATH:
+            return self._send(404, {'errorMessage': 'Not Found', 'errorCode': '404'})
+
+        qs = parse_qs(parts.query)
+        query = qs.get('query', [''])[0]
+        display = int(qs.get('display', ['10'])[0])
+        start = int(qs.get('start', ['1'])[0])
+        sort = qs.get('sort', ['sim'])[0]
+
+        with self.server.lock:
+            self.server.hits += 1
+        if opts.latency:
+            time.sleep(opts.latency / 1000)
+        if opts.error_rate and random.random() < opts.error_rate:
+            return self._send(429, {'errorMessage': 'Rate limit exceeded', 'errorCode': '012'}, {'Retry-After': '1'})
+
+        path = recording_path(opts.dir, query, start, display, sort)
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                return self._send(200, json.load(f))
+
+        if opts.record:
+            resp = requests.get(DEFAULT_BASE_URL + NEWS_PATH, params=qs, timeout=10, headers={
+                "X-Naver-Client-Id": os.getenv("NAVER_CLIENT_ID") or "",
+                "X-Naver-Client-Secret": os.getenv("NAVER_CLIENT_SECRET") or ""})
+            body = resp.json()
+            if resp.status_code == 200:
+                os.makedirs(opts.dir, exist_ok=True)
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(body, f, ensure_ascii=False)
+            return self._send(resp.status_code, body)
+
+        if opts.synthesize:
+            return self._send(200, synthesize(query, start, display, sort, opts.total))
+        return self._send(200, {'total': 0, 'start': start, 'display': 0, 'items': []})
+
+    def log_message(self, fmt, *args):
+        if self.server.opts.verbose:
+            super().log_message(fmt, *args)
+
+def make_server(opts, host='127.0.0.1', port=DEFAULT_PORT):
+    server = ThreadingHTTPServer((host, port), StandInHandler)
+    server.opts = opts
+    server.lock = threading.Lock()
+    server.hits = 0
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="네이버 뉴스 검색 API 대역 서버 (녹화 응답 재생)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--dir', default=RECORDINGS_DIR, help="녹화 응답 폴더")
+    parser.add_argument('--record', action='store_true', help="녹화가 없으면 실제 API로 중계 후 저장")
+    parser.add_argument('--synthesize', action='store_true', help="녹화가 없으면 가짜 기사 생성")
+    parser.add_argument('--total', type=int, default=1000, help="가짜 검색 결과 총 개수")
+    parser.add_argument('--latency', type=float, default=0, help="응답 지연 (ms)")
+    parser.add_argument('--error-rate', type=float, default=0, help="429 응답 비율 (재시도 테스트용)")
+    parser.add_argument('--verbose', action='store_true')
+    opts = parser.parse_args()
+
+    server = make_server(opts, port=opts.port)
+    print(f"🛰️ 네이버 API 대역 서버: http://127.0.0.1:{opts.port}{NEWS_PATH} (녹화 폴더: {opts.dir})")
+    print(f"   수집 코드 쪽에 NAVER_API_BASE_URL=http://127.0.0.1:{opts.port} 로 지정하세요.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n🛑 종료 (총 {server.hits}회 요청 처리)")
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,22 @@
 import sys
 import os
+import json
+import argparse
+from multiprocessing import Pool
 
 # 현재 파일의 위치를 기준으로, 한 단계 위(부모 폴더)를 경로에 추가
-sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+BASE_DIR = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+sys.path.append(BASE_DIR)
 
 # (이 아래에 원래 있던 import 코드들이 오면 됩니다)
 from analysis_service import BiasAnalyzer
 import pymysql
 import pandas as pd
-import numpy as np
-from numpy.linalg import norm
 from analysis_service import BiasAnalyzer # 우리가 만든 분석기
+from analysis_service import model_fingerprint, CONF_PATH
+from score_store import (ensure_keyword_score_table, ensure_score_stamps, keyword_score_rows, judge,
+                         keyword_config_hashes, load_saved_config, save_config, UPSERT_KEYWORD_SCORE_SQL)
+from data_version import bump_data_version, ensure_data_version_table
 from tqdm import tqdm
 from dotenv import load_dotenv
 
@@ -27,6 +33,19 @@ DB_PASS = os.getenv("DB_PASS")
 DB_NAME = os.getenv("DB_NAME")
 DB_PORT = int(os.getenv("DB_PORT"))
 
+# 판정 기준 (보수/진보 점수 차이)
+JUDGE_THRESHOLD = 0.03
+
+# 다중 키워드 모드: 기사에 나온 "모든" 키워드에 대해 점수를 계산해서 NEWS_KEYWORD_SCORES에 저장
+# (False 또는 --single이면 예전처럼 처음 발견된 키워드 1개만 분석)
+MULTI_KEYWORD_MODE = True
+
+# 한 번에 읽고/분석하고/저장하는 기사 수 (테이블 전체를 메모리에 올리지 않음)
+CHUNK_SIZE = 1000
+
+# 이어하기용 체크포인트 (작업자별 마지막으로 처리한 id)
+CHECKPOINT_DIR = os.path.join(BASE_DIR, 'cache', 'rescore_checkpoints')
+
 # ==========================================
 # [함수] 상세 점수 계산기 (진보/보수 각각 계산)
 # ==========================================
@@ -37,110 +56,406 @@ def calculate_dual_scores(analyzer, title, description, target_keyword):
     """
     # 1. 기사 텍스트 벡터화
     full_text = f"{title} {description}"
-    tokens = analyzer.twitter.nouns(full_text)
-    valid_tokens = [t for t in tokens if t in analyzer.model.wv and len(t) > 1]
+    tokens = analyzer.nouns(full_text)  # 캐시를 거친 명사 추출
+    rows = analyzer.token_rows(tokens)
     
-    if not valid_tokens: 
+    if not rows: 
         return 0.0, 0.0 # 분석 불가
 
-    article_vec = np.mean([analyzer.model.wv[t] for t in valid_tokens], axis=0)
+    article_vec = analyzer.article_vector(rows)
     
-    # 2. 기준점 벡터 가져오기
-    # (analysis_service의 analyzer 객체 내부 변수에 접근)
-    if target_keyword not in analyzer.model.wv or target_keyword not in analyzer.antonym_vec_map:
+    # 2. 기준점 벡터 가져오기 (analyzer가 미리 정규화해둔 단위벡터)
+    if target_keyword not in analyzer.keyword_unit_map or target_keyword not in analyzer.antonym_unit_map:
         return 0.0, 0.0
 
-    my_vec = analyzer.model.wv[target_keyword]          # 키워드 (예: 건국절)
-    oppo_vec = analyzer.antonym_vec_map[target_keyword] # 반대어 (예: 독립운동)
+    my_unit = analyzer.keyword_unit_map[target_keyword]    # 키워드 (예: 건국절)
+    oppo_unit = analyzer.antonym_unit_map[target_keyword]  # 반대어 (예: 독립운동)
     
     # 3. 코사인 유사도 계산
-    # 기사가 키워드(보수/정부 측)와 얼마나 가까운가?
-    sim_target = np.dot(article_vec, my_vec) / (norm(article_vec)*norm(my_vec))
-    
-    # 기사가 반대어(진보/반대 측)와 얼마나 가까운가?
-    sim_antonym = np.dot(article_vec, oppo_vec) / (norm(article_vec)*norm(oppo_vec))
+    # 기사가 키워드(보수/정부 측)와 얼마나 가까운가? / 반대어(진보/반대 측)와 얼마나 가까운가?
+    sim_target, sim_antonym = analyzer.cosine_pair(article_vec, my_unit, oppo_unit)
     
-    return float(sim_target), float(sim_antonym)
+    return sim_target, sim_antonym
 
-def main():
-    # 1. AI 분석기 로딩
-    print("🤖 AI 모델 불러오는 중...")
-    analyzer = BiasAnalyzer()
-    
-    # 2. DB 연결
-    conn = pymysql.connect(host=DB_HOST, user=DB_USER, password=DB_PASS, db=DB_NAME, port=DB_PORT, charset='utf8')
+def get_db_connection():
+    return pymysql.connect(host=DB_HOST, user=DB_USER, password=DB_PASS, db=DB_NAME, port=DB_PORT, charset='utf8')
+
+# ==========================================
+# [체크포인트] 중간에 죽어도 마지막 처리 id부터 이어서
+# ==========================================
+def checkpoint_path(worker_no, workers):
+    return os.path.join(CHECKPOINT_DIR, f"worker_{worker_no}_of_{workers}.json")
+
+def load_checkpoint(worker_no, workers):
+    path = checkpoint_path(worker_no, workers)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def save_checkpoint(worker_no, workers, start_id, end_id, last_id, done=False):
+    """done=True: 구간을 끝까지 처리함 (--resume 때 건너뜀)"""
+    os.makedirs(CHECKPOINT_DIR, exist_ok=True)
+    path = checkpoint_path(worker_no, workers)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'start_id': start_id, 'end_id': end_id, 'last_id': last_id, 'done': done}, f)
+    os.replace(tmp_path, path)
+
+def delete_checkpoints(workers):
+    """작업자 전체가 끝났을 때만 한꺼번에 삭제 (하나라도 실패하면 남겨서 --resume이 끝난 구간을 건너뛰게)"""
+    for worker_no in range(workers):
+        path = checkpoint_path(worker_no, workers)
+        if os.path.exists(path):
+            os.remove(path)
+
+def resume_ranges(workers, max_id):
+    """
+    지난 실행의 작업자별 구간 (체크포인트가 하나라도 없으면 None → 처음부터)
+    마지막 구간의 끝은 지금의 최대 id로 늘려서 그 사이에 새로 들어온 기사도 포함
+    """
+    ckpts = [load_checkpoint(w, workers) for w in range(workers)]
+    if not all(ckpts):
+        return None
+    ranges = [(c['start_id'], c['end_id']) for c in ckpts]
+    lo, hi = ranges[-1]
+    ranges[-1] = (lo, max(hi, max_id))
+    return ranges
+
+# ==========================================
+# [읽기] id 순서대로 묶음(chunk) 단위 스트리밍
+# ==========================================
+SELECT_COLUMNS = "SELECT id, title, description FROM NEWS_ARTICLES"
+
+def iter_chunks(conn, after_id, end_id, chunk_size):
+    """
+    (after_id, end_id] 구간의 기사를 id 순으로 chunk_size개씩 읽음
+    매번 "id > 마지막 id" 조건으로 인덱스를 타서 읽기 때문에 뒤쪽 묶음도 앞쪽과 비용이 같음
+    """
     cur = conn.cursor(pymysql.cursors.DictCursor)
-    
-    try:
-        # 3. 아직 판정이 안 된(NULL) 데이터만 가져오기
-        print("📥 분석할 뉴스 데이터 가져오는 중...")
-        # 테이블명: NEWS_ARTICLES, PK: id
-        # 조건 없이 모든 기사 가져오기 (전체 다시 분석)
-        sql_select = "SELECT id, title, description FROM NEWS_ARTICLES"
-        cur.execute(sql_select)
+    sql = SELECT_COLUMNS + " WHERE id > %s AND id <= %s ORDER BY id LIMIT %s"
+    while True:
+        cur.execute(sql, (after_id, end_id, chunk_size))
         rows = cur.fetchall()
-        
-        print(f"🚀 총 {len(rows)}개 기사의 정밀 분석을 시작합니다.")
-        
-        # 4. 업데이트 쿼리 준비
-        # bias_score_cons: 보수(키워드) 점수
-        # bias_score_prog: 진보(반대어) 점수
-        # final_judgement: 최종 판정 (CONS / PROG / NEUTRAL)
-        # detected_keywords: 발견된 키워드
-        sql_update = """
-            UPDATE NEWS_ARTICLES 
-            SET bias_score_cons = %s, 
-                bias_score_prog = %s, 
-                final_judgement = %s, 
-                detected_keywords = %s 
-            WHERE id = %s
-        """
-        
-        success_count = 0
-        
-        for row in tqdm(rows):
-            title = row['title'] or ""
-            desc = row['description'] or ""
-            
-            # (1) 기사 내용에서 키워드 찾기
-            detected_kw = None
-            for kw in analyzer.df_conf['keyword']:
-                if kw in title or kw in desc:
-                    detected_kw = kw
-                    break # 하나 찾으면 중단 (주요 키워드 우선)
-            
-            if detected_kw:
-                # (2) 상세 점수 계산 (Cons, Prog 각각)
-                # 가정: 키워드(건국절) = 보수(Cons), 반대어(독립운동) = 진보(Prog)
-                sim_cons, sim_prog = calculate_dual_scores(analyzer, title, desc, detected_kw)
-                
-                # 점수가 유효한 경우에만 업데이트
-                if sim_cons != 0.0 or sim_prog != 0.0:
-                    
-                    # (3) 최종 판정 로직 (점수 차이 비교)
-                    diff = sim_cons - sim_prog
-                    
-                    judgement = 'NEUTRAL'
-                    if diff > 0.03:    # 보수 쪽이 0.03점 더 높으면
-                        judgement = 'CONS' # 보수
-                    elif diff < -0.03: # 진보 쪽이 0.03점 더 높으면
-                        judgement = 'PROG' # 진보
-                    
-                    # (4) DB 업데이트 실행
-                    cur.execute(sql_update, (sim_cons, sim_prog, judgement, detected_kw, row['id']))
-                    success_count += 1
-            
-            # 100건마다 DB에 저장 (안전장치)
-            if success_count % 100 == 0:
-                conn.commit()
-                
+        if not rows:
+            break
+        yield rows
+        after_id = rows[-1]['id']
+
+def iter_id_chunks(conn, ids, chunk_size):
+    """지정한 id 목록(증분 재분석 대상)만 chunk_size개씩 읽음"""
+    cur = conn.cursor(pymysql.cursors.DictCursor)
+    for i in range(0, len(ids), chunk_size):
+        chunk = ids[i:i + chunk_size]
+        cur.execute(SELECT_COLUMNS + f" WHERE id IN ({','.join(['%s'] * len(chunk))}) ORDER BY id", chunk)
+        rows = cur.fetchall()
+        if rows:
+            yield rows
+
+# ==========================================
+# [분석] 묶음 단위 배치 분석
+# ==========================================
+def score_chunk(analyzer, rows, multi_keyword, config_hashes):
+    """
+    Returns: (기사 업데이트 목록, 키워드별 점수 목록)
+    - 기사 업데이트: (id, cons, prog, judgement, keyword, 대표 키워드 설정 해시)
+    """
+    articles = [(row['title'] or "", row['description'] or "") for row in rows]
+    article_updates, keyword_rows = [], []
+
+    if multi_keyword:
+        # 기사에 등장한 모든 키워드를 묶음 전체에 대해 한 번에 계산
+        all_scores = analyzer.batch_keyword_similarities(articles)
+        for row, scores in zip(rows, all_scores):
+            if not scores:
+                continue
+            keyword_rows.extend(keyword_score_rows(row['id'], scores, JUDGE_THRESHOLD,
+                                                   analyzer.model_hash, config_hashes))
+            # 대표 키워드(CSV 순서상 가장 앞선 키워드)는 기존 컬럼에도 저장 (화면 호환용)
+            detected_kw = next(iter(scores))
+            sim_cons, sim_prog = scores[detected_kw]
+            article_updates.append((row['id'], sim_cons, sim_prog, judge(sim_cons, sim_prog, JUDGE_THRESHOLD),
+                                    detected_kw, config_hashes.get(detected_kw)))
+    else:
+        # 기사별로 처음 발견된 키워드 1개만 분석 (CSV 순서상 앞선 키워드 우선)
+        keywords = [analyzer.keyword_matcher.first_keyword(title, desc) for title, desc in articles]
+        sims = analyzer.batch_similarities(articles, keywords)
+        for row, detected_kw, pair in zip(rows, keywords, sims):
+            if detected_kw is None or pair is None:
+                continue
+            sim_cons, sim_prog = pair
+            # 점수가 유효한 경우에만 업데이트
+            if sim_cons == 0.0 and sim_prog == 0.0:
+                continue
+            article_updates.append((row['id'], sim_cons, sim_prog, judge(sim_cons, sim_prog, JUDGE_THRESHOLD),
+                                    detected_kw, config_hashes.get(detected_kw)))
+
+    return article_updates, keyword_rows
+
+# ==========================================
+# [쓰기] 임시 테이블 + JOIN UPDATE로 묶음 저장
+# ==========================================
+# bias_score_cons: 보수(키워드) 점수 / bias_score_prog: 진보(반대어) 점수
+# final_judgement: 최종 판정 (CONS / PROG / NEUTRAL) / detected_keywords: 발견된 키워드
+# score_model_hash / score_config_hash: 어떤 모델 / 어떤 키워드 설정으로 계산했는지 (증분 재분석용)
+TEMP_TABLE_SQL = """
+    CREATE TEMPORARY TABLE IF NOT EXISTS TMP_RESCORE (
+        id INT PRIMARY KEY,
+        bias_score_cons FLOAT,
+        bias_score_prog FLOAT,
+        final_judgement VARCHAR(20),
+        detected_keywords VARCHAR(100),
+        score_config_hash VARCHAR(32)
+    ) DEFAULT CHARSET=utf8mb4
+"""
+TEMP_INSERT_SQL = """
+    INSERT INTO TMP_RESCORE (id, bias_score_cons, bias_score_prog, final_judgement, detected_keywords, score_config_hash)
+    VALUES (%s, %s, %s, %s, %s, %s)
+"""
+JOIN_UPDATE_SQL = """
+    UPDATE NEWS_ARTICLES a JOIN TMP_RESCORE t ON a.id = t.id
+    SET a.bias_score_cons = t.bias_score_cons,
+        a.bias_score_prog = t.bias_score_prog,
+        a.final_judgement = t.final_judgement,
+        a.detected_keywords = t.detected_keywords,
+        a.score_config_hash = t.score_config_hash
+"""
+
+def write_chunk(conn, rows, article_updates, keyword_rows, model_hash, multi_keyword):
+    """묶음 하나를 한 트랜잭션으로 저장 (UPDATE 몇 번 + 다중행 INSERT)"""
+    cur = conn.cursor()
+    ids = [row['id'] for row in rows]
+    placeholders = ','.join(['%s'] * len(ids))
+
+    # 1. 이번 묶음의 모든 기사에 모델 도장 (키워드가 없는 기사도 "분석 끝남"으로 표시)
+    cur.execute(f"UPDATE NEWS_ARTICLES SET score_model_hash = %s WHERE id IN ({placeholders})", [model_hash] + ids)
+
+    # 2. 대표 키워드 점수
+    if article_updates:
+        cur.execute(TEMP_TABLE_SQL)
+        cur.execute("DELETE FROM TMP_RESCORE")
+        cur.executemany(TEMP_INSERT_SQL, article_updates)  # pymysql이 다중행 INSERT 1개로 묶어줌
+        cur.execute(JOIN_UPDATE_SQL)
+
+    # 3. 키워드별 점수 (더 이상 등장하지 않는 키워드의 예전 점수는 지우고 새로 저장)
+    if multi_keyword:
+        cur.execute(f"DELETE FROM NEWS_KEYWORD_SCORES WHERE article_id IN ({placeholders})", ids)
+        if keyword_rows:
+            cur.executemany(UPSERT_KEYWORD_SCORE_SQL, keyword_rows)
+    conn.commit()
+
+# ==========================================
+# [작업자] id 구간 / id 목록 하나를 처리 (멀티프로세스에서 작업자 1개)
+# ==========================================
+def _process_chunks(worker_no, chunks, multi_keyword, on_chunk_done=None):
+    analyzer = BiasAnalyzer()
+    config_hashes = keyword_config_hashes(analyzer.df_conf)
+    conn = get_db_connection()
+    success_count = 0
+    try:
+        if multi_keyword:
+            ensure_keyword_score_table(conn.cursor())
+
+        with tqdm(desc=f"작업자 {worker_no}", position=worker_no, unit="건") as bar:
+            for rows in chunks(conn):
+                article_updates, keyword_rows = score_chunk(analyzer, rows, multi_keyword, config_hashes)
+                write_chunk(conn, rows, article_updates, keyword_rows, analyzer.model_hash, multi_keyword)
+                if on_chunk_done:
+                    on_chunk_done(rows[-1]['id'])
+                success_count += len(article_updates)
+                bar.update(len(rows))
+    finally:
+        conn.close()
+    return success_count
+
+def rescore_range(worker_no, workers, start_id, end_id, chunk_size, multi_keyword, resume):
+    """
+    (start_id, end_id] 구간 전체 재분석 (체크포인트로 이어하기 가능)
+    - resume: 지난 실행에서 끝난 구간은 건너뛰고, 아니면 마지막 처리 id 다음부터
+              (end_id는 main에서 지금 기준으로 다시 계산해서 넘김)
+    """
+    after_id = start_id
+    if resume:
+        ckpt = load_checkpoint(worker_no, workers)
+        if ckpt and ckpt.get('done') and ckpt['end_id'] >= end_id:
+            print(f"⏭️ [작업자 {worker_no}] 지난 실행에서 끝난 구간 → 건너뜀")
+            return 0
+        if ckpt and ckpt['start_id'] == start_id:
+            after_id = max(start_id, ckpt['last_id'])
+            print(f"↩️ [작업자 {worker_no}] id {after_id} 이후부터 이어서 진행 (~ id {end_id})")
+
+    # 시작하자마자 구간을 기록 (한 묶음도 못 끝내고 죽어도 --resume이 같은 구간으로 나눔)
+    save_checkpoint(worker_no, workers, start_id, end_id, after_id)
+    count = _process_chunks(
+        worker_no,
+        lambda conn: iter_chunks(conn, after_id, end_id, chunk_size),
+        multi_keyword,
+        on_chunk_done=lambda last_id: save_checkpoint(worker_no, workers, start_id, end_id, last_id))
+    # 끝난 표시만 남김 (삭제는 모든 작업자가 성공한 뒤 main에서)
+    save_checkpoint(worker_no, workers, start_id, end_id, end_id, done=True)
+    return count
+
+def rescore_ids(worker_no, ids, chunk_size, multi_keyword):
+    """지정한 id 목록만 재분석 (증분 모드, 처리한 기사는 도장이 찍혀서 다시 실행해도 건너뜀)"""
+    return _process_chunks(worker_no, lambda conn: iter_id_chunks(conn, ids, chunk_size), multi_keyword)
+
+def split_id_ranges(min_id, max_id, workers):
+    """[min_id, max_id]를 작업자 수만큼 (after_id, end_id] 구간으로 나눔"""
+    step = (max_id - min_id + workers) // workers
+    ranges = []
+    for w in range(workers):
+        lo = min_id - 1 + w * step
+        hi = min(max_id, lo + step) if w < workers - 1 else max_id
+        ranges.append((lo, hi))
+    return ranges
+
+# ==========================================
+# [증분] 다시 계산해야 하는 기사만 찾기
+# ==========================================
+def _like_pattern(keyword):
+    escaped = keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f"%{escaped}%"
+
+def find_stale_ids(cur, model_hash, config_hashes, multi_keyword=True):
+    """
+    재분석 대상 id 목록
+    1) 한 번도 분석 안 됐거나 다른 모델로 분석된 기사
+    2) 설정(반대어 등)이 바뀐 키워드의 점수가 예전 도장(config_hash)으로 남아있는 기사
+       (새로 추가돼서 아직 점수가 없는 키워드만 제목/요약을 LIKE로 찾음)
+    3) CSV에서 삭제된 키워드의 점수가 남아있는 기사
+    (저장된 키워드 설정이 아직 없으면(첫 증분 실행) 지금 설정을 기준으로 기록만 하고 2, 3은 건너뜀
+     → 키워드마다 LIKE로 테이블 전체를 훑지 않음, 점수 없는 기사는 1에서 걸러짐)
+    """
+    stale = set()
+
+    cur.execute("SELECT id FROM NEWS_ARTICLES WHERE score_model_hash IS NULL OR score_model_hash <> %s", (model_hash,))
+    stale.update(row[0] for row in cur.fetchall())
+
+    saved = load_saved_config(cur)
+    if not saved:
+        save_config(cur, config_hashes)
+        print(f"🔎 증분 대상: 저장된 키워드 설정이 없어 지금 설정({len(config_hashes)}개)을 기준으로 기록")
+        return sorted(stale)
+
+    changed = [kw for kw, h in config_hashes.items() if saved.get(kw) != h]
+    if changed:
+        # 바뀐 키워드로 점수가 저장된 기사 중 도장(설정 해시)이 지금과 다른 것만 (NULL도 다른 것으로 침)
+        conds = ' OR '.join(['(detected_keywords = %s AND NOT (score_config_hash <=> %s))'] * len(changed))
+        cur.execute(f"SELECT id FROM NEWS_ARTICLES WHERE {conds}",
+                    [v for kw in changed for v in (kw, config_hashes[kw])])
+        stale.update(row[0] for row in cur.fetchall())
+
+    for kw in changed:
+        if multi_keyword:
+            # (keyword, bias_level) 인덱스를 타서 그 키워드 점수만 확인
+            cur.execute("SELECT DISTINCT article_id FROM NEWS_KEYWORD_SCORES WHERE keyword = %s "
+                        "AND NOT (config_hash <=> %s)", (kw, config_hashes[kw]))
+            stale.update(row[0] for row in cur.fetchall())
+            cur.execute("SELECT 1 FROM NEWS_KEYWORD_SCORES WHERE keyword = %s LIMIT 1", (kw,))
+        else:
+            cur.execute("SELECT 1 FROM NEWS_ARTICLES WHERE detected_keywords = %s LIMIT 1", (kw,))
+        if kw not in saved and not cur.fetchone():
+            # 새로 추가됐고 아직 점수가 하나도 없는 키워드만 본문을 훑어서 찾음
+            pattern = _like_pattern(kw)
+            cur.execute("SELECT id FROM NEWS_ARTICLES WHERE title LIKE %s OR description LIKE %s", (pattern, pattern))
+            stale.update(row[0] for row in cur.fetchall())
+
+    removed = [kw for kw in saved if kw not in config_hashes]
+    if removed:
+        placeholders = ','.join(['%s'] * len(removed))
+        if multi_keyword:
+            # (단일 키워드 모드에서는 NEWS_KEYWORD_SCORES 테이블이 없을 수 있음)
+            cur.execute(f"SELECT DISTINCT article_id FROM NEWS_KEYWORD_SCORES WHERE keyword IN ({placeholders})", removed)
+            stale.update(row[0] for row in cur.fetchall())
+        cur.execute(f"SELECT id FROM NEWS_ARTICLES WHERE detected_keywords IN ({placeholders})", removed)
+        stale.update(row[0] for row in cur.fetchall())
+
+    print(f"🔎 증분 대상: 키워드 변경 {len(changed)}개 / 삭제 {len(removed)}개")
+    return sorted(stale)
+
+def main():
+    parser = argparse.ArgumentParser(description="NEWS_ARTICLES 재분석 (묶음 단위 스트리밍)")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="한 번에 처리할 기사 수")
+    parser.add_argument('--workers', type=int, default=1, help="id 구간을 나눠 병렬로 돌릴 프로세스 수")
+    parser.add_argument('--resume', action='store_true', help="체크포인트의 마지막 id부터 이어서 진행")
+    parser.add_argument('--single', action='store_true', help="기사당 첫 번째 키워드만 분석 (다중 키워드 모드 끔)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="새 기사 / 모델이나 키워드 설정이 바뀐 기사만 재분석")
+    args = parser.parse_args()
+    multi_keyword = MULTI_KEYWORD_MODE and not args.single
+
+    # 현재 모델 / 키워드 설정 도장 (분석기를 띄우지 않고 파일만 보고 계산)
+    model_hash = model_fingerprint()
+    try:
+        df_conf = pd.read_csv(CONF_PATH)
+    except:
+        df_conf = pd.read_csv(CONF_PATH, encoding='cp949')
+    config_hashes = keyword_config_hashes(df_conf)
+
+    # 1. 도장 컬럼 준비 + 대상 확인 (데이터 자체는 묶음 단위로 읽음)
+    conn = get_db_connection()
+    try:
+        cur = conn.cursor()
+        ensure_score_stamps(cur)
+        if multi_keyword:
+            ensure_keyword_score_table(cur)
         conn.commit()
-        print(f"\n🎉 분석 완료! 총 {success_count}개 기사가 업데이트 되었습니다.")
-        
-    except Exception as e:
-        print(f"❌ 오류 발생: {e}")
+
+        if args.incremental:
+            stale_ids = find_stale_ids(cur, model_hash, config_hashes, multi_keyword)
+            conn.commit()   # (첫 실행이면 키워드 설정 기준을 기록)
+            total = len(stale_ids)
+        else:
+            cur.execute("SELECT MIN(id), MAX(id), COUNT(*) FROM NEWS_ARTICLES")
+            min_id, max_id, total = cur.fetchone()
     finally:
         conn.close()
 
+    if not total:
+        print("📭 분석할 기사가 없습니다.")
+        return
+
+    mode = "증분" if args.incremental else "전체"
+    print(f"🚀 [{mode}] 총 {total}개 기사의 정밀 분석을 시작합니다. (묶음 {args.chunk_size}개 / 작업자 {args.workers}개)")
+
+    # 2. 작업자별로 나눠서 처리 (전체: id 구간 / 증분: id 목록)
+    if args.incremental:
+        step = (total + args.workers - 1) // args.workers
+        jobs = [(w, stale_ids[w * step:(w + 1) * step], args.chunk_size, multi_keyword)
+                for w in range(args.workers)]
+        target = rescore_ids
+    else:
+        ranges = resume_ranges(args.workers, max_id) if args.resume else None
+        if args.resume and ranges is None:
+            print("ℹ️ 이어받을 체크포인트가 없어 처음부터 진행합니다.")
+        ranges = ranges or split_id_ranges(min_id, max_id, args.workers)
+        jobs = [(w, args.workers, lo, hi, args.chunk_size, multi_keyword, args.resume)
+                for w, (lo, hi) in enumerate(ranges)]
+        target = rescore_range
+
+    try:
+        if args.workers == 1:
+            counts = [target(*jobs[0])]
+        else:
+            with Pool(args.workers) as pool:
+                counts = pool.starmap(target, jobs)
+
+        # 3. 모두 끝나면 현재 키워드 설정을 다음 증분 재분석의 기준으로 기록
+        # (점수가 바뀌었으니 데이터 버전도 올려서 API 캐시를 비움)
+        conn = get_db_connection()
+        try:
+            cur = conn.cursor()
+            save_config(cur, config_hashes)
+            ensure_data_version_table(cur)
+            bump_data_version(cur)
+            conn.commit()
+        finally:
+            conn.close()
+        if not args.incremental:
+            delete_checkpoints(args.workers)
+        print(f"\n🎉 분석 완료! 총 {sum(counts)}개 기사가 업데이트 되었습니다.")
+    except Exception as e:
+        print(f"❌ 오류 발생: {e} (--resume 옵션으로 이어서 실행할 수 있습니다)")
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
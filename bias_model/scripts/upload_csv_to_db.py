@@ -20,6 +20,7 @@ except ImportError:
 
 # (이 아래에 원래 있던 import 코드들이 오면 됩니다)
 from analysis_service import BiasAnalyzer
+from db_writer import ensure_link_hash, link_hash
 from dotenv import load_dotenv
 import pandas as pd
 import pymysql
@@ -62,13 +63,14 @@ def main():
     # 2. DB 연결
     conn = pymysql.connect(host=DB_HOST, user=DB_USER, password=DB_PASS, db=DB_NAME, port=DB_PORT, charset='utf8')
     cur = conn.cursor()
+    ensure_link_hash(cur)  # 같은 기사는 link_hash UNIQUE 인덱스로 걸러짐
 
     # 3. 데이터 삽입
     # (주의: 테이블 컬럼 순서나 이름이 다르면 에러 날 수 있으니 INSERT 문을 잘 확인하세요)
     # NEWS_ARTICLES 테이블 컬럼: category, title, link, description, content(본문은 없으면 desc로 대체)
     sql_insert = """
-        INSERT INTO NEWS_ARTICLES (category, title, link, description, created_at) 
-        VALUES (%s, %s, %s, %s, NOW())
+        INSERT INTO NEWS_ARTICLES (category, title, link, description, link_hash, created_at) 
+        VALUES (%s, %s, %s, %s, %s, NOW())
     """
 
     success_count = 0
@@ -85,7 +87,7 @@ def main():
             # 속도 때문에 일단은 그냥 넣거나, 필요하면 중복 체크 로직 추가
             # 여기서는 일단 무조건 INSERT 시도 (에러나면 pass)
             try:
-                cur.execute(sql_insert, (category, title, link, desc))
+                cur.execute(sql_insert, (category, title, link, desc, link_hash(link)))
                 success_count += 1
             except Exception as e:
                 # 중복 에러 등은 무시하고 계속 진행
@@ -0,0 +1,114 @@
+# ==========================================
+# 형태소 분석(명사 추출) 결과 캐시
+# ==========================================
+# twitter.nouns()는 JPype로 JVM을 거치기 때문에 분석 과정에서 가장 느린 단계입니다.
+# 같은 제목/요약을 재분석할 때마다 다시 돌리지 않도록 결과를 저장해 둡니다.
+#  - 1단계: 프로세스 메모리 LRU (개수 제한)
+#  - 2단계: SQLite 파일 (선택, bot.py와 스크립트들이 같이 사용)
+# 키 = 텍스트 해시 + 사용자 사전 버전 (사전이 바뀌면 자동으로 새로 분석)
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+def text_key(text, dict_version):
+    """캐시 키: 사전 버전 + 텍스트 sha1"""
+    return f"{dict_version}:{hashlib.sha1(text.encode('utf-8')).hexdigest()}"
+
+def dictionary_version(words):
+    """사용자 사전 단어 목록의 버전 (목록이 바뀌면 값이 바뀜)"""
+    return hashlib.sha256('\n'.join(sorted(words)).encode('utf-8')).hexdigest()[:12]
+
+class NounCache:
+    def __init__(self, tokenize, dict_version, max_items=50000, db_path=None):
+        """
+        - tokenize: 캐시에 없을 때 호출할 함수 (예: twitter.nouns)
+        - dict_version: 사용자 사전 버전 (dictionary_version 결과)
+        - max_items: 메모리 LRU 최대 개수
+        - db_path: SQLite 파일 경로 (None이면 메모리만 사용)
+        """
+        self.tokenize = tokenize
+        self.dict_version = dict_version
+        self.max_items = max_items
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._db = None
+        if db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            # 여러 프로세스가 같이 쓰므로 WAL 모드 + 잠금 대기
+            self._db = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS nouns (key TEXT PRIMARY KEY, tokens TEXT NOT NULL)")
+            self._db.commit()
+
+    def nouns(self, text):
+        """캐시를 거친 명사 추출 (결과는 twitter.nouns와 같은 리스트)"""
+        key = text_key(text, self.dict_version)
+
+        # 1. 메모리 LRU
+        with self._lock:
+            if key in self._lru:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return list(self._lru[key])
+
+        # 2. 디스크(SQLite)
+        tokens = self._disk_get(key)
+        if tokens is not None:
+            self.disk_hits += 1
+        else:
+            # 3. 실제 형태소 분석 (JVM)
+            tokens = self.tokenize(text)
+            self.misses += 1
+            self._disk_put(key, tokens)
+
+        self._remember(key, tokens)
+        return list(tokens)
+
+    def _remember(self, key, tokens):
+        with self._lock:
+            self._lru[key] = tuple(tokens)
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.max_items:
+                self._lru.popitem(last=False)
+
+    def _disk_get(self, key):
+        if self._db is None:
+            return None
+        with self._lock:
+            row = self._db.execute("SELECT tokens FROM nouns WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _disk_put(self, key, tokens):
+        if self._db is None:
+            return
+        try:
+            with self._lock:
+                self._db.execute("INSERT OR REPLACE INTO nouns (key, tokens) VALUES (?, ?)",
+                                 (key, json.dumps(tokens, ensure_ascii=False)))
+                self._db.commit()
+        except sqlite3.OperationalError as e:
+            # 다른 프로세스가 오래 잠그고 있으면 저장만 건너뜀 (결과는 메모리에 남음)
+            print(f"⚠️ 명사 캐시 저장 실패: {e}")
+
+    def stats(self):
+        total = self.hits + self.disk_hits + self.misses
+        return {
+            'memory_hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.disk_hits) / total if total else 0.0,
+            'memory_items': len(self._lru),
+        }
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
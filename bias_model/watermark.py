@@ -0,0 +1,140 @@
+# ==========================================
+# 키워드별 수집 기준선 (watermark)
+# ==========================================
+# 지난번에 어디까지 가져왔는지를 키워드마다 기억해두고
+# - 이미 본 기사(최근 링크 해시 / 마지막 pubDate 이전)는 건너뛰고
+# - 한 페이지가 전부 본 기사면 다음 페이지는 요청하지 않고
+# - 키워드별로 새 기사가 나오는 속도에 맞춰 요청 개수(display)를 조절합니다.
+# 저장은 cache/watermarks.json (로컬 파일)
+import json
+import math
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from db_writer import link_hash
+
+WATERMARK_PATH = 'cache/watermarks.json'
+MAX_RECENT = 1000        # 키워드당 기억할 최근 링크 해시 수
+VELOCITY_ALPHA = 0.3     # 속도(시간당 새 기사 수) 지수이동평균 가중치
+
+def item_link(item):
+    return item.get('originallink') or item.get('link') or ''
+
+def pub_timestamp(item):
+    """네이버 pubDate (RFC 822) -> 유닉스 시간 (없거나 형식이 이상하면 None)"""
+    try:
+        return parsedate_to_datetime(item['pubDate']).timestamp()
+    except Exception:
+        return None
+
+class WatermarkStore:
+    def __init__(self, path=WATERMARK_PATH, max_recent=MAX_RECENT):
+        self.path = path
+        self.max_recent = max_recent
+        self._lock = threading.Lock()
+        self.marks = {}
+        if os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    self.marks = json.load(f)
+            except (OSError, ValueError):
+                print(f"⚠️ 기준선 파일을 읽지 못해 새로 시작합니다: {path}")
+        # 해시 목록은 검사용 set도 같이 들고 있음
+        self._recent = {kw: set(m.get('recent', [])) for kw, m in self.marks.items()}
+
+    @staticmethod
+    def _key(item):
+        return link_hash(item_link(item))[:16]
+
+    def _mark(self, keyword):
+        return self.marks.setdefault(keyword, {'latest_pub': None, 'recent': [], 'velocity': None, 'last_run': None})
+
+    # ------------------------------------------
+    # 조회
+    # ------------------------------------------
+    def is_seen(self, keyword, item, by_date=True):
+        """이미 가져온 기사인지 (by_date면 마지막 pubDate 이전 기사도 본 것으로 침)"""
+        with self._lock:
+            if self._key(item) in self._recent.get(keyword, ()):
+                return True
+            latest = self.marks.get(keyword, {}).get('latest_pub')
+        if by_date and latest is not None:
+            ts = pub_timestamp(item)
+            return ts is not None and ts < latest
+        return False
+
+    def known(self, keyword):
+        return keyword in self.marks
+
+    def unseen(self, keyword, items, by_date=True):
+        return [item for item in items if not self.is_seen(keyword, item, by_date)]
+
+    def suggest_display(self, keyword, minimum=10, maximum=100, default=20, margin=1.5):
+        """
+        다음 요청 개수: 시간당 새 기사 수 x 지난 실행 후 경과 시간 x 여유
+        (처음 보는 키워드는 default)
+        """
+        m = self.marks.get(keyword)
+        if not m or m.get('velocity') is None or not m.get('last_run'):
+            return default
+        hours = max(0.0, (time.time() - m['last_run']) / 3600)
+        expected = m['velocity'] * hours * margin
+        return int(min(maximum, max(minimum, math.ceil(expected))))
+
+    # ------------------------------------------
+    # 갱신 / 저장
+    # ------------------------------------------
+    def update(self, keyword, items, new_count=None, fetched=None):
+        """
+        저장까지 끝난 기사로 기준선 갱신 (new_count: 이번 실행에서 새로 나온 기사 수, 속도 계산용)
+        - fetched: 이번에 가져온 전체 기사. items에 없는 기사(저장 실패)는 "본 기사"로 치지 않고,
+          latest_pub도 그 기사의 pubDate를 넘지 않게 멈춰서 다음 실행 때 다시 가져옴
+        """
+        now = time.time()
+        with self._lock:
+            m = self._mark(keyword)
+            recent = self._recent.setdefault(keyword, set())
+            stored = {self._key(item) for item in items}
+            failed_ts = [pub_timestamp(item) for item in (fetched or ()) if self._key(item) not in stored]
+            cap = min((ts for ts in failed_ts if ts is not None), default=None)
+            for item in items:
+                key = self._key(item)
+                if key not in recent:
+                    recent.add(key)
+                    m['recent'].append(key)
+                ts = pub_timestamp(item)
+                if ts is not None and cap is not None:
+                    ts = min(ts, cap)
+                if ts is not None and (m['latest_pub'] is None or ts > m['latest_pub']):
+                    m['latest_pub'] = ts
+            # 오래된 해시부터 버림
+            overflow = len(m['recent']) - self.max_recent
+            if overflow > 0:
+                for key in m['recent'][:overflow]:
+                    recent.discard(key)
+                m['recent'] = m['recent'][overflow:]
+
+            if new_count is not None:
+                if m['last_run']:
+                    hours = max((now - m['last_run']) / 3600, 1 / 60)
+                    rate = new_count / hours
+                    m['velocity'] = rate if m['velocity'] is None else \
+                        VELOCITY_ALPHA * rate + (1 - VELOCITY_ALPHA) * m['velocity']
+                m['last_run'] = now
+
+    def reload(self):
+        """메모리의 기준선을 버리고 파일에 저장된 상태로 되돌림 (실행이 중간에 실패했을 때)"""
+        fresh = WatermarkStore(self.path, self.max_recent)
+        with self._lock:
+            self.marks, self._recent = fresh.marks, fresh._recent
+
+    def save(self):
+        """임시 파일에 쓰고 바꿔치기 (쓰다가 죽어도 기존 파일은 유지)"""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp = self.path + '.tmp'
+        with self._lock:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self.marks, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
@@ -1,7 +1,8 @@
 import os
+import sys
 import time
+import hashlib
 import random
-import schedule
 import pymysql
 from dotenv import load_dotenv
 from selenium import webdriver
@@ -9,6 +10,14 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from predict import get_bias
 
+# 유사 중복 색인 / 스케줄러 / 임대 큐 / 데이터 버전 / 링크 해시는 bias_model 쪽 모듈을 같이 씀
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'bias_model'))
+from data_version import bump_data_version, ensure_data_version_table
+from db_writer import ensure_link_hash, link_hash
+from near_dup import NearDupIndex
+from job_leases import LeaseQueue, run_leased
+from keyword_scheduler import KeywordScheduler
+
 load_dotenv()
 
 DB_CONFIG = {
@@ -21,15 +30,72 @@ DB_CONFIG = {
     "cursorclass": pymysql.cursors.DictCursor
 }
 
-def job():
-    keywords = ["검찰개혁","공수처","노란봉투법","탈원전", "대북정책" ] 
-    print(f"\n⏰ [Auto System] 정기 작업 시작: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+# 통신사 기사처럼 거의 같은 기사는 AI 분석 결과를 재사용 (제목 + 본문 앞부분으로 비교)
+NEAR_DUP_CHARS = 400
+NEAR_DUP_WARM = 3000   # 처음 실행 때 DB에서 불러올 최근 기사 수
+near_dups = NearDupIndex()
+near_dup_last_id = 0   # 색인에 넣은 마지막 기사 id (다른 작업자가 저장한 기사도 실행마다 이어서 넣음)
+
+def link_key(link):
+    return hashlib.sha1(link.encode('utf-8')).hexdigest()[:16]
+
+def prepare_near_dups(cursor):
+    """dup_cluster 컬럼 준비 + 최근 기사로 유사 중복 색인 채우기 (처음엔 최근 기사, 그 뒤로는 새로 들어온 기사만)"""
+    global near_dup_last_id
+    cursor.execute(
+        "SELECT COLUMN_NAME FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'NEWS_ARTICLES' AND COLUMN_NAME = 'dup_cluster'")
+    if not cursor.fetchone():
+        cursor.execute("ALTER TABLE NEWS_ARTICLES ADD COLUMN dup_cluster CHAR(16) NULL")
+
+    cursor.execute("""
+        SELECT id, link, title, content, bias, bias_score FROM NEWS_ARTICLES
+        WHERE bias IS NOT NULL AND content IS NOT NULL AND id > %s ORDER BY id DESC LIMIT %s
+    """, (near_dup_last_id, NEAR_DUP_WARM))
+    rows = cursor.fetchall()
+    if rows:
+        near_dup_last_id = max(near_dup_last_id, rows[0]['id'])
+    for row in reversed(rows):
+        near_dups.assign(link_key(row['link']), f"{row['title']} {row['content'][:NEAR_DUP_CHARS]}",
+                         (row['bias'], row['bias_score']))
+
+KEYWORDS = ["검찰개혁","공수처","노란봉투법","탈원전", "대북정책" ]
+CRAWL_LIMIT = 20   # 키워드당 최대 수집 기사 수
+
+# 키워드별 수집 주기 (새 기사가 많은 키워드는 자주, 조용한 키워드는 드물게)
+# 기사 페이지 방문 수 기준으로 시간당 예산 안에서만 돎
+MIN_INTERVAL = 3600
+MAX_INTERVAL = 24 * 3600
+DEFAULT_INTERVAL = 4 * 3600   # 아직 속도를 모르는 키워드 (예전 고정 주기)
+PAGE_BUDGET_PER_HOUR = 100
+SCHEDULE_STATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'auto_schedule.json')
+
+# 여러 대 동시 실행: AUTO_SHARDED=1이면 DB의 KEYWORD_LEASES 테이블에서 키워드를 빌려서 크롤링
+# (크롤링이 느리므로 한 번에 1개씩, 임대는 넉넉하게)
+# - AUTO_SHARD_ID: 작업자마다 다른 이름 (스케줄 파일을 작업자별로 따로 씀)
+# - AUTO_SHARDS: 동시에 도는 작업자 수 (시간당 페이지 예산을 나눠서 씀)
+AUTO_SHARDED = os.getenv("AUTO_SHARDED") == '1'
+AUTO_LEASE_SECONDS = int(os.getenv("AUTO_LEASE_SECONDS", 900))
+AUTO_SHARD_ID = os.getenv("AUTO_SHARD_ID", "0")
+AUTO_SHARDS = max(1, int(os.getenv("AUTO_SHARDS", 1))) if AUTO_SHARDED else 1
+
+if AUTO_SHARDED:
+    SCHEDULE_STATE = SCHEDULE_STATE.replace('.json', f'.{AUTO_SHARD_ID}.json')
+
+def job(keywords=None):
+    """Return: {키워드: 신규 저장 수} (실패한 키워드는 빠짐)"""
+    keywords = keywords or KEYWORDS
+    print(f"\n⏰ [Auto System] 정기 작업 시작: {time.strftime('%Y-%m-%d %H:%M:%S')} ({', '.join(keywords)})")
     
+    counts = {}
     for keyword in keywords:
         # 키워드당 최대 20개까지 수집하도록 설정
-        crawl_and_analyze(keyword, limit=20)
+        new_count = crawl_and_analyze(keyword, limit=CRAWL_LIMIT)
+        if new_count is not None:
+            counts[keyword] = new_count
         
-    print(f"💤 작업 완료. 다음 스케줄 대기 중... (4시간 뒤 실행)\n")
+    print(f"💤 작업 완료. 다음 스케줄 대기 중...\n")
+    return counts
 
 def crawl_and_analyze(keyword, limit=20):
     print(f"🚀 '{keyword}' 뉴스 수집 시작 (목표: {limit}개)...")
@@ -42,6 +108,7 @@ def crawl_and_analyze(keyword, limit=20):
     
     driver = webdriver.Chrome(options=chrome_options)
     conn = None
+    new_article_count = 0
 
     try:
         url = f"https://search.naver.com/search.naver?where=news&query={keyword}&sort=1" 
@@ -71,14 +138,17 @@ def crawl_and_analyze(keyword, limit=20):
 
         conn = pymysql.connect(**DB_CONFIG)
         cursor = conn.cursor()
+        ensure_link_hash(cursor)   # 봇과 같은 link_hash UNIQUE 인덱스로 중복 기사 판단
+        prepare_near_dups(cursor)
+        ensure_data_version_table(cursor)
 
-        new_article_count = 0
+        reused_count = 0
 
         for link in target_links:
             try:
-                # 중복 체크
-                check_sql = "SELECT id FROM NEWS_ARTICLES WHERE link = %s"
-                cursor.execute(check_sql, (link,))
+                # 중복 체크 (정규화한 링크 해시 - 인덱스를 탐)
+                check_sql = "SELECT id FROM NEWS_ARTICLES WHERE link_hash = %s"
+                cursor.execute(check_sql, (link_hash(link),))
                 if cursor.fetchone():
                     # 이미 있는 기사는 조용히 넘어감 (로그 너무 많이 찍히는 것 방지)
                     continue
@@ -99,43 +169,65 @@ def crawl_and_analyze(keyword, limit=20):
                 
                 if len(content) < 50: continue
 
-                # AI 분석
-                bias_label, bias_score = get_bias(title, content)
-                
-                print(f"   🆕 [신규] {bias_label}: {title[:10]}...")
+                # 유사 중복이면 대표 기사의 AI 분석 결과 재사용
+                key = link_key(link)
+                cluster, payload, _ = near_dups.assign(key, f"{title} {content[:NEAR_DUP_CHARS]}")
+                if payload is not None:
+                    bias_label, bias_score = payload
+                    reused_count += 1
+                    print(f"   ♻️ [유사 중복] {bias_label}: {title[:10]}...")
+                else:
+                    # AI 분석
+                    bias_label, bias_score = get_bias(title, content)
+                    near_dups.set_payload(cluster, (bias_label, bias_score))
+                    print(f"   🆕 [신규] {bias_label}: {title[:10]}...")
 
                 insert_sql = """
                     INSERT INTO NEWS_ARTICLES 
-                    (keyword, title, content, link, bias, bias_score)
-                    VALUES (%s, %s, %s, %s, %s, %s)
+                    (keyword, title, content, link, link_hash, bias, bias_score, dup_cluster)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
                 """
-                cursor.execute(insert_sql, (keyword, title, content, link, bias_label, bias_score))
+                cursor.execute(insert_sql, (keyword, title, content, link, link_hash(link), bias_label, bias_score, cluster))
                 conn.commit()
                 new_article_count += 1
 
             except Exception as e:
                 continue
 
-        print(f"✨ '{keyword}' 처리 완료: 신규 저장 {new_article_count}건")
+        print(f"✨ '{keyword}' 처리 완료: 신규 저장 {new_article_count}건 (그 중 유사 중복 재사용 {reused_count}건)")
+        return new_article_count
 
     except Exception as e:
         print(f"🚨 에러: {e}")
+        return None
     finally:
         driver.quit()
-        if conn: conn.close()
+        if conn:
+            # API 서버의 /news 캐시 무효화는 키워드 한 번 돌 때 1번만 (중간에 실패해도 저장된 기사가 있으면)
+            if new_article_count:
+                try:
+                    bump_data_version(conn.cursor())
+                    conn.commit()
+                except Exception as e:
+                    print(f"⚠️ 데이터 버전 갱신 실패: {e}")
+            conn.close()
 
 if __name__ == "__main__":
-    print("🚀 시스템 가동 (4시간 주기 / 최신순 정렬 / 20개 수집)")
-    
-    job() # 시작하자마자 1회 실행
-
-    # ⏰ [변경] 4시간마다 실행
-    schedule.every(4).hours.do(job)
-
-    # (옵션) 만약 특정 시간에만 하고 싶다면 아래처럼 쓰세요
-    # schedule.every().day.at("09:00").do(job)
-    # schedule.every().day.at("18:00").do(job)
-
-    while True:
-        schedule.run_pending()
-        time.sleep(1)
\ No newline at end of file
+    print("🚀 시스템 가동 (키워드별 적응형 주기 / 최신순 정렬 / 20개 수집)")
+
+    # ⏰ 고정 4시간 대신 키워드별 새 기사 속도에 맞춰 실행 (처음 보는 키워드는 바로 1회 실행)
+    scheduler = KeywordScheduler(
+        KEYWORDS, SCHEDULE_STATE, min_interval=MIN_INTERVAL, max_interval=MAX_INTERVAL,
+        default_interval=DEFAULT_INTERVAL, target_new=CRAWL_LIMIT // 2,
+        budget_per_hour=PAGE_BUDGET_PER_HOUR / AUTO_SHARDS, cost_per_run=CRAWL_LIMIT)
+    print(scheduler.describe())
+
+    if AUTO_SHARDED:
+        queue = LeaseQueue(lambda: pymysql.connect(**DB_CONFIG), 'auto', lease_seconds=AUTO_LEASE_SECONDS)
+        queue.ensure_table()
+        queue.sync_keywords(KEYWORDS)
+        print(f"🔀 분산 모드: 작업자 {queue.worker_id} (작업자 {AUTO_SHARD_ID}, {AUTO_SHARDS}개가 예산을 나눠 씀 / "
+              f"임대 {AUTO_LEASE_SECONDS}초)")
+        run_leased(queue, scheduler, job, claim_limit=1)
+    else:
+        scheduler.run_forever(job)
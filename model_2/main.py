@@ -1,9 +1,19 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware  # 🔥 CORS 필수
+from fastapi.responses import JSONResponse, Response
 import pymysql
 import os
+import sys
 from dotenv import load_dotenv
 
+# 응답 캐시 / 데이터 버전은 bias_model 쪽 모듈을 같이 씀
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'bias_model'))
+from api_cache import ApiCache, encoded_body, etag_matches, normalize_query
+from compression import negotiate
+from data_version import VersionWatcher, read_data_version
+from news_query import InvalidIds, get_news_by_ids, parse_ids
+
 # .env 로딩
 load_dotenv()
 
@@ -34,15 +44,59 @@ DB_CONFIG = {
     "cursorclass": pymysql.cursors.DictCursor
 }
 
+# 응답 캐시: 데이터 버전이 바뀌면(또는 TTL이 지나면) 다시 조회
+# (auto_system.py는 키워드 하나를 다 크롤링한 뒤에 버전을 1번 올림 → 크롤링 도중 저장된 기사는
+#  그 키워드가 끝날 때까지(또는 API_CACHE_TTL초까지) 캐시된 목록에 안 보일 수 있음)
+news_cache = ApiCache(max_entries=int(os.getenv("API_CACHE_SIZE", 512)), ttl=int(os.getenv("API_CACHE_TTL", 300)))
+
+def read_news_version():
+    conn = pymysql.connect(**DB_CONFIG)
+    try:
+        return read_data_version(conn.cursor())
+    finally:
+        conn.close()
+
+# 데이터 버전은 1초에 한 번만 확인 (요청마다 DB에 가지 않음)
+news_version = VersionWatcher(read_news_version, check_interval=float(os.getenv("API_VERSION_CHECK", 1.0)))
+
+def cached_response(request, load):
+    """
+    load()의 결과(dict)를 캐시하고 ETag를 붙여서 응답
+    (If-None-Match가 같으면 본문 없이 304, status가 success/empty가 아니면 캐시하지 않음)
+    (Accept-Encoding에 맞춰 br / gzip으로 압축, 압축본도 같이 캐시)
+    """
+    key = (request.url.path, normalize_query(request.query_params.multi_items()))
+    version = news_version.current()
+    cached = news_cache.get(key, version)
+    hit = cached is not None
+    if not hit:
+        result = load()
+        body = JSONResponse(jsonable_encoder(result)).body
+        if result.get("status") not in ("success", "empty"):
+            return Response(body, media_type="application/json")
+        cached = news_cache.put(key, version, body)
+
+    encoding = negotiate(request.headers.get("accept-encoding"), len(cached.body))
+    body, etag = encoded_body(cached, encoding)
+    headers = {"ETag": etag, "Vary": "Accept-Encoding", "Cache-Control": "no-cache", "X-Cache": "HIT" if hit else "MISS"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(body, media_type="application/json", headers=headers)
+
 @app.get("/")
 def read_root():
     return {"message": "Algoriverse API Server is Running!"}
 
 @app.get("/news")
-def get_news(keyword: str):
+def get_news(keyword: str, request: Request):
     """
-    키워드를 받아서 '가장 보수적인 기사'와 '가장 진보적인 기사' 하나씩 반환
+    키워드를 받아서 '가장 보수적인 기사'와 '가장 진보적인 기사' 하나씩 반환 (응답 캐시 + ETag)
     """
+    return cached_response(request, lambda: load_news(keyword))
+
+def load_news(keyword):
     conn = pymysql.connect(**DB_CONFIG)
     cursor = conn.cursor()
 
@@ -92,4 +146,34 @@ def get_news(keyword: str):
         return {"status": "error", "message": str(e)}
         
     finally:
-        conn.close()
\ No newline at end of file
+        conn.close()
+# 여러 기사 한 번에 조회 시 돌려줄 컬럼
+BATCH_FIELDS = ['id', 'keyword', 'title', 'link', 'content', 'bias', 'bias_score']
+
+@app.get("/news/batch")
+def get_news_batch(ids: str, request: Request):
+    """
+    /news/batch?ids=12,5,40 → 요청한 순서대로 기사 목록 (없는 기사는 found: false)
+    (한 번에 최대 50개, DB는 WHERE id IN 쿼리 1번)
+    """
+    try:
+        id_list = parse_ids(ids)
+    except InvalidIds as e:
+        return JSONResponse({"status": "error", "message": str(e)}, status_code=400)
+    return cached_response(request, lambda: load_news_batch(id_list))
+
+def load_news_batch(id_list):
+    conn = pymysql.connect(**DB_CONFIG)
+    try:
+        items = get_news_by_ids(conn.cursor(), id_list, BATCH_FIELDS)
+        missing = [item["id"] for item in items if not item["found"]]
+        return {"status": "success", "count": len(items) - len(missing), "data": items, "missing": missing}
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+    finally:
+        conn.close()
+
+@app.get("/health/cache")
+def get_cache_stats():
+    """응답 캐시 상태 (적중률 / 저장된 응답 수·크기 / 현재 데이터 버전)"""
+    return {"status": "success", "data": dict(news_cache.stats(), data_version=news_version.current())}